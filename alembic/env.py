@@ -7,6 +7,7 @@ from sqlalchemy.ext.asyncio import async_engine_from_config
 
 from alembic import context
 from fitness_solutions_server.admins import models as admin_models  # noqa: F401
+from fitness_solutions_server.catalog import models as catalog_models  # noqa: F401
 from fitness_solutions_server.collections import (  # noqa: F401
     models as collection_models,
 )
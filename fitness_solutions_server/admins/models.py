@@ -31,6 +31,6 @@ class AdminAuthenticationToken(TimestampMixin, Base):
     admin_id: Mapped[UUID] = mapped_column(
         ForeignKey("admins.id", ondelete="CASCADE"), index=True
     )
-    expires_at: Mapped[datetime]
+    expires_at: Mapped[datetime] = mapped_column(index=True)
 
     admin: Mapped[Admin] = relationship(back_populates="authentication_tokens")
@@ -14,10 +14,19 @@ from fitness_solutions_server.admins.exceptions import (
 )
 from fitness_solutions_server.admins.service import AdminServiceDependency
 from fitness_solutions_server.core.config import settings
-from fitness_solutions_server.core.schemas import ResponseModel
+from fitness_solutions_server.core.database import (
+    async_engine,
+    get_pool_stats,
+    read_async_engine,
+)
+from fitness_solutions_server.core.schemas import (
+    DatabasePoolsStats,
+    DatabasePoolStats,
+    ResponseModel,
+)
 from fitness_solutions_server.core.security import (
     security_token_to_code,
-    verify_password,
+    verify_password_async,
 )
 
 router = APIRouter(prefix="/admins")
@@ -40,6 +49,22 @@ async def create_admin(
     return ResponseModel(data=schemas.Admin.from_orm(admin))
 
 
+@router.get(
+    "/stats/database-pool",
+    dependencies=[Depends(require_admin_authentication_token)],
+    summary="Database connection pool statistics",
+)
+async def database_pool_stats() -> ResponseModel[DatabasePoolsStats]:
+    return ResponseModel(
+        data=DatabasePoolsStats(
+            primary=DatabasePoolStats(**get_pool_stats(async_engine)),
+            replica=DatabasePoolStats(**get_pool_stats(read_async_engine))
+            if read_async_engine is not async_engine
+            else None,
+        )
+    )
+
+
 @router.get("/auth/activate/{token}", include_in_schema=False)
 async def serve_activate_page(token: str, request: Request):
     url = f"{settings.BASE_URL}/v1/admins/auth/activate"
@@ -76,8 +101,13 @@ async def login(
         raise AdminInvalidCredentialsException()
     if admin.activated_at is None:
         raise AdminNotActivatedException()
-    if not verify_password(login_request.password, admin.password_hash):
+    (is_valid, new_password_hash) = await verify_password_async(
+        login_request.password, admin.password_hash
+    )
+    if not is_valid:
         raise AdminInvalidCredentialsException()
+    if new_password_hash is not None:
+        admin.password_hash = new_password_hash
 
     # Create authentication token
     unhashed_token = await admins.create_auth_token(admin)
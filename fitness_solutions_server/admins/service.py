@@ -13,7 +13,7 @@ from fitness_solutions_server.core.database import DatabaseDependency
 from fitness_solutions_server.core.security import (
     create_security_token,
     generate_authentication_token,
-    hash_password,
+    hash_password_async,
 )
 
 
@@ -36,7 +36,7 @@ class AdminService:
         admin = models.Admin(
             full_name=full_name,
             email=email,
-            password_hash=hash_password(str(uuid4())),
+            password_hash=await hash_password_async(str(uuid4())),
             activation_token=hashed_activation_code,
         )
         self.db.add(admin)
@@ -45,7 +45,7 @@ class AdminService:
         return admin
 
     async def activate(self, password: str, admin: models.Admin):
-        admin.password_hash = hash_password(password)
+        admin.password_hash = await hash_password_async(password)
         admin.activated_at = datetime.utcnow()
         admin.activation_token = None
         await self.db.commit()
@@ -0,0 +1,44 @@
+from enum import Enum
+from uuid import UUID
+
+from sqlalchemy import ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from fitness_solutions_server.core.models import Base
+
+
+class CatalogItemType(str, Enum):
+    workout = "workout"
+    fitness_plan = "fitness_plan"
+
+
+class CatalogVisibility(Base):
+    """
+    One row per country a coach's workout or fitness plan is offered in.
+    Maintained by `catalog.utils`, so user facing lists do not have to go
+    through `fitness_coach_countries` for every candidate row. Lists keep
+    ordering and paginating on the items' own keyset indexes and only look up
+    the item IDs here.
+    """
+
+    __tablename__ = "catalog_visibility"
+    __table_args__ = (
+        Index(
+            "ix_catalog_visibility_country_id_item_type_is_released",
+            "country_id",
+            "item_type",
+            "is_released",
+            "item_id",
+        ),
+    )
+
+    country_id: Mapped[UUID] = mapped_column(
+        ForeignKey("countries.id", ondelete="CASCADE"), primary_key=True
+    )
+    item_type: Mapped[CatalogItemType] = mapped_column(primary_key=True)
+    item_id: Mapped[UUID] = mapped_column(primary_key=True)
+    fitness_coach_id: Mapped[UUID] = mapped_column(
+        ForeignKey("fitness_coaches.id", ondelete="CASCADE"), index=True
+    )
+    # Released by an admin and offered by a released coach
+    is_released: Mapped[bool]
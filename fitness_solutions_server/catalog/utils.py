@@ -0,0 +1,132 @@
+from uuid import UUID
+
+from sqlalchemy import ColumnElement, Select, and_, cast, delete, literal, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from fitness_solutions_server.core.page_cache import PageCache
+from fitness_solutions_server.fitness_coaches.models import (
+    FitnessCoach,
+    fitness_coach_countries,
+)
+from fitness_solutions_server.fitness_plans.models import FitnessPlan
+from fitness_solutions_server.workouts.models import Workout
+
+from .models import CatalogItemType, CatalogVisibility
+
+CATALOG_ITEM_MODELS: dict[CatalogItemType, type[Workout] | type[FitnessPlan]] = {
+    CatalogItemType.workout: Workout,
+    CatalogItemType.fitness_plan: FitnessPlan,
+}
+
+# Shared list pages per item type, cleared whenever visibility changes
+catalog_pages = {item_type: PageCache() for item_type in CatalogItemType}
+
+
+async def refresh_catalog_visibility(
+    db: AsyncSession, item_type: CatalogItemType, *criteria: ColumnElement[bool]
+):
+    """
+    Rewrites the visibility rows of the items matching `criteria`, e.g. after
+    they were created or (un)released. Call after flushing the items.
+    """
+    model = CATALOG_ITEM_MODELS[item_type]
+
+    await delete_catalog_visibility(db, item_type, *criteria)
+    statement = insert(CatalogVisibility).from_select(
+        [
+            CatalogVisibility.country_id,
+            CatalogVisibility.item_type,
+            CatalogVisibility.item_id,
+            CatalogVisibility.fitness_coach_id,
+            CatalogVisibility.is_released,
+        ],
+        select(
+            fitness_coach_countries.c.country_id,
+            cast(literal(item_type.value), CatalogVisibility.item_type.type).label(
+                "item_type"
+            ),
+            model.id,
+            model.fitness_coach_id,
+            and_(model.is_released, FitnessCoach.is_released).label("is_released"),
+        )
+        .join(FitnessCoach, FitnessCoach.id == model.fitness_coach_id)
+        .join(
+            fitness_coach_countries,
+            fitness_coach_countries.c.fitness_coach_id == FitnessCoach.id,
+        )
+        .where(*criteria),
+    )
+    # Concurrent refreshes of the same item insert the same rows
+    await db.execute(
+        statement.on_conflict_do_update(
+            index_elements=[
+                CatalogVisibility.country_id,
+                CatalogVisibility.item_type,
+                CatalogVisibility.item_id,
+            ],
+            set_={"is_released": statement.excluded.is_released},
+        )
+    )
+
+
+async def delete_catalog_visibility(
+    db: AsyncSession, item_type: CatalogItemType, *criteria: ColumnElement[bool]
+):
+    """
+    Deletes the visibility rows of the items matching `criteria` and drops the
+    cached list pages of that type once `db` commits. Call before deleting
+    the items.
+    """
+    model = CATALOG_ITEM_MODELS[item_type]
+    catalog_pages[item_type].clear_after_commit(db)
+    await db.execute(
+        delete(CatalogVisibility)
+        .where(CatalogVisibility.item_type == item_type)
+        .where(CatalogVisibility.item_id.in_(select(model.id).where(*criteria)))
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def refresh_fitness_coach_catalog_visibility(
+    db: AsyncSession, fitness_coach_id: UUID
+):
+    """
+    Rewrites the visibility rows of all of a coach's workouts and fitness plans,
+    e.g. after the coach was (un)released or their countries changed.
+    """
+    for item_type, model in CATALOG_ITEM_MODELS.items():
+        await refresh_catalog_visibility(
+            db, item_type, model.fitness_coach_id == fitness_coach_id
+        )
+
+
+async def delete_fitness_coach_catalog_visibility(
+    db: AsyncSession, fitness_coach_id: UUID
+):
+    """
+    Deletes the visibility rows of all of a coach's workouts and fitness plans,
+    call before the coach is deleted or their items are detached from them.
+    """
+    for item_type, model in CATALOG_ITEM_MODELS.items():
+        await delete_catalog_visibility(
+            db, item_type, model.fitness_coach_id == fitness_coach_id
+        )
+
+
+def visible_catalog_items(
+    item_type: CatalogItemType, country_id: UUID, is_released: bool | None = True
+) -> Select[tuple[UUID]]:
+    """
+    Selects the IDs of the items offered in a country, for use with `in_`.
+    Served by an index only scan of the (country_id, item_type, is_released,
+    item_id) index.
+    """
+    query = (
+        select(CatalogVisibility.item_id)
+        .where(CatalogVisibility.country_id == country_id)
+        .where(CatalogVisibility.item_type == item_type)
+    )
+    if is_released is not None:
+        query = query.where(CatalogVisibility.is_released == is_released)
+    return query
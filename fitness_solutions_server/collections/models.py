@@ -2,10 +2,10 @@ from __future__ import annotations
 
 from uuid import UUID, uuid4
 
-from sqlalchemy import ForeignKey, Index, func, select
+from sqlalchemy import ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.mutable import MutableDict
-from sqlalchemy.orm import Mapped, column_property, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, query_expression, relationship
 
 from fitness_solutions_server.core.localization import translation_hybrid
 from fitness_solutions_server.core.models import Base, TimestampMixin
@@ -17,6 +17,14 @@ from fitness_solutions_server.workouts.models import Workout
 
 class CollectionItem(TimestampMixin, Base):
     __tablename__ = "collection_items"
+    __table_args__ = (
+        Index(
+            "ix_collection_items_collection_id_created_at_id",
+            "collection_id",
+            "created_at",
+            "id",
+        ),
+    )
     __mapper_args__ = {
         "polymorphic_identity": "collection_item",
         "polymorphic_on": "type",
@@ -32,6 +40,14 @@ class CollectionItem(TimestampMixin, Base):
 
 class Collection(TimestampMixin, Base):
     __tablename__ = "collections"
+    __table_args__ = (
+        Index(
+            "ix_collections_created_at_id",
+            "created_at",
+            "id",
+            postgresql_where=text("is_released"),
+        ),
+    )
 
     id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
     title_translations: Mapped[dict[str, str]] = mapped_column(
@@ -50,34 +66,11 @@ class Collection(TimestampMixin, Base):
         passive_deletes=True,
         lazy="noload",
     )
-    number_of_workouts: Mapped[int] = column_property(
-        select(func.count(CollectionItem.id))
-        .where(CollectionItem.collection_id == id)
-        .where(CollectionItem.type == "collection_item_workout")
-        .correlate_except(CollectionItem)
-        .scalar_subquery()
-    )
-    number_of_fitness_plans: Mapped[int] = column_property(
-        select(func.count(CollectionItem.id))
-        .where(CollectionItem.collection_id == id)
-        .where(CollectionItem.type == "collection_item_fitness_plan")
-        .correlate_except(CollectionItem)
-        .scalar_subquery()
-    )
-    number_of_fitness_coaches: Mapped[int] = column_property(
-        select(func.count(CollectionItem.id))
-        .where(CollectionItem.collection_id == id)
-        .where(CollectionItem.type == "collection_item_fitness_coach")
-        .correlate_except(CollectionItem)
-        .scalar_subquery()
-    )
-    number_of_products: Mapped[int] = column_property(
-        select(func.count(CollectionItem.id))
-        .where(CollectionItem.collection_id == id)
-        .where(CollectionItem.type == "collection_item_product")
-        .correlate_except(CollectionItem)
-        .scalar_subquery()
-    )
+    # Filled in batches by `utils.load_collection_counts`
+    number_of_workouts: Mapped[int | None] = query_expression()
+    number_of_fitness_plans: Mapped[int | None] = query_expression()
+    number_of_fitness_coaches: Mapped[int | None] = query_expression()
+    number_of_products: Mapped[int | None] = query_expression()
 
 
 class CollectionItemWorkout(CollectionItem):
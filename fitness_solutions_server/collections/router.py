@@ -1,5 +1,4 @@
-import functools
-from typing import Annotated
+from typing import Annotated, Sequence
 from uuid import UUID, uuid4
 
 from fastapi import APIRouter, Depends, Query
@@ -7,19 +6,24 @@ from fastapi_pagination import pagination_ctx
 from fastapi_pagination.ext.sqlalchemy import paginate
 from sqlalchemy import select, true
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import selectin_polymorphic, selectinload
+from sqlalchemy.orm import selectin_polymorphic
 from sqlalchemy.orm.interfaces import ORMOption
 
 from fitness_solutions_server.admins.dependencies import (
     IsAdminDependency,
     require_admin_authentication_token,
 )
+from fitness_solutions_server.catalog.models import CatalogItemType
+from fitness_solutions_server.catalog.utils import catalog_pages
 from fitness_solutions_server.collections.mapper import CollectionMapperDependency
 from fitness_solutions_server.collections.utils import (
     collection_items_model_to_schema,
+    load_collection_counts,
     make_collection_cover_image_path,
 )
 from fitness_solutions_server.core.database import DatabaseDependency
+from fitness_solutions_server.core.dependencies import ReadDatabaseDependency
+from fitness_solutions_server.core.embeds import EmbedPlanner
 from fitness_solutions_server.core.schemas import ResponseModel
 from fitness_solutions_server.core.utils import CursorPage, get_or_fail
 from fitness_solutions_server.fitness_coaches.dependencies import (
@@ -27,6 +31,7 @@ from fitness_solutions_server.fitness_coaches.dependencies import (
 )
 from fitness_solutions_server.fitness_coaches.mapper import FitnessCoachMapperDependency
 from fitness_solutions_server.fitness_coaches.models import FitnessCoach
+from fitness_solutions_server.fitness_coaches.utils import load_fitness_coach_counts
 from fitness_solutions_server.fitness_plans.models import FitnessPlan
 from fitness_solutions_server.images.models import Image
 from fitness_solutions_server.products.models import Product
@@ -79,9 +84,10 @@ async def create_collection(
 
 @router.get("/{collection_id}", summary="Get collection by ID")
 async def get_collection_by_id(
-    collection_id: UUID, db: DatabaseDependency, mapper: CollectionMapperDependency
+    collection_id: UUID, db: ReadDatabaseDependency, mapper: CollectionMapperDependency
 ) -> ResponseModel[schemas.CollectionAdmin | schemas.Collection]:
     collection = await get_or_fail(models.Collection, collection_id, db)
+    await load_collection_counts(db, [collection])
     return ResponseModel(data=mapper.collection_to_schema(collection))
 
 
@@ -115,34 +121,32 @@ async def update_collection(
     if body.is_released is not None:
         collection.is_released = body.is_released
 
-    # Commit removes column properties
-    schema = mapper.collection_to_schema(collection)
-
     await db.commit()
+    await load_collection_counts(db, [collection])
 
-    return ResponseModel(data=schema)
+    return ResponseModel(data=mapper.collection_to_schema(collection))
 
 
 @router.get(
     "", summary="List collections", dependencies=[Depends(pagination_ctx(CursorPage))]
 )
 async def list_collections(
-    db: DatabaseDependency,
+    db: ReadDatabaseDependency,
     is_admin: IsAdminDependency,
     mapper: CollectionMapperDependency,
 ) -> ResponseModel[CursorPage[schemas.CollectionAdmin | schemas.Collection]]:
     query = select(models.Collection).order_by(
-        models.Collection.created_at.desc(), models.Collection.id
+        models.Collection.created_at.desc(), models.Collection.id.desc()
     )
 
     if not is_admin:
         query = query.where(models.Collection.is_released == true())
 
-    collections = await paginate(
-        db,
-        query,
-        transformer=functools.partial(mapper.collections_to_schema),
-    )
+    async def transformer(items: Sequence[models.Collection]):
+        await load_collection_counts(db, items)
+        return mapper.collections_to_schema(items)
+
+    collections = await paginate(db, query, transformer=transformer)
 
     return ResponseModel(data=collections)
 
@@ -162,9 +166,11 @@ async def add_item(
         case schemas.ItemType.workout:
             await get_or_fail(Workout, body.item_id, db)
             item = models.CollectionItemWorkout(workout_id=body.item_id)
+            catalog_pages[CatalogItemType.workout].clear_after_commit(db)
         case schemas.ItemType.fitness_plan:
             await get_or_fail(FitnessPlan, body.item_id, db)
             item = models.CollectionItemFitnessPlan(fitness_plan_id=body.item_id)
+            catalog_pages[CatalogItemType.fitness_plan].clear_after_commit(db)
         case schemas.ItemType.fitness_coach:
             await get_or_fail(FitnessCoach, body.item_id, db)
             item = models.CollectionItemFitnessCoach(fitness_coach_id=body.item_id)
@@ -190,7 +196,7 @@ async def add_item(
 )
 async def list_items(
     collection_id: UUID,
-    db: DatabaseDependency,
+    db: ReadDatabaseDependency,
     is_admin: IsAdminDependency,
     fitness_coach: GetFitnessCoachDependency,
     storage_service: StorageServiceDependency,
@@ -213,32 +219,44 @@ async def list_items(
     query = (
         select(models.CollectionItem)
         .where(models.CollectionItem.collection_id == collection.id)
-        .order_by(models.CollectionItem.created_at.desc(), models.CollectionItem.id)
+        .order_by(
+            models.CollectionItem.created_at.desc(), models.CollectionItem.id.desc()
+        )
     )
 
     if embed is not None:
         if schemas.CollectionItemEmbed.item in embed:
-            options.append(
-                selectinload(models.CollectionItemFitnessCoach.fitness_coach)
+            options.extend(
+                EmbedPlanner()
+                .add(models.CollectionItemFitnessCoach.fitness_coach)
+                .add(models.CollectionItemFitnessPlan.fitness_plan)
+                .add(models.CollectionItemWorkout.workout)
+                .add(models.CollectionItemProduct.product)
+                .options()
             )
-            options.append(selectinload(models.CollectionItemFitnessPlan.fitness_plan))
-            options.append(selectinload(models.CollectionItemWorkout.workout))
-            options.append(selectinload(models.CollectionItemProduct.product))
 
     query = query.options(*options)
-    items = await paginate(
-        db,
-        query,
-        transformer=functools.partial(
-            collection_items_model_to_schema,
+
+    async def transformer(items: Sequence[models.CollectionItem]):
+        await load_fitness_coach_counts(
+            db,
+            [
+                item.fitness_coach
+                for item in items
+                if isinstance(item, models.CollectionItemFitnessCoach)
+            ],
+        )
+        return collection_items_model_to_schema(
+            items,
             is_admin=is_admin,
             auth_fitness_coach_id=fitness_coach.id
             if fitness_coach is not None
             else None,
             storage_service=storage_service,
             fitness_coach_mapper=fitness_coach_mapper,
-        ),
-    )
+        )
+
+    items = await paginate(db, query, transformer=transformer)
 
     return ResponseModel(data=items)
 
@@ -253,5 +271,8 @@ async def delete(
 ) -> ResponseModel[None]:
     item = await get_or_fail(models.CollectionItem, item_id, db)
     await db.delete(item)
+    # The workout and fitness plan lists can be filtered by collection
+    for pages in catalog_pages.values():
+        pages.clear_after_commit(db)
     await db.commit()
     return ResponseModel(data=None)
@@ -1,6 +1,10 @@
-from typing import Sequence, cast
+from typing import Iterable, Sequence, cast
 from uuid import UUID
 
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
+
 from fitness_solutions_server.collections import models, schemas
 from fitness_solutions_server.fitness_coaches.mapper import FitnessCoachMapper
 from fitness_solutions_server.fitness_plans.schemas import FitnessPlanPublic
@@ -20,6 +24,41 @@ class InvalidCollectionItemSubType(Exception):
     pass
 
 
+COLLECTION_COUNT_ATTRIBUTES = {
+    "collection_item_workout": "number_of_workouts",
+    "collection_item_fitness_plan": "number_of_fitness_plans",
+    "collection_item_fitness_coach": "number_of_fitness_coaches",
+    "collection_item_product": "number_of_products",
+}
+
+
+async def load_collection_counts(
+    db: AsyncSession, collections: Iterable[models.Collection]
+):
+    """
+    Fills the `number_of_*` attributes for all given collections with a single
+    query.
+    """
+    collections_by_id = {collection.id: collection for collection in collections}
+    if len(collections_by_id) == 0:
+        return
+
+    query = (
+        select(
+            models.CollectionItem.collection_id,
+            models.CollectionItem.type,
+            func.count(),
+        )
+        .where(models.CollectionItem.collection_id.in_(collections_by_id.keys()))
+        .group_by(models.CollectionItem.collection_id, models.CollectionItem.type)
+    )
+    counts = {(id, type): count for id, type, count in await db.execute(query)}
+
+    for id, collection in collections_by_id.items():
+        for type, attribute in COLLECTION_COUNT_ATTRIBUTES.items():
+            set_committed_value(collection, attribute, counts.get((id, type), 0))
+
+
 def collection_item_model_to_schema(
     item: models.CollectionItem,
     is_admin: bool,
@@ -4,7 +4,23 @@ from pydantic import AnyHttpUrl, BaseSettings, PostgresDsn
 
 
 class Settings(BaseSettings):
+    DEBUG: bool = False
+
     DATABASE_URL: PostgresDsn
+    DATABASE_POOL_SIZE: int = 5
+    DATABASE_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_TIMEOUT: float = 30
+    DATABASE_POOL_PRE_PING: bool = False
+    DATABASE_POOL_RECYCLE: int = -1
+    DATABASE_POOL_WARM_UP_CONNECTIONS: int = 2
+    DATABASE_PREPARE_THRESHOLD: int | None = 5
+    DATABASE_READ_URL: PostgresDsn | None = None
+    DATABASE_READ_YOUR_WRITES_WINDOW: timedelta = timedelta(seconds=5)
+    DATABASE_READ_YOUR_WRITES_CACHE_SIZE: int = 100_000
+
+    SQL_QUERY_COUNT_BUDGET: int = 20
+    SQL_QUERY_TIME_BUDGET: timedelta = timedelta(milliseconds=250)
+    SQL_REPEATED_STATEMENT_THRESHOLD: int = 5
     BASE_URL: AnyHttpUrl
 
     SMTP_USERNAME: str
@@ -17,9 +33,28 @@ class Settings(BaseSettings):
     ADMIN_AUTH_EXPIRE_DELTA: timedelta = timedelta(days=7)
     FITNESS_COACH_AUTH_EXPIRE_DELTA: timedelta = timedelta(days=7)
     ADMIN_EMAIL: str
+    PASSWORD_HASH_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_PENDING: int = 32
+    AUTH_TOKEN_CACHE_SIZE: int = 10_000
+    AUTH_TOKEN_CACHE_TTL: timedelta = timedelta(minutes=1)
+    AUTH_TOKEN_REAPER_INTERVAL: timedelta = timedelta(minutes=15)
+    AUTH_TOKEN_REAPER_BATCH_SIZE: int = 1000
+
+    REFERENCE_DATA_CACHE_SIZE: int = 1000
+    REFERENCE_DATA_CACHE_TTL: timedelta = timedelta(minutes=10)
+    REFERENCE_DATA_MAX_AGE: timedelta = timedelta(minutes=5)
+
+    CATALOG_PAGE_CACHE_SIZE: int = 10_000
+    CATALOG_PAGE_CACHE_TTL: timedelta = timedelta(seconds=30)
+
+    SAVED_ITEMS_CACHE_SIZE: int = 10_000
+    SAVED_ITEMS_CACHE_TTL: timedelta = timedelta(minutes=1)
 
     GOOGLE_CLOUD_STORAGE_BUCKET: str
     GOOGLE_CLOUD_PROJECT: str
+    STORAGE_MAX_WORKERS: int = 8
+    STORAGE_HTTP_POOL_SIZE: int = 16
 
     class Config:
         env_file = ".env"
@@ -1,20 +1,153 @@
+import asyncio
+import logging
+import time
 from typing import Annotated, AsyncIterator
+from uuid import UUID
 
-from fastapi import Depends
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from fastapi import Depends, Response
+from sqlalchemy import event, exc
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from starlette_context import context
 
+from .cache import TTLCache
 from .config import settings
 
-async_engine = create_async_engine(url=settings.DATABASE_URL, future=True)
+logger = logging.getLogger(__name__)
+
+
+class PoolWaitStats:
+    def __init__(self):
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, wait: float, timed_out: bool = False):
+        self.checkouts += 1
+        if timed_out:
+            self.timeouts += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long checkouts wait for a connection."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+
+    def recreate(self):
+        # Keep the counters when the engine is disposed
+        pool = super().recreate()
+        pool.wait_stats = self.wait_stats
+        return pool
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.wait_stats.record(time.perf_counter() - start, timed_out=True)
+            raise
+        self.wait_stats.record(time.perf_counter() - start)
+        return connection
+
+
+def create_engine(url: str):
+    return create_async_engine(
+        url=url,
+        future=True,
+        poolclass=InstrumentedQueuePool,
+        pool_size=settings.DATABASE_POOL_SIZE,
+        max_overflow=settings.DATABASE_MAX_OVERFLOW,
+        pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+        pool_pre_ping=settings.DATABASE_POOL_PRE_PING,
+        pool_recycle=settings.DATABASE_POOL_RECYCLE,
+        # A threshold of None disables server-side prepared statements,
+        # which is required behind a transaction-mode pooler such as PgBouncer.
+        connect_args={"prepare_threshold": settings.DATABASE_PREPARE_THRESHOLD},
+    )
+
+
+class PrimarySession(Session):
+    pass
+
+
+async_engine = create_engine(settings.DATABASE_URL)
 session_maker = async_sessionmaker(
     bind=async_engine,
     future=True,
     expire_on_commit=False,
+    sync_session_class=PrimarySession,
 )
 
+if settings.DATABASE_READ_URL is not None:
+    read_async_engine = create_engine(settings.DATABASE_READ_URL)
+    read_session_maker = async_sessionmaker(
+        bind=read_async_engine,
+        future=True,
+        expire_on_commit=False,
+    )
+else:
+    read_async_engine = async_engine
+    read_session_maker = session_maker
+
+# Clients that committed to the primary recently get their reads pinned to the
+# primary, so they do not observe replication lag on their own writes.
+#
+# The cookie carries the time of the last write, so the pin holds whichever
+# worker serves the next request. Clients that drop cookies are only pinned by
+# `recent_writers`, which is per process: their next read may land on another
+# worker and hit the replica.
+LAST_WRITE_COOKIE = "last_write_at"
+
+recent_writers: TTLCache[UUID, bool] = TTLCache(
+    maxsize=settings.DATABASE_READ_YOUR_WRITES_CACHE_SIZE,
+    ttl=settings.DATABASE_READ_YOUR_WRITES_WINDOW.total_seconds(),
+)
 
-async def get_db() -> AsyncIterator[AsyncSession]:
+
+@event.listens_for(PrimarySession, "after_commit")
+def mark_recent_writer(session: Session):
+    response: Response | None = session.info.get("response")
+    if response is not None:
+        window = settings.DATABASE_READ_YOUR_WRITES_WINDOW.total_seconds()
+        response.set_cookie(
+            LAST_WRITE_COOKIE, str(time.time()), max_age=int(window), httponly=True
+        )
+
+    if not context.exists():
+        return
+
+    principal_id = context.get("principal_id")
+    if principal_id is not None:
+        recent_writers.set(principal_id, True)
+
+
+def is_recent_writer(principal_id: UUID) -> bool:
+    return recent_writers.get(principal_id) is not None
+
+
+def wrote_recently(last_write_at: str) -> bool:
+    try:
+        elapsed = time.time() - float(last_write_at)
+    except ValueError:
+        return False
+    return 0 <= elapsed < settings.DATABASE_READ_YOUR_WRITES_WINDOW.total_seconds()
+
+
+async def get_db(response: Response) -> AsyncIterator[AsyncSession]:
     session = session_maker()
+    # Lets commits set the last write cookie on the response
+    session.info["response"] = response
     try:
         yield session
     except Exception:
@@ -24,6 +157,47 @@ async def get_db() -> AsyncIterator[AsyncSession]:
         await session.close()
 
 
+def get_read_session_maker(
+    principal_id: UUID | None, last_write_at: str | None = None
+) -> async_sessionmaker[AsyncSession]:
+    if last_write_at is not None and wrote_recently(last_write_at):
+        return session_maker
+    if principal_id is not None and is_recent_writer(principal_id):
+        return session_maker
+    return read_session_maker
+
+
+async def warm_up_pool(connections: int):
+    # Connections beyond the pool size would be discarded on release
+    connections = min(connections, settings.DATABASE_POOL_SIZE)
+    if connections <= 0:
+        return
+
+    results = await asyncio.gather(
+        *(async_engine.connect().start() for _ in range(connections)),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            logger.warning(f"Failed to warm up database connection: {result}")
+        else:
+            await result.close()
+
+
+def get_pool_stats(engine: AsyncEngine) -> dict[str, int | float]:
+    pool: InstrumentedQueuePool = engine.pool  # type: ignore
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        "checkouts": pool.wait_stats.checkouts,
+        "timeouts": pool.wait_stats.timeouts,
+        "total_wait_seconds": pool.wait_stats.total_wait,
+        "max_wait_seconds": pool.wait_stats.max_wait,
+    }
+
+
 DatabaseDependency = Annotated[AsyncSession, Depends(get_db)]
 
 # TODO: sys:1: SAWarning: Object of type <Workout> not in session, add operation along 'User.workouts' will not proceed (This warning originated from the Session 'autoflush' process, which was invoked automatically in response to a user-initiated operation.)
@@ -1,38 +1,221 @@
-from typing import Annotated
+from datetime import datetime
+from enum import Enum
+from typing import Annotated, AsyncIterator, cast
+from uuid import UUID
 
-from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPAuthorizationCredentials
+from fastapi import Cookie, Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy import literal, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette_context import context
 
-from fitness_solutions_server.admins.dependencies import get_admin_authentication_token
-from fitness_solutions_server.admins.dependencies import security as admin_security
-from fitness_solutions_server.core.database import DatabaseDependency
-from fitness_solutions_server.fitness_coaches.dependencies import (
-    get_fitness_coach_authentication_token,
+from fitness_solutions_server.admins.models import Admin, AdminAuthenticationToken
+from fitness_solutions_server.core.cache import TTLCache
+from fitness_solutions_server.core.config import settings
+from fitness_solutions_server.core.database import (
+    LAST_WRITE_COOKIE,
+    DatabaseDependency,
+    get_read_session_maker,
 )
-from fitness_solutions_server.fitness_coaches.dependencies import (
-    security as fitness_coach_security,
+from fitness_solutions_server.core.security import unhashed_token_to_hashed_token
+from fitness_solutions_server.fitness_coaches.models import (
+    FitnessCoach,
+    FitnessCoachAuthenticationToken,
 )
-from fitness_solutions_server.users.dependencies import get_user_authentication_token
-from fitness_solutions_server.users.dependencies import security as user_security
+from fitness_solutions_server.users.models import User, UserAuthenticationToken
 
+# All three schemes read the same bearer token,
+# they are kept separate so the OpenAPI docs list each token type.
+user_security = HTTPBearer(scheme_name="UserToken", auto_error=False)
+admin_security = HTTPBearer(scheme_name="AdminToken", auto_error=False)
+fitness_coach_security = HTTPBearer(scheme_name="FitnessCoachToken", auto_error=False)
 
-async def requires_authentication(
-    admin_credentials: Annotated[HTTPAuthorizationCredentials, Depends(admin_security)],
-    user_credentials: Annotated[HTTPAuthorizationCredentials, Depends(user_security)],
+
+class PrincipalRole(str, Enum):
+    user = "user"
+    admin = "admin"
+    fitness_coach = "fitness_coach"
+
+
+Principal = User | Admin | FitnessCoach
+
+PRINCIPAL_MODELS = {
+    PrincipalRole.user: (User, UserAuthenticationToken),
+    PrincipalRole.admin: (Admin, AdminAuthenticationToken),
+    PrincipalRole.fitness_coach: (FitnessCoach, FitnessCoachAuthenticationToken),
+}
+
+
+# Maps a hashed token to (role, owner id, expires at), so repeated requests with
+# the same token skip the token table lookup. The cache is per process,
+# invalidations therefore only reach other workers once the TTL runs out.
+token_cache: TTLCache[str, tuple[PrincipalRole, UUID, datetime]] = TTLCache(
+    maxsize=settings.AUTH_TOKEN_CACHE_SIZE,
+    ttl=settings.AUTH_TOKEN_CACHE_TTL.total_seconds(),
+)
+
+
+# Bumped on every invalidation, so lookups that started before are not stored
+_token_generation = 0
+
+
+def invalidate_token(hashed_token: str):
+    global _token_generation
+    _token_generation += 1
+    token_cache.delete(hashed_token)
+
+
+def invalidate_principal_tokens(owner_id: UUID):
+    global _token_generation
+    _token_generation += 1
+    token_cache.delete_where(lambda _, value: value[1] == owner_id)
+
+
+class RequestPrincipal:
+    def __init__(
+        self,
+        role: PrincipalRole,
+        hashed_token: str,
+        expires_at: datetime,
+        principal: Principal,
+    ):
+        self.role = role
+        self.hashed_token = hashed_token
+        self.expires_at = expires_at
+        self.principal = principal
+
+    @property
+    def id(self) -> UUID:
+        return self.principal.id
+
+    @property
+    def user(self) -> User | None:
+        if self.role != PrincipalRole.user:
+            return None
+        return self.principal  # type: ignore
+
+    @property
+    def admin(self) -> Admin | None:
+        if self.role != PrincipalRole.admin:
+            return None
+        return self.principal  # type: ignore
+
+    @property
+    def fitness_coach(self) -> FitnessCoach | None:
+        if self.role != PrincipalRole.fitness_coach:
+            return None
+        return self.principal  # type: ignore
+
+
+def principal_token_query(hashed_token: str):
+    return union_all(
+        select(
+            literal(PrincipalRole.user.value).label("role"),
+            UserAuthenticationToken.user_id.label("owner_id"),
+            UserAuthenticationToken.expires_at,
+        ).where(UserAuthenticationToken.token == hashed_token),
+        select(
+            literal(PrincipalRole.admin.value).label("role"),
+            AdminAuthenticationToken.admin_id.label("owner_id"),
+            AdminAuthenticationToken.expires_at,
+        ).where(AdminAuthenticationToken.token == hashed_token),
+        select(
+            literal(PrincipalRole.fitness_coach.value).label("role"),
+            FitnessCoachAuthenticationToken.fitness_coach_id.label("owner_id"),
+            FitnessCoachAuthenticationToken.expires_at,
+        ).where(FitnessCoachAuthenticationToken.token == hashed_token),
+    )
+
+
+async def get_request_principal(
+    user_credentials: Annotated[
+        HTTPAuthorizationCredentials | None, Depends(user_security)
+    ],
+    admin_credentials: Annotated[
+        HTTPAuthorizationCredentials | None, Depends(admin_security)
+    ],
     fitness_coach_credentials: Annotated[
-        HTTPAuthorizationCredentials, Depends(fitness_coach_security)
+        HTTPAuthorizationCredentials | None, Depends(fitness_coach_security)
     ],
     db: DatabaseDependency,
-):
-    # TODO: Worst case we are an admin,
-    # and we will have to do extra two database queries.
-    # Maybe we can send an additional header to specify what user type we are.
-    if (
-        await get_user_authentication_token(user_credentials, db) is None
-        and await get_fitness_coach_authentication_token(fitness_coach_credentials, db)
-        is None
-        and await get_admin_authentication_token(admin_credentials, db) is None
-    ):
+) -> RequestPrincipal | None:
+    credentials = user_credentials or admin_credentials or fitness_coach_credentials
+    if credentials is None:
+        return None
+
+    hashed_token = unhashed_token_to_hashed_token(credentials.credentials)
+
+    cached = token_cache.get(hashed_token)
+    if cached is None:
+        generation = _token_generation
+        row = (await db.execute(principal_token_query(hashed_token))).first()
+        if row is None:
+            return None
+        cached = (PrincipalRole(row.role), row.owner_id, row.expires_at)
+        # Never keep an entry around for longer than the token is valid
+        ttl = row.expires_at - datetime.now().astimezone()
+        if generation == _token_generation:
+            token_cache.set(hashed_token, cached, ttl=ttl.total_seconds())
+
+    role, owner_id, expires_at = cached
+    model, _ = PRINCIPAL_MODELS[role]
+
+    # Expired tokens are removed by the background reaper, not here
+    if expires_at <= datetime.now().astimezone():
+        invalidate_token(hashed_token)
+        return None
+
+    # The role's model is one of the principal models
+    principal = cast(Principal | None, await db.get(model, owner_id))
+    if principal is None:
+        invalidate_token(hashed_token)
+        return None
+
+    # Lets commits made during this request be attributed to the principal
+    context["principal_id"] = owner_id
+
+    return RequestPrincipal(
+        role=role,
+        hashed_token=hashed_token,
+        expires_at=expires_at,
+        principal=principal,
+    )
+
+
+async def requires_authentication(
+    principal: Annotated[RequestPrincipal | None, Depends(get_request_principal)],
+) -> RequestPrincipal:
+    if principal is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authorized"
         )
+
+    return principal
+
+
+async def get_read_db(
+    principal: Annotated[RequestPrincipal | None, Depends(get_request_principal)],
+    last_write_at: Annotated[
+        str | None, Cookie(alias=LAST_WRITE_COOKIE, include_in_schema=False)
+    ] = None,
+) -> AsyncIterator[AsyncSession]:
+    maker = get_read_session_maker(
+        principal.id if principal is not None else None, last_write_at
+    )
+    session = maker()
+    try:
+        yield session
+    except Exception:
+        await session.rollback()
+        raise
+    finally:
+        await session.close()
+
+
+ReadDatabaseDependency = Annotated[AsyncSession, Depends(get_read_db)]
+RequestPrincipalDependency = Annotated[
+    RequestPrincipal | None, Depends(get_request_principal)
+]
+RequireRequestPrincipalDependency = Annotated[
+    RequestPrincipal, Depends(requires_authentication)
+]
@@ -0,0 +1,40 @@
+from typing import Any
+
+from sqlalchemy.orm import QueryableAttribute, selectinload
+from sqlalchemy.orm.interfaces import ORMOption
+from sqlalchemy.orm.strategy_options import _AbstractLoad
+
+
+class EmbedPlanner:
+    """
+    Collects the relationship paths an endpoint has to eager load and turns them
+    into a single tree of `selectinload` options.
+
+    Paths sharing a prefix are merged, so every relationship is loaded by one
+    SELECT ... WHERE ... IN statement no matter how many embeds need it, and
+    collections never multiply the parent rows like joined loads do.
+    """
+
+    def __init__(self):
+        self._tree: dict[tuple[Any, str], _Node] = {}
+
+    def add(self, *path: QueryableAttribute[Any]) -> "EmbedPlanner":
+        tree = self._tree
+        for attribute in path:
+            # Attributes overload ==, so they can't be used as keys themselves
+            node = tree.setdefault((attribute.parent, attribute.key), _Node(attribute))
+            tree = node.children
+        return self
+
+    def options(self) -> list[ORMOption]:
+        return [node.loader() for node in self._tree.values()]
+
+
+class _Node:
+    def __init__(self, attribute: QueryableAttribute[Any]):
+        self.attribute = attribute
+        self.children: dict[tuple[Any, str], _Node] = {}
+
+    def loader(self) -> _AbstractLoad:
+        children = [child.loader() for child in self.children.values()]
+        return selectinload(self.attribute).options(*children)
@@ -1,4 +1,4 @@
-from fastapi import HTTPException, Request
+from fastapi import HTTPException, Request, status
 from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
@@ -15,6 +15,24 @@ class AppException(HTTPException):
         super().__init__(status_code=status_code, detail=detail)
 
 
+class PasswordHasherBusyException(AppException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many concurrent password operations, try again later",
+            code="password_hasher_busy",
+        )
+
+
+class InvalidAgeRangeException(AppException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="min_age must be less than or equal to max_age",
+            code="invalid_age_range",
+        )
+
+
 def custom_exception_handler(request: Request, exc: Exception) -> JSONResponse:
     headers = getattr(exc, "headers", None)
 
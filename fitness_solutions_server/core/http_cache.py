@@ -0,0 +1,145 @@
+import hashlib
+import json
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Awaitable, Callable, NamedTuple
+
+from fastapi import Request, Response, status
+from fastapi.encoders import jsonable_encoder
+
+from fitness_solutions_server.core.cache import TTLCache
+from fitness_solutions_server.core.config import settings
+from fitness_solutions_server.core.localization import get_locale
+
+
+class CachedResponse(NamedTuple):
+    body: bytes
+    etag: str
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("If-None-Match")
+    if if_none_match is None:
+        return False
+
+    # If-None-Match uses the weak comparison, so W/ prefixes are ignored
+    candidates = {c.strip().removeprefix("W/") for c in if_none_match.split(",")}
+    return "*" in candidates or etag.removeprefix("W/") in candidates
+
+
+def weak_etag(*parts: Any) -> str:
+    """
+    ETag for a representation that is identified by `parts` rather than by
+    its exact bytes, e.g. a version timestamp plus everything the body
+    depends on besides the row.
+    """
+    digest = hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()[:32]
+    return f'W/"{digest}"'
+
+
+def is_not_modified(request: Request, etag: str, last_modified: datetime) -> bool:
+    # If-None-Match takes precedence, If-Modified-Since is ignored when both
+    # are sent
+    if "If-None-Match" in request.headers:
+        return etag_matches(request, etag)
+
+    if_modified_since = request.headers.get("If-Modified-Since")
+    if if_modified_since is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        return False
+
+    # HTTP dates only have second precision
+    return last_modified.replace(microsecond=0) <= since
+
+
+def check_not_modified(
+    request: Request, response: Response, etag: str, last_modified: datetime
+) -> Response | None:
+    """
+    Returns a 304 response when the client's copy is still current. Otherwise
+    adds the validators to `response` and returns None, so the endpoint can
+    build the full body.
+    """
+    headers = {
+        "ETag": etag,
+        "Last-Modified": format_datetime(
+            last_modified.astimezone(timezone.utc), usegmt=True
+        ),
+        "Cache-Control": "private, no-cache",
+        "Vary": "Accept-Language, Authorization",
+    }
+    if is_not_modified(request, etag, last_modified):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
+    return None
+
+
+class ResponseCache:
+    """
+    In-process cache of serialized responses for reference data that only
+    changes when an admin edits it.
+
+    Entries are keyed by path, query string, locale and admin flag, and are
+    served with a strong ETag so clients can revalidate with `If-None-Match`.
+    Admin handlers call `clear` after committing, other workers pick up the
+    change once the TTL runs out.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = settings.REFERENCE_DATA_CACHE_SIZE,
+        ttl: float = settings.REFERENCE_DATA_CACHE_TTL.total_seconds(),
+    ):
+        self._entries: TTLCache[tuple[str, str, str, bool], CachedResponse] = TTLCache(
+            maxsize=maxsize, ttl=ttl
+        )
+
+    async def respond(
+        self,
+        request: Request,
+        is_admin: bool,
+        build: Callable[[], Awaitable[Any]],
+    ) -> Response:
+        query = "&".join(
+            sorted(f"{k}={v}" for k, v in request.query_params.multi_items())
+        )
+        key = (request.url.path, query, get_locale(), is_admin)
+
+        cached = self._entries.get(key)
+        if cached is None:
+            body = json.dumps(
+                jsonable_encoder(await build()),
+                ensure_ascii=False,
+                allow_nan=False,
+                separators=(",", ":"),
+            ).encode("utf-8")
+            etag = f'"{hashlib.sha256(body).hexdigest()}"'
+            cached = CachedResponse(body=body, etag=etag)
+            self._entries.set(key, cached)
+
+        max_age = int(settings.REFERENCE_DATA_MAX_AGE.total_seconds())
+        headers = {
+            "ETag": cached.etag,
+            # Admin responses contain translations and must not end up in
+            # shared caches
+            "Cache-Control": "private, no-cache"
+            if is_admin
+            else f"public, max-age={max_age}",
+            "Vary": "Accept-Language, Authorization",
+        }
+
+        if etag_matches(request, cached.etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        return Response(
+            content=cached.body, media_type="application/json", headers=headers
+        )
+
+    def clear(self):
+        self._entries.clear()
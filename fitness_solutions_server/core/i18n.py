@@ -1,10 +1,10 @@
 # TODO: Remove this once PR is merged for fix (https://github.com/kvesteri/sqlalchemy-utils/pull/705)
 
+from functools import partial
+
 import sqlalchemy as sa
-from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import MappedColumn
-from sqlalchemy.sql.expression import ColumnElement
 
 try:
     import babel
@@ -43,21 +43,19 @@ def cast_locale(obj, locale, attr):
     return locale
 
 
-class cast_locale_expr(ColumnElement):
-    inherit_cache = False
-
-    def __init__(self, cls, locale, attr):
-        self.cls = cls
-        self.locale = locale
-        self.attr = attr
-
+def cast_locale_expr(cls, locale, attr):
+    """
+    Return a bound parameter resolving the locale at execution time.
 
-@compiles(cast_locale_expr)
-def compile_cast_locale_expr(element, compiler, **kw):
-    locale = cast_locale(element.cls, element.locale, element.attr)
-    if isinstance(locale, str):
-        return f"'{locale}'"
-    return compiler.process(locale)
+    Binding the locale (instead of rendering it inline) keeps statements
+    cacheable, so they are compiled once and reused for every locale.
+    """
+    return sa.bindparam(
+        "locale",
+        callable_=partial(cast_locale, cls, locale, attr),
+        type_=sa.String,
+        unique=True,
+    )
 
 
 def get_key(attr):
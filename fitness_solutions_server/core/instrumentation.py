@@ -0,0 +1,121 @@
+import logging
+import time
+from collections import Counter
+from contextvars import ContextVar
+
+from sqlalchemy import Engine, event
+from sqlalchemy.engine import ExceptionContext
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from fitness_solutions_server.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class RequestQueryStats:
+    def __init__(self, track_statements: bool):
+        self.count = 0
+        self.duration = 0.0
+        self.statements: Counter[str] | None = Counter() if track_statements else None
+
+    def record(self, statement: str, duration: float):
+        self.count += 1
+        self.duration += duration
+        if self.statements is not None:
+            self.statements[statement] += 1
+
+
+_request_query_stats: ContextVar[RequestQueryStats | None] = ContextVar(
+    "request_query_stats", default=None
+)
+
+
+def _record_query(conn, context, statement: str):
+    # Keyed by the execution, so failed statements can't leave a start time
+    # behind for the next one to pick up
+    start = conn.info.get("query_start_time", {}).pop(context, None)
+    stats = _request_query_stats.get()
+    if start is not None and stats is not None:
+        stats.record(statement, time.perf_counter() - start)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", {})[context] = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    _record_query(conn, context, statement)
+
+
+def _handle_error(exception_context: ExceptionContext):
+    if exception_context.connection is not None:
+        _record_query(
+            exception_context.connection,
+            exception_context.execution_context,
+            exception_context.statement or "",
+        )
+
+
+def instrument_engine(engine: Engine):
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+class SQLInstrumentationMiddleware:
+    """
+    Counts statements and database time per request.
+
+    Adds a Server-Timing header to every response and logs requests that
+    exceed the configured query count or time budgets. In debug mode,
+    statements repeated within one request are reported as likely N+1s.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestQueryStats(track_statements=settings.DEBUG)
+        token = _request_query_stats.set(stats)
+
+        async def send_wrapper(message: Message):
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "Server-Timing",
+                    f'db;dur={stats.duration * 1000:.1f};desc="{stats.count} queries"',
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _request_query_stats.reset(token)
+            self.report(scope, stats)
+
+    def report(self, scope: Scope, stats: RequestQueryStats):
+        path = f'{scope["method"]} {scope["path"]}'
+
+        if (
+            stats.count > settings.SQL_QUERY_COUNT_BUDGET
+            or stats.duration > settings.SQL_QUERY_TIME_BUDGET.total_seconds()
+        ):
+            logger.warning(
+                f"{path} exceeded its database budget: "
+                f"{stats.count} queries in {stats.duration * 1000:.1f} ms"
+            )
+
+        if stats.statements is None:
+            return
+
+        for statement, count in stats.statements.items():
+            if count >= settings.SQL_REPEATED_STATEMENT_THRESHOLD:
+                logger.warning(
+                    f"{path} ran the same statement {count} times, "
+                    f"likely an N+1 query: {statement}"
+                )
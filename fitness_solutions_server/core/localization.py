@@ -1,5 +1,7 @@
 from babel import Locale, UnknownLocaleError
 from fastapi import Header
+from sqlalchemy import Computed
+from sqlalchemy.orm import MappedColumn, mapped_column
 from starlette_context import context, request_cycle_context
 from starlette_context.plugins import Plugin
 
@@ -70,6 +72,19 @@ class TranslationDict(dict[str, str]):
         return f"TranslationDict({super().__repr__()})"
 
 
+def translations_search_text(translations: str) -> MappedColumn[str]:
+    """
+    Generated column holding every translation in the `translations` column as
+    one string, so names can be searched with a trigram index in any locale.
+    """
+    return mapped_column(
+        Computed(
+            f"jsonb_path_query_array({translations}, '$.*')::text", persisted=True
+        ),
+        deferred=True,
+    )
+
+
 translation_hybrid = TranslationHybrid(
     current_locale=get_locale, default_locale=DEFAULT_LOCALE
 )
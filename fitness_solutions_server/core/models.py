@@ -2,8 +2,9 @@ import functools
 from datetime import datetime
 from enum import Enum
 
-from sqlalchemy import TIMESTAMP, func
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy import TIMESTAMP, Computed, func
+from sqlalchemy.dialects.postgresql import INT4RANGE, Range
+from sqlalchemy.orm import DeclarativeBase, Mapped, MappedColumn, mapped_column
 from sqlalchemy_easy_softdelete.mixin import generate_soft_delete_mixin_class
 
 
@@ -23,6 +24,18 @@ class TimestampMixin:
     )
 
 
+def target_age_range() -> MappedColumn[Range[int]]:
+    """
+    Generated `[min_age, max_age]` range where NULL bounds are unbounded, so age
+    filters can be containment checks served by a GiST index.
+    """
+    return mapped_column(
+        INT4RANGE(),
+        Computed("int4range(min_age, max_age, '[]')", persisted=True),
+        deferred=True,
+    )
+
+
 class ExperienceLevel(str, Enum):
     beginner = "beginner"
     intermediate = "intermediate"
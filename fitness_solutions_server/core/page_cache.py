@@ -0,0 +1,134 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Hashable, Sequence, cast
+
+from fastapi_pagination.api import resolve_params
+from fastapi_pagination.bases import AbstractPage, CursorRawParams
+from fastapi_pagination.cursor import CursorPage
+from fastapi_pagination.ext.sqlalchemy import paginate
+from sqlalchemy import Select, event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.interfaces import ORMOption
+
+from fitness_solutions_server.core.cache import TTLCache
+from fitness_solutions_server.core.config import settings
+
+
+def filters_cache_key(values: dict[str, Any]) -> tuple[Hashable, ...]:
+    """
+    Normalizes filter values into a hashable key, so the same filters given in
+    a different order or with different defaults share an entry.
+    """
+    return tuple(
+        sorted(
+            (name, tuple(sorted(value, key=str)) if isinstance(value, set) else value)
+            for name, value in values.items()
+            if value is not None
+        )
+    )
+
+
+class PageCache:
+    """
+    Caches cursor pages of a list endpoint as item IDs plus cursors, shared by
+    every caller whose filters resolve to the same query.
+
+    Callers load the entities of a page by primary key with their own options,
+    so embeds and per-user fields such as `is_saved` are never shared.
+    Concurrent misses for the same page run the list query once. The cache is
+    per process, `clear_after_commit` covers the worker that made a change and
+    the TTL bounds staleness everywhere else.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = settings.CATALOG_PAGE_CACHE_SIZE,
+        ttl: float = settings.CATALOG_PAGE_CACHE_TTL.total_seconds(),
+    ):
+        self._pages: TTLCache[Hashable, AbstractPage[Any]] = TTLCache(
+            maxsize=maxsize, ttl=ttl
+        )
+        self._loading: dict[Hashable, asyncio.Future[AbstractPage[Any] | None]] = {}
+        # Bumped on every clear, so loads that started before are not stored
+        self._generation = 0
+
+    async def get_or_load(
+        self, key: Hashable, load: Callable[[], Awaitable[AbstractPage[Any]]]
+    ) -> AbstractPage[Any]:
+        page = self._pages.get(key)
+        if page is not None:
+            return page
+
+        loading = self._loading.get(key)
+        if loading is not None:
+            page = await asyncio.shield(loading)
+            # The load failed for the other caller, so try on our own
+            if page is not None:
+                return page
+            return await load()
+
+        generation = self._generation
+        future: asyncio.Future[
+            AbstractPage[Any] | None
+        ] = asyncio.get_running_loop().create_future()
+        self._loading[key] = future
+        try:
+            page = await load()
+        except BaseException:
+            future.set_result(None)
+            raise
+        finally:
+            del self._loading[key]
+
+        if generation == self._generation:
+            self._pages.set(key, page)
+        future.set_result(page)
+        return page
+
+    async def paginate(
+        self,
+        db: AsyncSession,
+        key: Hashable,
+        query: Select,
+        model: Any,
+        options: Sequence[ORMOption],
+        transformer: Callable[[Sequence[Any]], Awaitable[Sequence[Any]]],
+    ) -> AbstractPage[Any]:
+        """
+        Paginates `query`, an ordered select of `model`, through the cache.
+        The entities on the page are loaded by ID with `options` and passed to
+        `transformer` like `paginate` does.
+        """
+        params: CursorRawParams = resolve_params().to_raw_params().as_cursor()
+        page = await self.get_or_load(
+            (key, params.cursor, params.size),
+            # Cache plain IDs instead of the Row objects selected
+            lambda: paginate(
+                db, query.with_only_columns(model.id), unwrap_mode="unwrap"
+            ),
+        )
+
+        ids = cast(CursorPage[Any], page).items
+        entities = await db.scalars(
+            select(model).where(model.id.in_(ids)).options(*options)
+        )
+        by_id = {entity.id: entity for entity in entities}
+        # Items that disappeared since the page was cached are left out
+        items = [by_id[id] for id in ids if id in by_id]
+
+        return page.copy(update={"items": await transformer(items)})
+
+    def clear(self):
+        self._generation += 1
+        self._pages.clear()
+
+    def clear_after_commit(self, db: AsyncSession):
+        """
+        Clears the cache once `db` commits, so no page loaded before the
+        change becomes visible is kept.
+        """
+
+        def clear(session: Session):
+            self.clear()
+
+        event.listen(db.sync_session, "after_commit", clear, once=True)
@@ -0,0 +1,51 @@
+from uuid import UUID
+
+from sqlalchemy import Column, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from fitness_solutions_server.core.cache import TTLCache
+from fitness_solutions_server.core.config import settings
+
+
+class SavedItemIdsCache:
+    """
+    Caches the IDs of the items each user saved, read from the association
+    table with the `user_id` and `item_id` columns.
+
+    Sets are loaded from the primary, a lagging replica would put a set missing
+    the latest save back into the cache for the whole TTL. The cache is per
+    process, other workers only see changes once the TTL runs out.
+    """
+
+    def __init__(
+        self,
+        user_id: Column[UUID],
+        item_id: Column[UUID],
+        maxsize: int = settings.SAVED_ITEMS_CACHE_SIZE,
+        ttl: float = settings.SAVED_ITEMS_CACHE_TTL.total_seconds(),
+    ):
+        self._user_id = user_id
+        self._item_id = item_id
+        self._ids: TTLCache[UUID, frozenset[UUID]] = TTLCache(maxsize=maxsize, ttl=ttl)
+        # Bumped on every invalidation, so loads that started before are not
+        # stored
+        self._generation = 0
+
+    async def get(self, db: AsyncSession, user_id: UUID) -> frozenset[UUID]:
+        """Returns the IDs `user_id` saved, `db` must be a primary session."""
+        ids = self._ids.get(user_id)
+        if ids is not None:
+            return ids
+
+        generation = self._generation
+        ids = frozenset(
+            await db.scalars(select(self._item_id).where(self._user_id == user_id))
+        )
+        if generation == self._generation:
+            self._ids.set(user_id, ids)
+        return ids
+
+    def invalidate(self, user_id: UUID):
+        """Drops the IDs of `user_id`, call it after committing a change."""
+        self._generation += 1
+        self._ids.delete(user_id)
@@ -30,6 +30,28 @@ class ErrorResponse(BaseModel):
     error: ErrorDetail
 
 
+class DatabasePoolStats(BaseModel):
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    checkouts: int
+    timeouts: int
+    total_wait_seconds: float
+    max_wait_seconds: float
+
+
+class DatabasePoolsStats(BaseModel):
+    primary: DatabasePoolStats
+    # None when reads are not routed to a replica
+    replica: DatabasePoolStats | None
+
+
+class FacetCount(BaseModel):
+    value: str
+    count: int
+
+
 class ResponseModel(GenericModel, Generic[T]):
     data: T | None
     success: bool = Field(True, const=True)
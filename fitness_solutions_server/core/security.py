@@ -1,9 +1,28 @@
+import asyncio
 import hashlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from random import randbytes
+from typing import Any, Callable
 
 from passlib.context import CryptContext
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from fitness_solutions_server.core.config import settings
+from fitness_solutions_server.core.exceptions import PasswordHasherBusyException
+
+# Pinning min/max rounds to the configured cost makes passlib flag hashes
+# created with any other cost, so they are rehashed on the next login.
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=settings.PASSWORD_HASH_ROUNDS,
+    bcrypt__min_rounds=settings.PASSWORD_HASH_ROUNDS,
+    bcrypt__max_rounds=settings.PASSWORD_HASH_ROUNDS,
+)
+
+_password_executor: ProcessPoolExecutor | None = None
+_pending_password_jobs = 0
 
 
 def hash_password(password: str):
@@ -14,6 +33,63 @@ def verify_password(password: str, hashed_password: str):
     return pwd_context.verify(password, hashed_password)
 
 
+def verify_and_update_password(
+    password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    return pwd_context.verify_and_update(password, hashed_password)
+
+
+def get_password_executor() -> ProcessPoolExecutor:
+    global _password_executor
+    if _password_executor is None:
+        _password_executor = ProcessPoolExecutor(
+            max_workers=settings.PASSWORD_HASH_WORKERS,
+            # Forking the threaded server could copy locks held by other
+            # threads into the workers, which then deadlock on them
+            mp_context=multiprocessing.get_context("forkserver"),
+        )
+    return _password_executor
+
+
+def shutdown_password_executor():
+    global _password_executor
+    if _password_executor is not None:
+        _password_executor.shutdown(wait=False, cancel_futures=True)
+        _password_executor = None
+
+
+async def _run_password_job(func: Callable[..., Any], *args: Any) -> Any:
+    # Reject instead of queueing without bound when logins spike
+    global _pending_password_jobs
+    if _pending_password_jobs >= settings.PASSWORD_HASH_MAX_PENDING:
+        raise PasswordHasherBusyException()
+
+    _pending_password_jobs += 1
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(get_password_executor(), partial(func, *args))
+    finally:
+        _pending_password_jobs -= 1
+
+
+async def hash_password_async(password: str) -> str:
+    return await _run_password_job(hash_password, password)
+
+
+async def verify_password_async(
+    password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    """
+    Verify a password off the event loop.
+
+    Returns whether the password matched, and a new hash if the stored one
+    was created with outdated settings and should be replaced.
+    """
+    return await _run_password_job(
+        verify_and_update_password, password, hashed_password
+    )
+
+
 def generate_authentication_token() -> tuple[str, str]:
     unhashed_token = randbytes(32)
     hashed_token = hashlib.sha256(unhashed_token).hexdigest()
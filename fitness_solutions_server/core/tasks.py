@@ -0,0 +1,64 @@
+import asyncio
+import logging
+from datetime import timedelta
+from typing import Any, Awaitable, Callable, cast
+
+from sqlalchemy import CursorResult, delete, func, select
+
+from fitness_solutions_server.admins.models import AdminAuthenticationToken
+from fitness_solutions_server.core.config import settings
+from fitness_solutions_server.core.database import session_maker
+from fitness_solutions_server.fitness_coaches.models import (
+    FitnessCoachAuthenticationToken,
+)
+from fitness_solutions_server.users.models import UserAuthenticationToken
+
+logger = logging.getLogger(__name__)
+
+
+async def run_periodically(
+    interval: timedelta, task: Callable[[], Awaitable[None]]
+) -> None:
+    while True:
+        try:
+            await task()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception(f"Periodic task {task.__name__} failed")
+        await asyncio.sleep(interval.total_seconds())
+
+
+async def delete_expired_authentication_tokens() -> None:
+    batch_size = settings.AUTH_TOKEN_REAPER_BATCH_SIZE
+
+    for model in (
+        UserAuthenticationToken,
+        AdminAuthenticationToken,
+        FitnessCoachAuthenticationToken,
+    ):
+        # SKIP LOCKED lets several workers reap concurrently without waiting
+        expired_ids = (
+            select(model.id)
+            .where(model.expires_at <= func.now())
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+
+        deleted = batch_size
+        while deleted == batch_size:
+            async with session_maker() as db:
+                result = cast(
+                    CursorResult[Any],
+                    await db.execute(
+                        delete(model)
+                        .where(model.id.in_(expired_ids))
+                        .execution_options(synchronize_session=False)
+                    ),
+                )
+                await db.commit()
+            deleted = result.rowcount
+
+            if deleted > 0:
+                logger.info(f"Deleted {deleted} expired {model.__tablename__}")
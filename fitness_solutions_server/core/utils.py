@@ -1,10 +1,14 @@
-from typing import Any, Sequence, Type, TypeVar, cast
+from typing import AbstractSet, Any, Iterable, Sequence, Type, TypeVar, cast
+from uuid import UUID
 
 from fastapi import HTTPException, Query, status
 from fastapi_pagination.cursor import CursorPage
-from sqlalchemy import select
+from sqlalchemy import ColumnElement, Select, SQLColumnExpression, String
+from sqlalchemy import cast as sql_cast
+from sqlalchemy import func, literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import noload
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.orm.interfaces import ORMOption
 from sqlalchemy.sql.selectable import ForUpdateParameter
 
@@ -16,6 +20,52 @@ CursorPage = CursorPage.with_custom_options(  # type: ignore
 )
 
 
+def search_by_similarity(
+    query: Select, column: SQLColumnExpression[str], term: str
+) -> Select:
+    """
+    Keeps rows where `column` contains `term`, closest matches first.
+
+    Must be applied before any other ordering. The ILIKE can be served by a
+    `gin_trgm_ops` index on `column`.
+    """
+    return query.where(column.ilike(f"%{term}%")).order_by(
+        func.similarity(column, term).desc()
+    )
+
+
+def count_facet_values(
+    facet: str,
+    value: ColumnElement[Any],
+    distinct_on: ColumnElement[Any] | None = None,
+) -> Select:
+    """
+    Counts rows per distinct non-null `value` as `(facet, value, count)` rows,
+    so the counts of several facets can be combined with UNION ALL. Pass
+    `distinct_on` to count distinct values of it instead, e.g. when joins
+    repeat the counted rows.
+    """
+    return (
+        select(
+            literal(facet).label("facet"),
+            sql_cast(value, String).label("value"),
+            (
+                func.count()
+                if distinct_on is None
+                else func.count(distinct_on.distinct())
+            ).label("count"),
+        )
+        .where(value.is_not(None))
+        .group_by(value)
+    )
+
+
+def not_found(model: Type[Any]) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND, detail=f"{model} not found"
+    )
+
+
 async def get_or_fail(
     model: Type[ModelType],
     id: Any,
@@ -25,9 +75,7 @@ async def get_or_fail(
 ) -> ModelType:
     entity = await db.get(model, id, options=options, with_for_update=with_for_update)
     if entity is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail=f"{model} not found"
-        )
+        raise not_found(model)
 
     return entity
 
@@ -48,3 +96,12 @@ async def get_or_fail_many(
         )
 
     return cast(list[ModelType], entities)
+
+
+def set_is_saved(items: Iterable[Any], saved_ids: AbstractSet[UUID]):
+    """
+    Fills the `is_saved` query expression of `items` from the IDs the user
+    saved, instead of an EXISTS subquery per row.
+    """
+    for item in items:
+        set_committed_value(item, "is_saved", item.id in saved_ids)
@@ -1,14 +1,27 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
 from sqlalchemy import select
 
 from fitness_solutions_server.core.database import DatabaseDependency
+from fitness_solutions_server.core.http_cache import ResponseCache
 from fitness_solutions_server.core.schemas import ResponseModel
 from fitness_solutions_server.countries import models, schemas
 
 router = APIRouter(prefix="/countries")
 
+# Countries are only changed by migrations, so entries just expire
+countries_cache = ResponseCache()
+
 
 @router.get("")
-async def get_countries(db: DatabaseDependency) -> ResponseModel[list[schemas.Country]]:
-    countries = await db.scalars(select(models.Country).order_by(models.Country.name))
-    return ResponseModel(data=[schemas.Country.from_orm(c) for c in countries.all()])
+async def get_countries(
+    request: Request, db: DatabaseDependency
+) -> ResponseModel[list[schemas.Country]]:
+    async def build():
+        countries = await db.scalars(
+            select(models.Country).order_by(models.Country.name)
+        )
+        return ResponseModel(
+            data=[schemas.Country.from_orm(c) for c in countries.all()]
+        )
+
+    return await countries_cache.respond(request, False, build)  # type: ignore
@@ -1,10 +1,11 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from sqlalchemy import select
 
 from fitness_solutions_server.admins.dependencies import (
     require_admin_authentication_token,
 )
 from fitness_solutions_server.core.database import DatabaseDependency
+from fitness_solutions_server.core.http_cache import ResponseCache
 from fitness_solutions_server.core.schemas import ResponseModel
 from fitness_solutions_server.core.utils import get_or_fail
 
@@ -12,6 +13,8 @@ from . import models, schemas
 
 router = APIRouter(prefix="/currencies")
 
+currencies_cache = ResponseCache()
+
 
 @router.post(
     "",
@@ -24,6 +27,7 @@ async def create_currency(
     currency = models.Currency(code=body.code, name=body.name)
     db.add(currency)
     await db.commit()
+    currencies_cache.clear()
     return ResponseModel(data=schemas.Currency.from_orm(currency))
 
 
@@ -33,11 +37,18 @@ async def create_currency(
     dependencies=[Depends(require_admin_authentication_token)],
 )
 async def list_currencies(
+    request: Request,
     db: DatabaseDependency,
 ) -> ResponseModel[list[schemas.Currency]]:
-    query = select(models.Currency).order_by(models.Currency.code)
-    currencies = await db.scalars(query)
-    return ResponseModel(data=currencies.all())
+    async def build():
+        query = select(models.Currency).order_by(models.Currency.code)
+        currencies = await db.scalars(query)
+        return ResponseModel(
+            data=[schemas.Currency.from_orm(c) for c in currencies.all()]
+        )
+
+    # Only admins can list currencies
+    return await currencies_cache.respond(request, True, build)  # type: ignore
 
 
 @router.delete(
@@ -52,4 +63,5 @@ async def delete_currency(
     currency = await get_or_fail(models.Currency, currency_code, db)
     await db.delete(currency)
     await db.commit()
+    currencies_cache.clear()
     return ResponseModel(data=None)
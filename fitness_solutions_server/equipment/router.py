@@ -1,7 +1,7 @@
 import functools
 from uuid import UUID, uuid4
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, status
 from fastapi_pagination import pagination_ctx
 from fastapi_pagination.ext.sqlalchemy import paginate
 from sqlalchemy import select
@@ -14,10 +14,12 @@ from fitness_solutions_server.core.database import DatabaseDependency
 from fitness_solutions_server.core.schemas import ResponseModel
 from fitness_solutions_server.core.utils import CursorPage, get_or_fail
 from fitness_solutions_server.equipment.utils import (
+    equipment_cache,
     equipment_model_to_schema,
     equipment_models_to_schema,
     make_equipment_image_path,
 )
+from fitness_solutions_server.exercises.utils import exercises_cache
 from fitness_solutions_server.images.models import Image
 from fitness_solutions_server.storage.base import StorageServiceDependency
 
@@ -56,6 +58,8 @@ async def create_equipment(
     await db.delete(image)
 
     await db.commit()
+    equipment_cache.clear()
+    exercises_cache.clear()
 
     return ResponseModel(
         data=equipment_model_to_schema(
@@ -81,20 +85,24 @@ async def get_equipment(
 
 @router.get("", dependencies=[Depends(pagination_ctx(CursorPage))])
 async def list_equipment(
+    request: Request,
     db: DatabaseDependency,
     storage_service: StorageServiceDependency,
     is_admin: IsAdminDependency,
 ) -> ResponseModel[CursorPage[schemas.EquipmentAdmin] | CursorPage[schemas.Equipment]]:
-    equipment = await paginate(
-        db,
-        select(models.Equipment).order_by(models.Equipment.id),
-        transformer=functools.partial(
-            equipment_models_to_schema,
-            is_admin=is_admin,
-            storage_service=storage_service,
-        ),
-    )
-    return ResponseModel(data=equipment)
+    async def build():
+        equipment = await paginate(
+            db,
+            select(models.Equipment).order_by(models.Equipment.id),
+            transformer=functools.partial(
+                equipment_models_to_schema,
+                is_admin=is_admin,
+                storage_service=storage_service,
+            ),
+        )
+        return ResponseModel(data=equipment)
+
+    return await equipment_cache.respond(request, is_admin, build)  # type: ignore
 
 
 @router.delete(
@@ -106,6 +114,8 @@ async def delete_equipment(
     equipment = await get_or_fail(models.Equipment, equipment_id, db)
     equipment.delete()
     await db.commit()
+    equipment_cache.clear()
+    exercises_cache.clear()
 
     return ResponseModel(data=None)
 
@@ -132,6 +142,8 @@ async def update_equipment(
         await db.delete(image)
 
     await db.commit()
+    equipment_cache.clear()
+    exercises_cache.clear()
 
     return ResponseModel(
         data=equipment_model_to_schema(
@@ -1,10 +1,13 @@
 from uuid import UUID
 
+from fitness_solutions_server.core.http_cache import ResponseCache
 from fitness_solutions_server.images.models import Image
 from fitness_solutions_server.storage.base import StorageService
 
 from . import models, schemas
 
+equipment_cache = ResponseCache()
+
 
 def equipment_model_to_schema(
     is_admin: bool, equipment: models.Equipment, storage_service: StorageService
@@ -1,12 +1,14 @@
-from sqlalchemy import Float
 from uuid import UUID, uuid4
 
-from sqlalchemy import Column, ForeignKey, Table, case
+from sqlalchemy import Column, Float, ForeignKey, Index, Table, case
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.mutable import MutableDict
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from fitness_solutions_server.core.localization import translation_hybrid
+from fitness_solutions_server.core.localization import (
+    translation_hybrid,
+    translations_search_text,
+)
 from fitness_solutions_server.core.models import Base, SoftDeleteMixin, TimestampMixin
 from fitness_solutions_server.equipment.models import Equipment
 from fitness_solutions_server.muscle_groups.models import BodyPart, MuscleGroup
@@ -45,12 +47,21 @@ body_part_ordering = {
 
 class Exercise(Base, TimestampMixin, SoftDeleteMixin):
     __tablename__ = "exercises"
+    __table_args__ = (
+        Index(
+            "ix_exercises_search_text_trgm",
+            "search_text",
+            postgresql_using="gin",
+            postgresql_ops={"search_text": "gin_trgm_ops"},
+        ),
+    )
 
     id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
     name_translations: Mapped[dict[str, str]] = mapped_column(
         MutableDict.as_mutable(JSONB())
     )
     name = translation_hybrid(name_translations)
+    search_text: Mapped[str] = translations_search_text("name_translations")
     en_name: Mapped[str]
     is_bodyweight: Mapped[bool]
     relative_bodyweight_intensity: Mapped[float] = mapped_column(Float)
@@ -58,13 +69,13 @@ class Exercise(Base, TimestampMixin, SoftDeleteMixin):
     model_3d_path: Mapped[str]
 
     equipment: Mapped[list[Equipment]] = relationship(
-        secondary=exercise_equipment, lazy="joined"
+        secondary=exercise_equipment, lazy="noload"
     )
     # We add ordering here to that the first one is the one used in list order
     # for exercises.
     muscle_groups: Mapped[list[MuscleGroup]] = relationship(
         secondary=exercise_muscle_groups,
-        lazy="joined",
+        lazy="noload",
         order_by=[
             case(body_part_ordering, value=MuscleGroup.body_part, else_=99),
             MuscleGroup.name,
@@ -1,35 +1,43 @@
 import functools
+from datetime import datetime
 from typing import Annotated
 from uuid import UUID, uuid4
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Request, status
 from fastapi_pagination import pagination_ctx
 from fastapi_pagination.ext.sqlalchemy import paginate
 from sqlalchemy import case, select, true
-from sqlalchemy.orm import aliased, selectinload
+from sqlalchemy.orm import aliased
 
 from fitness_solutions_server.admins.dependencies import (
     IsAdminDependency,
     require_admin_authentication_token,
 )
 from fitness_solutions_server.core.database import DatabaseDependency
+from fitness_solutions_server.core.dependencies import ReadDatabaseDependency
+from fitness_solutions_server.core.embeds import EmbedPlanner
 from fitness_solutions_server.core.schemas import ResponseModel
 from fitness_solutions_server.core.utils import (
     CursorPage,
     get_or_fail,
     get_or_fail_many,
+    search_by_similarity,
 )
 from fitness_solutions_server.equipment.models import Equipment
 from fitness_solutions_server.exercises.utils import (
     exercise_model_to_schema,
+    exercises_cache,
     exercises_models_to_schema,
     make_exercises_image_path,
+    plan_exercise,
 )
 from fitness_solutions_server.images.models import Image
 from fitness_solutions_server.muscle_groups.models import MuscleGroup
 from fitness_solutions_server.pr_observations.models import PRObservation
 from fitness_solutions_server.storage.base import StorageServiceDependency
 from fitness_solutions_server.users.dependencies import GetUserDependency
+from fitness_solutions_server.workouts.models import Workout, WorkoutExercise
+from fitness_solutions_server.workouts.utils import refresh_workout_facets
 
 from . import models, schemas
 
@@ -76,6 +84,7 @@ async def create(
     await db.delete(image)
 
     await db.commit()
+    exercises_cache.clear()
 
     return ResponseModel(
         data=exercise_model_to_schema(
@@ -87,11 +96,16 @@ async def create(
 @router.get("/{exercise_id}", summary="Get exercise by ID")
 async def get(
     exercise_id: UUID,
-    db: DatabaseDependency,
+    db: ReadDatabaseDependency,
     storage_service: StorageServiceDependency,
     is_admin: IsAdminDependency,
 ) -> ResponseModel[schemas.ExerciseAdmin | schemas.Exercise]:
-    exercise = await get_or_fail(models.Exercise, exercise_id, db)
+    exercise = await get_or_fail(
+        models.Exercise,
+        exercise_id,
+        db,
+        options=plan_exercise(EmbedPlanner()).options(),
+    )
     return ResponseModel(
         data=exercise_model_to_schema(
             is_admin=is_admin, exercise=exercise, storage_service=storage_service
@@ -103,7 +117,8 @@ async def get(
     "", summary="List exercises", dependencies=[Depends(pagination_ctx(CursorPage))]
 )
 async def list(
-    db: DatabaseDependency,
+    request: Request,
+    db: ReadDatabaseDependency,
     storage_service: StorageServiceDependency,
     is_admin: IsAdminDependency,
     user: GetUserDependency,
@@ -123,99 +138,111 @@ async def list(
     ] = None,
     embed: ExerciseEmbedQuery = None,
 ) -> ResponseModel[CursorPage[schemas.ExerciseAdmin] | CursorPage[schemas.Exercise]]:
-    query = (
-        select(models.Exercise)
-        .options(
-            selectinload(models.Exercise.muscle_groups),
-            selectinload(models.Exercise.equipment),
+    async def build():
+        query = (
+            select(models.Exercise)
+            .options(*plan_exercise(EmbedPlanner()).options())
+            .select_from(models.Exercise)
         )
-        .select_from(models.Exercise)
-    )
-
-    if embed is not None:
-        if schemas.ExerciseEmbed.latest_personal_record in embed and user is not None:
-            select_personal_record_statement = (
-                select(PRObservation)
-                .where(PRObservation.user_id == user.id)
-                .where(PRObservation.exercise_id == models.Exercise.id)
-                .order_by(PRObservation.created_at.desc())
-                .limit(1)
-                .lateral()
-            )
-            personal_record_alias = aliased(
-                PRObservation, select_personal_record_statement
-            )
-            query = query.add_columns(personal_record_alias).join(
-                personal_record_alias,
-                onclause=true(),
-                isouter=True,
-            )
 
-    # Filtering
+        if embed is not None:
+            if (
+                schemas.ExerciseEmbed.latest_personal_record in embed
+                and user is not None
+            ):
+                select_personal_record_statement = (
+                    select(PRObservation)
+                    .where(PRObservation.user_id == user.id)
+                    .where(PRObservation.exercise_id == models.Exercise.id)
+                    .order_by(PRObservation.created_at.desc())
+                    .limit(1)
+                    .lateral()
+                )
+                personal_record_alias = aliased(
+                    PRObservation, select_personal_record_statement
+                )
+                query = query.add_columns(personal_record_alias).join(
+                    personal_record_alias,
+                    onclause=true(),
+                    isouter=True,
+                )
 
-    # Performance can maybe be improved by manually using EXISTS
-    # instead of `any`, since it also joins `muscle_groups`
-    if muscle_groups_one_of is not None:
-        query = query.where(
-            models.Exercise.muscle_groups.any(MuscleGroup.id.in_(muscle_groups_one_of))
-        )
+        # Filtering
 
-    # Not performant, we should add indexes but hard due to localization.
-    if name is not None:
-        query = query.where(models.Exercise.name.ilike(f"%{name}%"))
-
-    # Ordering
-    match order_by:
-        case schemas.ExerciseListOrderBy.muscle_group:
-            # Create CTE selects a single muscle group name for each exercise
-            # NOTE: If the exercies does not have any muscle groups,
-            # it will be excluded from the results.
-            muscle_group_cte = (
-                select(
-                    models.exercise_muscle_groups.c.exercise_id,
-                    MuscleGroup.body_part,
-                    MuscleGroup.name.label("name"),
+        # Performance can maybe be improved by manually using EXISTS
+        # instead of `any`, since it also joins `muscle_groups`
+        if muscle_groups_one_of is not None:
+            query = query.where(
+                models.Exercise.muscle_groups.any(
+                    MuscleGroup.id.in_(muscle_groups_one_of)
                 )
-                .distinct(models.exercise_muscle_groups.c.exercise_id)
-                .join(
-                    MuscleGroup,
-                    models.exercise_muscle_groups.c.muscle_group_id == MuscleGroup.id,
+            )
+
+        if name is not None:
+            # Ranks by similarity first, the requested order breaks ties
+            query = search_by_similarity(query, models.Exercise.search_text, name)
+
+        # Ordering
+        match order_by:
+            case schemas.ExerciseListOrderBy.muscle_group:
+                # Create CTE selects a single muscle group name for each exercise
+                # NOTE: If the exercies does not have any muscle groups,
+                # it will be excluded from the results.
+                muscle_group_cte = (
+                    select(
+                        models.exercise_muscle_groups.c.exercise_id,
+                        MuscleGroup.body_part,
+                        MuscleGroup.name.label("name"),
+                    )
+                    .distinct(models.exercise_muscle_groups.c.exercise_id)
+                    .join(
+                        MuscleGroup,
+                        models.exercise_muscle_groups.c.muscle_group_id
+                        == MuscleGroup.id,
+                    )
+                    .order_by(
+                        models.exercise_muscle_groups.c.exercise_id,
+                        case(
+                            models.body_part_ordering,
+                            value=MuscleGroup.body_part,
+                            else_=99,
+                        ),
+                        MuscleGroup.name,
+                    )
+                    .cte()
                 )
-                .order_by(
-                    models.exercise_muscle_groups.c.exercise_id,
+                query = query.outerjoin(
+                    muscle_group_cte,
+                    models.Exercise.id == muscle_group_cte.c.exercise_id,
+                ).order_by(
                     case(
-                        models.body_part_ordering, value=MuscleGroup.body_part, else_=99
+                        models.body_part_ordering,
+                        value=muscle_group_cte.c.body_part,
+                        else_=99,
                     ),
-                    MuscleGroup.name,
+                    muscle_group_cte.c.name,
+                    models.Exercise.id,
                 )
-                .cte()
-            )
-            query = query.outerjoin(
-                muscle_group_cte,
-                models.Exercise.id == muscle_group_cte.c.exercise_id,
-            ).order_by(
-                case(
-                    models.body_part_ordering,
-                    value=muscle_group_cte.c.body_part,
-                    else_=99,
-                ),
-                muscle_group_cte.c.name,
-                models.Exercise.id,
-            )
-        case schemas.ExerciseListOrderBy.id:
-            query = query.order_by(models.Exercise.id)
+            case schemas.ExerciseListOrderBy.id:
+                query = query.order_by(models.Exercise.id)
+
+        exercises = await paginate(
+            db,
+            query,
+            transformer=functools.partial(
+                exercises_models_to_schema,
+                is_admin=is_admin,
+                storage_service=storage_service,
+            ),
+        )
 
-    exercises = await paginate(
-        db,
-        query,
-        transformer=functools.partial(
-            exercises_models_to_schema,
-            is_admin=is_admin,
-            storage_service=storage_service,
-        ),
-    )
+        return ResponseModel(data=exercises)
+
+    # Only the unfiltered list is the same for every caller
+    if muscle_groups_one_of is None and name is None and embed is None:
+        return await exercises_cache.respond(request, is_admin, build)  # type: ignore
 
-    return ResponseModel(data=exercises)
+    return await build()
 
 
 @router.delete(
@@ -227,6 +254,7 @@ async def delete(exercise_id: UUID, db: DatabaseDependency) -> ResponseModel[Non
     exercise = await get_or_fail(models.Exercise, exercise_id, db)
     exercise.delete()
     await db.commit()
+    exercises_cache.clear()
 
     return ResponseModel(data=None)
 
@@ -242,7 +270,12 @@ async def update(
     db: DatabaseDependency,
     storage_service: StorageServiceDependency,
 ) -> ResponseModel[schemas.ExerciseAdmin]:
-    exercise = await get_or_fail(models.Exercise, exercise_id, db)
+    exercise = await get_or_fail(
+        models.Exercise,
+        exercise_id,
+        db,
+        options=plan_exercise(EmbedPlanner()).options(),
+    )
 
     if exercise_update.is_bodyweight is not None:
         exercise.is_bodyweight = exercise_update.is_bodyweight
@@ -272,7 +305,25 @@ async def update(
         await storage_service.move(from_path=image.path, to_path=exercise.image_path)
         await db.delete(image)
 
+    if (
+        exercise_update.muscle_groups_ids is not None
+        or exercise_update.equipment_ids is not None
+    ):
+        # The associations are part of the exercise's representation, bump it
+        # even if no column of the exercise itself changed
+        exercise.updated_at = datetime.now().astimezone()
+        await db.flush()
+        await refresh_workout_facets(
+            db,
+            Workout.id.in_(
+                select(WorkoutExercise.workout_id).where(
+                    WorkoutExercise.exercise_id == exercise.id
+                )
+            ),
+        )
+
     await db.commit()
+    exercises_cache.clear()
 
     return ResponseModel(
         data=exercise_model_to_schema(
@@ -1,8 +1,16 @@
-from typing import Tuple, cast
+from datetime import datetime
+from typing import Any, Tuple, cast
 from uuid import UUID
 
+from sqlalchemy import ScalarSelect, Select, func, select
+from sqlalchemy.orm import QueryableAttribute
+
+from fitness_solutions_server.core.embeds import EmbedPlanner
+from fitness_solutions_server.core.http_cache import ResponseCache
+from fitness_solutions_server.equipment.models import Equipment
 from fitness_solutions_server.equipment.utils import equipment_models_to_schema
 from fitness_solutions_server.images.models import Image
+from fitness_solutions_server.muscle_groups.models import MuscleGroup
 from fitness_solutions_server.muscle_groups.utils import muscle_group_models_to_schema
 from fitness_solutions_server.pr_observations.models import PRObservation
 from fitness_solutions_server.pr_observations.utils import (
@@ -12,6 +20,56 @@ from fitness_solutions_server.storage.base import StorageService
 
 from . import models, schemas
 
+# Caches the unfiltered exercise list, which also embeds muscle groups and
+# equipment, so their admin handlers clear it as well
+exercises_cache = ResponseCache()
+
+
+def plan_exercise(
+    planner: EmbedPlanner, *path: QueryableAttribute[Any]
+) -> EmbedPlanner:
+    """
+    Loads the exercise at the end of `path` with the collections its schema
+    includes. Pass no path when loading exercises directly.
+    """
+    planner.add(*path, models.Exercise.muscle_groups)
+    planner.add(*path, models.Exercise.equipment)
+    return planner
+
+
+def exercises_updated_at(exercise_ids: Select[tuple[UUID]]) -> ScalarSelect[datetime]:
+    """
+    When the exercises in `exercise_ids`, or the muscle groups and equipment
+    their schema includes, last changed.
+    """
+    return (
+        select(
+            func.max(
+                func.greatest(
+                    models.Exercise.updated_at,
+                    MuscleGroup.updated_at,
+                    Equipment.updated_at,
+                )
+            )
+        )
+        .select_from(models.Exercise)
+        .outerjoin(
+            models.exercise_muscle_groups,
+            models.exercise_muscle_groups.c.exercise_id == models.Exercise.id,
+        )
+        .outerjoin(
+            MuscleGroup,
+            MuscleGroup.id == models.exercise_muscle_groups.c.muscle_group_id,
+        )
+        .outerjoin(
+            models.exercise_equipment,
+            models.exercise_equipment.c.exercise_id == models.Exercise.id,
+        )
+        .outerjoin(Equipment, Equipment.id == models.exercise_equipment.c.equipment_id)
+        .where(models.Exercise.id.in_(exercise_ids))
+        .scalar_subquery()
+    )
+
 
 def exercise_model_to_schema(
     is_admin: bool,
@@ -3,9 +3,9 @@ from __future__ import annotations
 from datetime import datetime
 from uuid import UUID, uuid4
 
-from sqlalchemy import Column, ForeignKey, Table, false, func, select, true
+from sqlalchemy import Column, ForeignKey, Index, Table, false, text
 from sqlalchemy.dialects.postgresql import CITEXT
-from sqlalchemy.orm import Mapped, column_property, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, query_expression, relationship
 
 from fitness_solutions_server.core.models import Base, Sex, TimestampMixin
 from fitness_solutions_server.countries.models import Country
@@ -29,6 +29,20 @@ fitness_coach_countries = Table(
 
 class FitnessCoach(TimestampMixin, Base):
     __tablename__ = "fitness_coaches"
+    __table_args__ = (
+        Index(
+            "ix_fitness_coaches_full_name_trgm",
+            "full_name",
+            postgresql_using="gin",
+            postgresql_ops={"full_name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_fitness_coaches_full_name_id",
+            "full_name",
+            "id",
+            postgresql_where=text("is_released"),
+        ),
+    )
 
     id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
     full_name: Mapped[str]
@@ -40,20 +54,9 @@ class FitnessCoach(TimestampMixin, Base):
     activation_token: Mapped[str | None] = mapped_column(unique=True)
     activated_at: Mapped[datetime | None]
     profile_image_path: Mapped[str]
-    number_of_workouts: Mapped[int] = column_property(
-        select(func.count(Workout.id))
-        .where(Workout.fitness_coach_id == id)
-        .where(Workout.is_released == true())
-        .correlate_except(Workout)
-        .scalar_subquery()
-    )
-    number_of_fitness_plans: Mapped[int] = column_property(
-        select(func.count(FitnessPlan.id))
-        .where(FitnessPlan.fitness_coach_id == id)
-        .where(FitnessPlan.is_released == true())
-        .correlate_except(FitnessPlan)
-        .scalar_subquery()
-    )
+    # Filled in batches by `utils.load_fitness_coach_counts`
+    number_of_workouts: Mapped[int | None] = query_expression()
+    number_of_fitness_plans: Mapped[int | None] = query_expression()
     is_released: Mapped[bool] = mapped_column(default=False, server_default=false())
 
     authentication_tokens: Mapped[
@@ -83,7 +86,7 @@ class FitnessCoachAuthenticationToken(TimestampMixin, Base):
     fitness_coach_id: Mapped[UUID] = mapped_column(
         ForeignKey("fitness_coaches.id", ondelete="CASCADE"), index=True
     )
-    expires_at: Mapped[datetime]
+    expires_at: Mapped[datetime] = mapped_column(index=True)
 
     fitness_coach: Mapped[FitnessCoach] = relationship(
         back_populates="authentication_tokens"
@@ -1,4 +1,4 @@
-from typing import Annotated
+from typing import Annotated, Sequence
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
@@ -11,18 +11,30 @@ from fitness_solutions_server.admins.dependencies import (
     IsAdminDependency,
     require_admin_authentication_token,
 )
+from fitness_solutions_server.catalog.utils import (
+    delete_fitness_coach_catalog_visibility,
+    refresh_fitness_coach_catalog_visibility,
+)
 from fitness_solutions_server.collections.models import CollectionItemFitnessCoach
 from fitness_solutions_server.core.config import settings
 from fitness_solutions_server.core.database import DatabaseDependency
+from fitness_solutions_server.core.dependencies import (
+    ReadDatabaseDependency,
+    invalidate_principal_tokens,
+)
+from fitness_solutions_server.core.http_cache import check_not_modified, weak_etag
+from fitness_solutions_server.core.localization import get_locale
 from fitness_solutions_server.core.schemas import ResponseModel
 from fitness_solutions_server.core.security import (
     security_token_to_code,
-    verify_password,
+    verify_password_async,
 )
 from fitness_solutions_server.core.utils import (
     CursorPage,
     get_or_fail,
     get_or_fail_many,
+    not_found,
+    search_by_similarity,
 )
 from fitness_solutions_server.countries.models import Country
 from fitness_solutions_server.fitness_coaches import models, schemas
@@ -40,6 +52,10 @@ from fitness_solutions_server.fitness_coaches.mapper import FitnessCoachMapperDe
 from fitness_solutions_server.fitness_coaches.service import (
     FitnessCoachServiceDependency,
 )
+from fitness_solutions_server.fitness_coaches.utils import (
+    fitness_coach_updated_at,
+    load_fitness_coach_counts,
+)
 from fitness_solutions_server.images.models import Image
 from fitness_solutions_server.users.dependencies import GetUserDependency
 from fitness_solutions_server.workouts.models import Workout
@@ -116,6 +132,7 @@ async def activate_fitness_coach(
 async def login(
     login_request: schemas.FitnessCoachLoginRequest,
     fitness_coaches: FitnessCoachServiceDependency,
+    db: DatabaseDependency,
     mapper: FitnessCoachMapperDependency,
 ) -> ResponseModel[schemas.FitnessCoachLoginResponse]:
     # Check credentials are correct
@@ -124,11 +141,17 @@ async def login(
         raise FitnessCoachInvalidCredentialsException()
     if fitness_coach.activated_at is None:
         raise FitnessCoachNotActivatedException()
-    if not verify_password(login_request.password, fitness_coach.password_hash):
+    (is_valid, new_password_hash) = await verify_password_async(
+        login_request.password, fitness_coach.password_hash
+    )
+    if not is_valid:
         raise FitnessCoachInvalidCredentialsException()
+    if new_password_hash is not None:
+        fitness_coach.password_hash = new_password_hash
 
     # Create authentication token
     unhashed_token = await fitness_coaches.create_auth_token(fitness_coach)
+    await load_fitness_coach_counts(db, [fitness_coach])
 
     # Return response
     return ResponseModel(
@@ -142,16 +165,33 @@ async def login(
 @router.get("/me")
 async def me(
     current_fitness_coach: RequireFitnessCoachDependency,
+    db: DatabaseDependency,
     mapper: FitnessCoachMapperDependency,
 ) -> ResponseModel[schemas.FitnessCoach]:
+    await load_fitness_coach_counts(db, [current_fitness_coach])
     return ResponseModel(data=mapper.fitness_coach_to_schema(current_fitness_coach))
 
 
 @router.get("/{fitness_coach_id}", summary="Get fitness coach by ID")
 async def get_by_id(
-    fitness_coach_id: UUID, db: DatabaseDependency, mapper: FitnessCoachMapperDependency
+    fitness_coach_id: UUID,
+    request: Request,
+    response: Response,
+    db: ReadDatabaseDependency,
+    mapper: FitnessCoachMapperDependency,
 ) -> ResponseModel[schemas.FitnessCoach]:
+    # Probe the version first, so revalidations skip loading and counting
+    updated_at = await db.scalar(select(fitness_coach_updated_at(fitness_coach_id)))
+    if updated_at is None:
+        raise not_found(models.FitnessCoach)
+
+    etag = weak_etag(updated_at, get_locale())
+    not_modified = check_not_modified(request, response, etag, updated_at)
+    if not_modified is not None:
+        return not_modified  # type: ignore
+
     fitness_coach = await get_or_fail(models.FitnessCoach, fitness_coach_id, db)
+    await load_fitness_coach_counts(db, [fitness_coach])
     return ResponseModel(data=mapper.fitness_coach_to_schema(fitness_coach))
 
 
@@ -163,7 +203,7 @@ async def get_by_id(
 async def list(
     user: GetUserDependency,
     mapper: FitnessCoachMapperDependency,
-    db: DatabaseDependency,
+    db: ReadDatabaseDependency,
     is_admin: IsAdminDependency,
     name: Annotated[str | None, Query(description="Search for names")] = None,
     country_id: Annotated[
@@ -174,9 +214,7 @@ async def list(
     ] = None,
     collection_id: Annotated[UUID | None, Query()] = None,
 ) -> ResponseModel[CursorPage[schemas.FitnessCoach]]:
-    query = select(models.FitnessCoach).order_by(
-        models.FitnessCoach.full_name, models.FitnessCoach.id
-    )
+    query = select(models.FitnessCoach)
 
     if country_id is not None:
         query = query.filter(models.FitnessCoach.countries.any(id=country_id))
@@ -184,7 +222,7 @@ async def list(
         query = query.filter(models.FitnessCoach.countries.any(id=user.country_id))
 
     if name is not None:
-        query = query.where(models.FitnessCoach.full_name.ilike(f"%{name}%"))
+        query = search_by_similarity(query, models.FitnessCoach.full_name, name)
 
     if collection_id is not None:
         exists_stmt = (
@@ -201,9 +239,13 @@ async def list(
         if not is_admin:
             query = query.where(models.FitnessCoach.is_released == true())
 
-    fitness_coaches = await paginate(
-        db, query, transformer=mapper.fitness_coaches_to_schema
-    )
+    query = query.order_by(models.FitnessCoach.full_name, models.FitnessCoach.id)
+
+    async def transformer(items: Sequence[models.FitnessCoach]):
+        await load_fitness_coach_counts(db, items)
+        return mapper.fitness_coaches_to_schema(items)
+
+    fitness_coaches = await paginate(db, query, transformer=transformer)
 
     return ResponseModel(data=fitness_coaches)
 
@@ -242,8 +284,11 @@ async def update_fitness_coach(
         target_fitness_coach.sex = update_request.sex
     if update_request.is_released is not None and is_admin:
         target_fitness_coach.is_released = update_request.is_released
+        await db.flush()
+        await refresh_fitness_coach_catalog_visibility(db, target_fitness_coach.id)
 
     await db.commit()
+    await load_fitness_coach_counts(db, [target_fitness_coach])
 
     return ResponseModel(data=mapper.fitness_coach_to_schema(target_fitness_coach))
 
@@ -262,6 +307,9 @@ async def delete(
     ):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
 
+    # Before the workouts are detached from the coach below
+    await delete_fitness_coach_catalog_visibility(db, target_fitness_coach.id)
+
     # Mark workouts as deleted
     await db.execute(
         update(Workout)
@@ -274,5 +322,6 @@ async def delete(
     await db.delete(target_fitness_coach)
 
     await db.commit()
+    invalidate_principal_tokens(target_fitness_coach.id)
 
     return ResponseModel(data=None)
@@ -11,7 +11,7 @@ from fitness_solutions_server.core.database import DatabaseDependency
 from fitness_solutions_server.core.security import (
     create_security_token,
     generate_authentication_token,
-    hash_password,
+    hash_password_async,
 )
 from fitness_solutions_server.fitness_coaches import models
 from fitness_solutions_server.fitness_coaches.utils import (
@@ -50,7 +50,7 @@ class FitnessCoachService:
             f"fitness-coaches/{fitness_coach.id}/{profile_image.file_name}"
         )
         fitness_coach.activation_token = hashed_activation_code
-        fitness_coach.password_hash = hash_password(str(uuid4()))
+        fitness_coach.password_hash = await hash_password_async(str(uuid4()))
         fitness_coach.profile_image_path = profile_image_path
         self.db.add(fitness_coach)
 
@@ -82,7 +82,7 @@ class FitnessCoachService:
         await self.db.delete(image)
 
     async def activate(self, password: str, fitness_coach: models.FitnessCoach):
-        fitness_coach.password_hash = hash_password(password)
+        fitness_coach.password_hash = await hash_password_async(password)
         fitness_coach.activated_at = datetime.utcnow()
         fitness_coach.activation_token = None
         await self.db.commit()
@@ -1,7 +1,18 @@
+from datetime import datetime
+from typing import Any, Iterable
+
 from pydantic import EmailStr
+from sqlalchemy import ColumnElement, func, literal, select, true, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+from sqlalchemy.orm.attributes import set_committed_value
 
 from fitness_solutions_server.core.config import settings
 from fitness_solutions_server.core.email import send_mail
+from fitness_solutions_server.fitness_plans.models import FitnessPlan
+from fitness_solutions_server.workouts.models import Workout
+
+from . import models
 
 
 async def send_fitness_coach_activation_email(email: str, token: str):
@@ -12,3 +23,69 @@ async def send_fitness_coach_activation_email(email: str, token: str):
         template="fitness_coach_activation",
         template_data={"url": url},
     )
+
+
+async def load_fitness_coach_counts(
+    db: AsyncSession, fitness_coaches: Iterable[models.FitnessCoach | None]
+):
+    """
+    Fills `number_of_workouts` and `number_of_fitness_plans` for all given
+    fitness coaches with a single query.
+    """
+    fitness_coaches_by_id = {fc.id: fc for fc in fitness_coaches if fc is not None}
+    if len(fitness_coaches_by_id) == 0:
+        return
+
+    query = union_all(
+        select(
+            literal("workouts").label("kind"),
+            Workout.fitness_coach_id,
+            func.count(),
+        )
+        .where(Workout.fitness_coach_id.in_(fitness_coaches_by_id.keys()))
+        .where(Workout.is_released == true())
+        .where(Workout.deleted_at.is_(None))
+        .group_by(Workout.fitness_coach_id),
+        select(
+            literal("fitness_plans").label("kind"),
+            FitnessPlan.fitness_coach_id,
+            func.count(),
+        )
+        .where(FitnessPlan.fitness_coach_id.in_(fitness_coaches_by_id.keys()))
+        .where(FitnessPlan.is_released == true())
+        .group_by(FitnessPlan.fitness_coach_id),
+    )
+    counts = {(kind, id): count for kind, id, count in await db.execute(query)}
+
+    for id, fitness_coach in fitness_coaches_by_id.items():
+        set_committed_value(
+            fitness_coach, "number_of_workouts", counts.get(("workouts", id), 0)
+        )
+        set_committed_value(
+            fitness_coach,
+            "number_of_fitness_plans",
+            counts.get(("fitness_plans", id), 0),
+        )
+
+
+def fitness_coach_updated_at(fitness_coach_id: Any) -> ColumnElement[datetime]:
+    """
+    When the fitness coach, or the counts in its schema, last changed.
+    Releasing or deleting a workout or fitness plan bumps its `updated_at`, so
+    the latest of those covers the counts without counting.
+    """
+    # Aliased so the subqueries never correlate to a workout or fitness plan
+    # in the enclosing query
+    workout = aliased(Workout)
+    fitness_plan = aliased(FitnessPlan)
+    return func.greatest(
+        select(models.FitnessCoach.updated_at)
+        .where(models.FitnessCoach.id == fitness_coach_id)
+        .scalar_subquery(),
+        select(func.max(workout.updated_at))
+        .where(workout.fitness_coach_id == fitness_coach_id)
+        .scalar_subquery(),
+        select(func.max(fitness_plan.updated_at))
+        .where(fitness_plan.fitness_coach_id == fitness_coach_id)
+        .scalar_subquery(),
+    )
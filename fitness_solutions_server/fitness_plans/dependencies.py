@@ -0,0 +1,223 @@
+from typing import Annotated, Hashable
+from uuid import UUID
+
+from fastapi import Depends, Query
+from sqlalchemy import Integer, Select, and_, cast, select, true
+from sqlalchemy.dialects.postgresql import Range
+
+from fitness_solutions_server.admins.dependencies import IsAdminDependency
+from fitness_solutions_server.catalog.models import CatalogItemType
+from fitness_solutions_server.catalog.utils import visible_catalog_items
+from fitness_solutions_server.collections.models import CollectionItemFitnessPlan
+from fitness_solutions_server.core.exceptions import InvalidAgeRangeException
+from fitness_solutions_server.core.models import ExperienceLevel, Focus, Sex
+from fitness_solutions_server.core.page_cache import filters_cache_key
+from fitness_solutions_server.core.utils import search_by_similarity
+from fitness_solutions_server.fitness_coaches.dependencies import (
+    GetFitnessCoachDependency,
+)
+from fitness_solutions_server.saved_fitness_plans.models import user_saved_fitness_plans
+from fitness_solutions_server.users.dependencies import GetUserDependency
+from fitness_solutions_server.workouts.models import Workout
+
+from . import models
+from .utils import is_saved_expression
+
+
+class FitnessPlanListFilters:
+    """
+    The filters shared by the fitness plan list and facet endpoints, including
+    which fitness plans the caller is allowed to see.
+    """
+
+    def __init__(
+        self,
+        is_admin: IsAdminDependency,
+        user: GetUserDependency,
+        fitness_coach: GetFitnessCoachDependency,
+        order_id: Annotated[
+            UUID | None, Query(description="Filter by order ID")
+        ] = None,
+        focus: Annotated[
+            set[Focus] | None, Query(description="Filter for specific focuses")
+        ] = None,
+        target_sex: Annotated[
+            Sex | None, Query(description="Filter for specific target sex")
+        ] = None,
+        min_age: Annotated[
+            int | None, Query(description="Lower bound (inclusive) for age", ge=0)
+        ] = None,
+        max_age: Annotated[
+            int | None, Query(description="Upper bound (inclusive) for age", ge=0)
+        ] = None,
+        fitness_coach_id: Annotated[
+            UUID | None, Query(description="Query for workouts by a fitness coach")
+        ] = None,
+        experience_level: Annotated[
+            ExperienceLevel | None,
+            Query(description="Filter for specific experience level"),
+        ] = None,
+        is_saved: Annotated[
+            bool | None,
+            Query(description="Filter for saved fitness plans (only for users)"),
+        ] = None,
+        name: Annotated[
+            str | None,
+            Query(description="Filter for names that contain the supplied value"),
+        ] = None,
+        age: Annotated[
+            int | None,
+            Query(
+                description=(
+                    "Can be used to filter for fitness plans for a specific age."
+                )
+            ),
+        ] = None,
+        equipment_subset_of: Annotated[
+            set[UUID] | None,
+            Query(
+                description=(
+                    "Filter for fitness plans that only need equipment from the list"
+                )
+            ),
+        ] = None,
+        collection_id: Annotated[UUID | None, Query()] = None,
+    ):
+        # Postgres rejects ranges whose lower bound is above the upper bound
+        if min_age is not None and max_age is not None and min_age > max_age:
+            raise InvalidAgeRangeException()
+
+        self.is_admin = is_admin
+        self.user = user
+        self.fitness_coach = fitness_coach
+        self.order_id = order_id
+        self.focus = focus
+        self.target_sex = target_sex
+        self.min_age = min_age
+        self.max_age = max_age
+        self.fitness_coach_id = fitness_coach_id
+        self.experience_level = experience_level
+        self.is_saved = is_saved
+        self.name = name
+        self.age = age
+        self.equipment_subset_of = equipment_subset_of
+        self.collection_id = collection_id
+
+    def shared_cache_key(self) -> Hashable | None:
+        """
+        Key for the results if every caller passing the same filters from the
+        same country gets them, None when they depend on who is asking.
+        """
+        if self.is_admin or self.fitness_coach is not None or self.is_saved is not None:
+            return None
+
+        return (
+            self.user is not None,
+            self.user.country_id if self.user is not None else None,
+            filters_cache_key(
+                {
+                    name: value
+                    for name, value in vars(self).items()
+                    if name not in ("is_admin", "user", "fitness_coach")
+                }
+            ),
+        )
+
+    def apply(self, query: Select) -> Select:
+        """
+        Adds the filters to a query selecting from `fitness_plans`. When searching
+        by name, matches are ordered by similarity before any later ordering.
+        """
+        user = self.user
+        fitness_coach = self.fitness_coach
+
+        if self.name is not None:
+            query = search_by_similarity(
+                query, models.FitnessPlan.search_text, self.name
+            )
+
+        if user is not None:
+            if self.is_saved:
+                # Starts from the user's saved rows instead of probing each plan
+                query = query.join(
+                    user_saved_fitness_plans,
+                    and_(
+                        user_saved_fitness_plans.c.fitness_plan_id
+                        == models.FitnessPlan.id,
+                        user_saved_fitness_plans.c.user_id == user.id,
+                    ),
+                )
+            elif self.is_saved is not None:
+                query = query.where(~is_saved_expression(user_id=user.id))
+            # Outside of collections users see the released plans offered in
+            # their country
+            query = query.where(
+                models.FitnessPlan.id.in_(
+                    visible_catalog_items(
+                        CatalogItemType.fitness_plan,
+                        user.country_id,
+                        is_released=True if self.collection_id is None else None,
+                    )
+                )
+            )
+
+        if self.order_id is not None and (self.is_admin or fitness_coach is not None):
+            query = query.where(models.FitnessPlan.order_id == self.order_id)
+        if self.focus is not None:
+            query = query.where(models.FitnessPlan.focus.in_(self.focus))
+        if self.experience_level is not None:
+            query = query.where(
+                models.FitnessPlan.experience_level == self.experience_level
+            )
+        if self.target_sex is not None:
+            query = query.where(models.FitnessPlan.target_sex == self.target_sex)
+        if self.min_age is not None or self.max_age is not None:
+            query = query.where(
+                models.FitnessPlan.age_range.contained_by(
+                    Range(self.min_age, self.max_age, bounds="[]")
+                )
+            )
+        if self.fitness_coach_id is not None:
+            query = query.where(
+                models.FitnessPlan.fitness_coach_id == self.fitness_coach_id
+            )
+        if self.age is not None:
+            query = query.where(
+                models.FitnessPlan.age_range.contains(cast(self.age, Integer))
+            )
+        if self.equipment_subset_of is not None:
+            # Excludes plans with any workout that needs other equipment
+            query = query.where(
+                ~select(models.FitnessPlanWeekWorkout.id)
+                .join(models.FitnessPlanWeek)
+                .join(Workout, Workout.id == models.FitnessPlanWeekWorkout.workout_id)
+                .where(models.FitnessPlanWeek.fitness_plan_id == models.FitnessPlan.id)
+                .where(~Workout.equipment_ids.contained_by([*self.equipment_subset_of]))
+                .exists()
+            )
+
+        if self.collection_id is not None:
+            query = query.where(
+                select(CollectionItemFitnessPlan.id)
+                .where(
+                    CollectionItemFitnessPlan.fitness_plan_id == models.FitnessPlan.id
+                )
+                .where(CollectionItemFitnessPlan.collection_id == self.collection_id)
+                .exists()
+            )
+        else:
+            # Allow coaches to see their own
+            if fitness_coach is not None:
+                query = query.where(
+                    models.FitnessPlan.fitness_coach_id == fitness_coach.id
+                )
+            elif not self.is_admin:
+                # Users and unauthenticated may be only see released fitness plans,
+                # for users this repeats the catalog check so the partial
+                # (created_at, id) index applies
+                query = query.where(models.FitnessPlan.is_released == true())
+
+        return query
+
+
+FitnessPlanListFiltersDependency = Annotated[FitnessPlanListFilters, Depends()]
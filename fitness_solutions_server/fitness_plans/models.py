@@ -4,29 +4,24 @@ import datetime
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
-from sqlalchemy import (
-    CheckConstraint,
-    ForeignKey,
-    Index,
-    Integer,
-    UniqueConstraint,
-    func,
-    select,
-    true,
-    type_coerce,
-)
-from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy import CheckConstraint, ForeignKey, Index, UniqueConstraint, text, true
+from sqlalchemy.dialects.postgresql import JSONB, Range
+
+# JSONB
 from sqlalchemy.ext.mutable import MutableDict
 from sqlalchemy.orm import Mapped, mapped_column, query_expression, relationship
 
-from fitness_solutions_server.core.localization import translation_hybrid
+from fitness_solutions_server.core.localization import (
+    translation_hybrid,
+    translations_search_text,
+)
 from fitness_solutions_server.core.models import (
     Base,
     ExperienceLevel,
     Focus,
     Sex,
     TimestampMixin,
+    target_age_range,
 )
 from fitness_solutions_server.equipment.models import Equipment
 from fitness_solutions_server.muscle_groups.models import MuscleGroup
@@ -45,6 +40,20 @@ class FitnessPlan(Base, TimestampMixin):
             "min_age >= 0 AND min_age <= max_age",
             name="fitness_plan_age_constraints",
         ),
+        Index("ix_fitness_plans_participants_count_id", "participants_count", "id"),
+        Index(
+            "ix_fitness_plans_created_at_id",
+            "created_at",
+            "id",
+            postgresql_where=text("is_released"),
+        ),
+        Index(
+            "ix_fitness_plans_search_text_trgm",
+            "search_text",
+            postgresql_using="gin",
+            postgresql_ops={"search_text": "gin_trgm_ops"},
+        ),
+        Index("ix_fitness_plans_age_range", "age_range", postgresql_using="gist"),
     )
 
     id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
@@ -52,6 +61,7 @@ class FitnessPlan(Base, TimestampMixin):
         MutableDict.as_mutable(JSONB())
     )
     name = translation_hybrid(name_translations)
+    search_text: Mapped[str] = translations_search_text("name_translations")
     description_translations: Mapped[dict[str, str]] = mapped_column(
         MutableDict.as_mutable(JSONB())
     )
@@ -67,7 +77,10 @@ class FitnessPlan(Base, TimestampMixin):
     target_sex: Mapped[Sex | None]
     min_age: Mapped[int | None]
     max_age: Mapped[int | None]
+    age_range: Mapped[Range[int]] = target_age_range()
     is_saved: Mapped[bool | None] = query_expression()
+    # Maintained by the participation handlers, see `fitness_plans.utils`
+    participants_count: Mapped[int] = mapped_column(default=0, server_default="0")
 
     fitness_coach: Mapped[FitnessCoach | None] = relationship(
         back_populates="fitness_plans", lazy="noload"
@@ -99,21 +112,6 @@ class FitnessPlan(Base, TimestampMixin):
         lazy="noload"
     )
 
-    @hybrid_property
-    def participants_count(self) -> int:
-        return len(self.participations)
-
-    @participants_count.inplace.expression
-    @classmethod
-    def _participants_count_expression(cls):
-        return type_coerce(
-            select(func.count())
-            .select_from(UserFitnessPlanParticipation)
-            .where(UserFitnessPlanParticipation.fitness_plan_id == cls.id)
-            .scalar_subquery(),
-            Integer,
-        )
-
 
 class FitnessPlanWeek(Base, TimestampMixin):
     __tablename__ = "fitness_plan_weeks"
@@ -180,9 +178,8 @@ class UserFitnessPlanParticipation(TimestampMixin, Base):
     __tablename__ = "user_fitness_plans_participations"
 
     id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
-    user_id: Mapped[UUID] = mapped_column(
-        ForeignKey("users.id", ondelete="CASCADE"), index=True
-    )
+    # Indexed by the partial unique index below, like in the migrations
+    user_id: Mapped[UUID] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
     fitness_plan_id: Mapped[UUID] = mapped_column(
         ForeignKey("fitness_plans.id"), index=True
     )
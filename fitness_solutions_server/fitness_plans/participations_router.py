@@ -9,7 +9,10 @@ from sqlalchemy import insert, select, update
 from fitness_solutions_server.core.database import DatabaseDependency
 from fitness_solutions_server.core.schemas import ResponseModel
 from fitness_solutions_server.core.utils import get_or_fail
-from fitness_solutions_server.fitness_plans.utils import leave_fitness_plan
+from fitness_solutions_server.fitness_plans.utils import (
+    increment_participants_count,
+    leave_fitness_plan,
+)
 from fitness_solutions_server.user_workouts.models import UserWorkout
 from fitness_solutions_server.users.dependencies import RequireUserDependency
 
@@ -71,6 +74,7 @@ async def join_fitness_plan(
     )
     db.add(participation)
     await db.flush()  # Flush to make sure participation ID is populated
+    await increment_participants_count(db, fitness_plan.id)
 
     # Create planned workouts
     workouts = (
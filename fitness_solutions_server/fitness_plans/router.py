@@ -1,42 +1,65 @@
-import functools
 from datetime import date, datetime, time, timedelta
-from typing import Annotated
+from typing import Annotated, Sequence
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from fastapi_pagination import pagination_ctx
 from fastapi_pagination.ext.sqlalchemy import paginate
-from sqlalchemy import and_, func, or_, select, true, update
-from sqlalchemy.orm import selectinload, with_expression
+from sqlalchemy import and_, func, select, true, update
 
 from fitness_solutions_server.admins.dependencies import IsAdminDependency
-from fitness_solutions_server.collections.models import CollectionItemFitnessPlan
+from fitness_solutions_server.catalog.models import CatalogItemType
+from fitness_solutions_server.catalog.utils import (
+    catalog_pages,
+    refresh_catalog_visibility,
+)
 from fitness_solutions_server.core.database import DatabaseDependency
-from fitness_solutions_server.core.models import ExperienceLevel, Focus, Sex
+from fitness_solutions_server.core.dependencies import ReadDatabaseDependency
+from fitness_solutions_server.core.embeds import EmbedPlanner
+from fitness_solutions_server.core.http_cache import check_not_modified, weak_etag
+from fitness_solutions_server.core.localization import get_locale
 from fitness_solutions_server.core.schemas import ResponseModel, SortOrder
-from fitness_solutions_server.core.utils import CursorPage, get_or_fail
-from fitness_solutions_server.countries.models import Country
+from fitness_solutions_server.core.utils import (
+    CursorPage,
+    get_or_fail,
+    not_found,
+    set_is_saved,
+)
 from fitness_solutions_server.fitness_coaches.dependencies import (
     GetFitnessCoachDependency,
     RequireFitnessCoachDependency,
 )
 from fitness_solutions_server.fitness_coaches.mapper import FitnessCoachMapperDependency
-from fitness_solutions_server.fitness_coaches.models import FitnessCoach
+from fitness_solutions_server.fitness_coaches.utils import load_fitness_coach_counts
+from fitness_solutions_server.fitness_plans.dependencies import (
+    FitnessPlanListFiltersDependency,
+)
 from fitness_solutions_server.fitness_plans.utils import (
+    count_fitness_plan_facets,
     fitness_plan_model_to_schema,
     fitness_plan_models_to_schema,
-    is_saved_expression,
+    fitness_plan_updated_at,
+    options_for_embeds,
+    plan_fitness_plan_embeds,
+    touch_fitness_plan,
     workout_to_week_status,
 )
 from fitness_solutions_server.orders.models import Order, OrderStatus, OrderType
+from fitness_solutions_server.saved_fitness_plans.utils import (
+    get_saved_fitness_plan_ids,
+)
 from fitness_solutions_server.storage.base import StorageServiceDependency
 from fitness_solutions_server.user_workouts.models import UserWorkout
 from fitness_solutions_server.users.dependencies import (
     GetUserDependency,
     RequireUserDependency,
 )
-from fitness_solutions_server.workouts.models import Workout, WorkoutExercise
-from fitness_solutions_server.workouts.utils import workout_model_to_schema
+from fitness_solutions_server.workouts.models import Workout
+from fitness_solutions_server.workouts.schemas import WorkoutEmbedOption
+from fitness_solutions_server.workouts.utils import (
+    plan_workout_embeds,
+    workout_model_to_schema,
+)
 
 from . import models, schemas
 
@@ -77,6 +100,10 @@ async def create(
     )
 
     db.add(fitness_plan)
+    await db.flush()
+    await refresh_catalog_visibility(
+        db, CatalogItemType.fitness_plan, models.FitnessPlan.id == fitness_plan.id
+    )
     await db.commit()
 
     return ResponseModel(
@@ -129,6 +156,10 @@ async def update_fitness_plan(
         fitness_plan.max_age = update_data["max_age"]
     if body.is_released is not None and is_admin:
         fitness_plan.is_released = body.is_released
+        await db.flush()
+        await refresh_catalog_visibility(
+            db, CatalogItemType.fitness_plan, models.FitnessPlan.id == fitness_plan.id
+        )
 
     await db.commit()
 
@@ -174,23 +205,12 @@ async def get_active(
         )
         .where(models.UserFitnessPlanParticipation.is_active == true())
         .limit(1)
-        .options(
-            selectinload(UserWorkout.workout)
-            .selectinload(Workout.workout_exercises)
-            .selectinload(WorkoutExercise.exercise),
-            selectinload(UserWorkout.workout)
-            .selectinload(Workout.workout_exercises)
-            .selectinload(WorkoutExercise.sets),
-        )
     )
 
-    if embed is not None:
-        if schemas.FitnessPlanEmbed.fitness_coach in embed:
-            query = query.options(selectinload(models.FitnessPlan.fitness_coach))
-        if schemas.FitnessPlanEmbed.muscle_groups in embed:
-            query = query.options(selectinload(models.FitnessPlan.muscle_groups))
-        if schemas.FitnessPlanEmbed.equipment in embed:
-            query = query.options(selectinload(models.FitnessPlan.equipment))
+    planner = plan_workout_embeds(
+        EmbedPlanner(), {WorkoutEmbedOption.exercises}, UserWorkout.workout
+    )
+    query = query.options(*plan_fitness_plan_embeds(planner, embed).options())
 
     row = (await db.execute(query)).first()
     print("row.UserWorkout = ", row.UserWorkout)
@@ -242,6 +262,7 @@ async def get_active(
                 elif workout.started_at.weekday() == 6:  # sunday
                     week_status.sunday = workout_to_week_status(workout)
             print("week_status = ", week_status)
+        await load_fitness_coach_counts(db, [row.FitnessPlan.fitness_coach])
         fitness_plan_schema = fitness_plan_model_to_schema(
             is_admin=False,
             auth_fitness_coach_id=None,
@@ -274,27 +295,57 @@ async def get_active(
         return ResponseModel(data=None)
 
 
+@router.get("/facets", summary="Count fitness plans per filter value")
+async def facets(
+    db: ReadDatabaseDependency, filters: FitnessPlanListFiltersDependency
+) -> ResponseModel[schemas.FitnessPlanFacets]:
+    filtered = (
+        filters.apply(
+            select(
+                models.FitnessPlan.id,
+                models.FitnessPlan.focus,
+                models.FitnessPlan.experience_level,
+                models.FitnessPlan.target_sex,
+            )
+        )
+        .order_by(None)
+        .subquery()
+    )
+    return ResponseModel(data=await count_fitness_plan_facets(db, filtered))
+
+
 @router.get("/{fitness_plan_id}", summary="Get fitness plan")
 async def get(
     fitness_plan_id: UUID,
+    request: Request,
+    response: Response,
     is_admin: IsAdminDependency,
     fitness_coach_mapper: FitnessCoachMapperDependency,
     fitness_coach: GetFitnessCoachDependency,
-    db: DatabaseDependency,
+    db: ReadDatabaseDependency,
     storage_service: StorageServiceDependency,
     embed: FitnessPlanEmbedQuery = None,
 ) -> ResponseModel[schemas.FitnessPlanPrivate | schemas.FitnessPlanPublic]:
-    options = []
-    if embed is not None:
-        if schemas.FitnessPlanEmbed.fitness_coach in embed:
-            options.append(selectinload(models.FitnessPlan.fitness_coach))
-        if schemas.FitnessPlanEmbed.muscle_groups in embed:
-            options.append(selectinload(models.FitnessPlan.muscle_groups))
-        if schemas.FitnessPlanEmbed.equipment in embed:
-            options.append(selectinload(models.FitnessPlan.equipment))
+    # Probe the version first, so revalidations never hydrate the plan
+    updated_at = await db.scalar(fitness_plan_updated_at(fitness_plan_id, embed))
+    if updated_at is None:
+        raise not_found(models.FitnessPlan)
+
+    etag = weak_etag(
+        updated_at,
+        sorted(embed or []),
+        get_locale(),
+        is_admin,
+        fitness_coach.id if fitness_coach is not None else None,
+    )
+    not_modified = check_not_modified(request, response, etag, updated_at)
+    if not_modified is not None:
+        return not_modified  # type: ignore
+
     fitness_plan = await get_or_fail(
-        models.FitnessPlan, fitness_plan_id, db, options=options
+        models.FitnessPlan, fitness_plan_id, db, options=options_for_embeds(embed)
     )
+    await load_fitness_coach_counts(db, [fitness_plan.fitness_coach])
 
     return ResponseModel(
         data=fitness_plan_model_to_schema(
@@ -313,151 +364,90 @@ async def get(
     "", summary="List fitness plans", dependencies=[Depends(pagination_ctx(CursorPage))]
 )
 async def list(
-    db: DatabaseDependency,
+    db: ReadDatabaseDependency,
+    primary_db: DatabaseDependency,
     is_admin: IsAdminDependency,
     fitness_coach_mapper: FitnessCoachMapperDependency,
     user: GetUserDependency,
     fitness_coach: GetFitnessCoachDependency,
     storage_service: StorageServiceDependency,
+    filters: FitnessPlanListFiltersDependency,
     embed: FitnessPlanEmbedQuery = None,
-    order_id: Annotated[UUID | None, Query(description="Filter by order ID")] = None,
     sort_by: Annotated[
         schemas.FitnessPlanSortBy, Query(description="Order results")
     ] = schemas.FitnessPlanSortBy.created_at,
     sort_order: SortOrder = SortOrder.desc,
-    focus: Annotated[
-        set[Focus] | None, Query(description="Filter for specific focuses")
-    ] = None,
-    target_sex: Annotated[
-        Sex | None, Query(description="Filter for specific target sex")
-    ] = None,
-    min_age: Annotated[
-        int | None, Query(description="Lower bound (inclusive) for age")
-    ] = None,
-    max_age: Annotated[
-        int | None, Query(description="Upper bound (inclusive) for age")
-    ] = None,
-    fitness_coach_id: Annotated[
-        UUID | None, Query(description="Query for workouts by a fitness coach")
-    ] = None,
-    experience_level: Annotated[
-        ExperienceLevel | None,
-        Query(description="Filter for specific experience level"),
-    ] = None,
-    is_saved: Annotated[
-        bool | None,
-        Query(description="Filter for saved fitness plans (only for users)"),
-    ] = None,
-    name: Annotated[
-        str | None,
-        Query(description="Filter for names that contain the supplied value"),
-    ] = None,
-    age: Annotated[
-        int | None,
-        Query(
-            description="Can be used to filter for fitness plans for a specific age."
-        ),
-    ] = None,
-    collection_id: Annotated[UUID | None, Query()] = None,
 ) -> ResponseModel[
     CursorPage[schemas.FitnessPlanPrivate] | CursorPage[schemas.FitnessPlanPublic]
 ]:
-    query = select(models.FitnessPlan)
+    query = filters.apply(select(models.FitnessPlan))
 
     match sort_by:
         case schemas.FitnessPlanSortBy.created_at:
             query = query.order_by(
-                (
-                    models.FitnessPlan.created_at.desc()
+                # Both keys follow the sort order so the (created_at, id) index
+                # can serve the keyset pagination
+                *(
+                    (models.FitnessPlan.created_at.desc(), models.FitnessPlan.id.desc())
                     if sort_order == SortOrder.desc
-                    else models.FitnessPlan.created_at.asc()
+                    else (
+                        models.FitnessPlan.created_at.asc(),
+                        models.FitnessPlan.id.asc(),
+                    )
                 ),
-                models.FitnessPlan.id,
             )
         case schemas.FitnessPlanSortBy.participants_count:
             query = query.order_by(
-                (
-                    models.FitnessPlan.participants_count.desc()
+                # Both keys follow the sort order so the (participants_count, id) index
+                # can serve the keyset pagination
+                *(
+                    (
+                        models.FitnessPlan.participants_count.desc(),
+                        models.FitnessPlan.id.desc(),
+                    )
                     if sort_order == SortOrder.desc
-                    else models.FitnessPlan.participants_count.asc()
+                    else (
+                        models.FitnessPlan.participants_count.asc(),
+                        models.FitnessPlan.id.asc(),
+                    )
                 ),
-                models.FitnessPlan.id,
-            )
-
-    if user is not None:
-        is_saved_exp = is_saved_expression(user_id=user.id).label("is_saved")
-        query = query.options(
-            with_expression(models.FitnessPlan.is_saved, is_saved_exp)
-        )
-        if is_saved is not None:
-            query = query.where(is_saved_exp == is_saved)
-        query = query.where(
-            models.FitnessPlan.fitness_coach.has(
-                FitnessCoach.countries.any(Country.id == user.country_id)
             )
-        )
 
-    if embed is not None:
-        if schemas.FitnessPlanEmbed.fitness_coach in embed:
-            query = query.options(selectinload(models.FitnessPlan.fitness_coach))
-        if schemas.FitnessPlanEmbed.muscle_groups in embed:
-            query = query.options(selectinload(models.FitnessPlan.muscle_groups))
-        if schemas.FitnessPlanEmbed.equipment in embed:
-            query = query.options(selectinload(models.FitnessPlan.equipment))
-    if order_id is not None and (is_admin or fitness_coach is not None):
-        query = query.where(models.FitnessPlan.order_id == order_id)
-    if focus is not None:
-        query = query.where(models.FitnessPlan.focus.in_(focus))
-    if experience_level is not None:
-        query = query.where(models.FitnessPlan.experience_level == experience_level)
-    if target_sex is not None:
-        query = query.where(models.FitnessPlan.target_sex == target_sex)
-    if min_age is not None:
-        query = query.where(models.FitnessPlan.min_age >= min_age)
-    if max_age is not None:
-        query = query.where(models.FitnessPlan.max_age <= max_age)
-    if fitness_coach_id is not None:
-        query = query.filter(models.FitnessPlan.fitness_coach_id == fitness_coach_id)
-    if name is not None:
-        # Not performant, we should add indexes but hard due to localization.
-        query = query.where(models.FitnessPlan.name.ilike(f"%{name}%"))
-    if age is not None:
-        query = query.where(
-            or_(models.FitnessPlan.min_age.is_(None), models.FitnessPlan.min_age <= age)
-        ).where(
-            or_(models.FitnessPlan.max_age.is_(None), models.FitnessPlan.max_age >= age)
-        )
+    options = options_for_embeds(embed)
+    saved_ids = (
+        await get_saved_fitness_plan_ids(primary_db, user.id)
+        if user is not None
+        else None
+    )
 
-    if collection_id is not None:
-        exists_stmt = (
-            select(CollectionItemFitnessPlan.id)
-            .where(CollectionItemFitnessPlan.fitness_plan_id == models.FitnessPlan.id)
-            .exists()
-        )
-        query = query.where(
-            exists_stmt.where(CollectionItemFitnessPlan.collection_id == collection_id)
-        )
-    else:
-        # Allow coaches to see their own
-        if fitness_coach is not None:
-            query = query.where(models.FitnessPlan.fitness_coach_id == fitness_coach.id)
-        elif not is_admin:
-            # Users and unauthenticated may be only see released fitness plans
-            query = query.where(models.FitnessPlan.is_released == true())
-
-    fitness_plans = await paginate(
-        db,
-        query,
-        transformer=functools.partial(
-            fitness_plan_models_to_schema,
+    async def transformer(items: Sequence[models.FitnessPlan]):
+        if saved_ids is not None:
+            set_is_saved(items, saved_ids)
+        await load_fitness_coach_counts(db, [fp.fitness_coach for fp in items])
+        return fitness_plan_models_to_schema(
+            items,
             is_admin=is_admin,
-            auth_fitness_coach_id=fitness_coach_id
+            auth_fitness_coach_id=fitness_coach.id
             if fitness_coach is not None
             else None,
             fitness_coach_mapper=fitness_coach_mapper,
             storage_service=storage_service,
-        ),
-    )
+        )
+
+    shared_key = filters.shared_cache_key()
+    if shared_key is None:
+        fitness_plans = await paginate(
+            db, query.options(*options), transformer=transformer
+        )
+    else:
+        fitness_plans = await catalog_pages[CatalogItemType.fitness_plan].paginate(
+            db,
+            (shared_key, sort_by, sort_order),
+            query,
+            models.FitnessPlan,
+            options,
+            transformer,
+        )
 
     return ResponseModel(data=fitness_plans)
 
@@ -491,6 +481,7 @@ async def create_week(
     ).one() + 1
     fitness_plan_week = models.FitnessPlanWeek(order=next_order_number)
     fitness_plan.weeks.append(fitness_plan_week)
+    touch_fitness_plan(fitness_plan)
 
     await db.commit()
 
@@ -524,6 +515,7 @@ async def delete_week(
         .where(models.FitnessPlanWeek.order > week.order)
         .values(order=models.FitnessPlanWeek.order - 1)
     )
+    touch_fitness_plan(fitness_plan)
 
     await db.commit()
     return ResponseModel(data=None)
@@ -572,6 +564,7 @@ async def create_week_workout(
         order=next_order_number, workout=workout
     )
     week.workout_associations.append(fitness_plan_week_workout)
+    touch_fitness_plan(fitness_plan)
 
     await db.commit()
 
@@ -613,6 +606,7 @@ async def delete_week_wokrout(
         .where(models.FitnessPlanWeekWorkout.order > fitness_plan_week_workout.order)
         .values(order=models.FitnessPlanWeekWorkout.order - 1)
     )
+    touch_fitness_plan(fitness_plan)
 
     await db.commit()
     return ResponseModel(data=None)
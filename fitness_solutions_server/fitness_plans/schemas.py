@@ -6,7 +6,7 @@ from pydantic import BaseModel, Field, validator
 
 from fitness_solutions_server.core.localization import TranslationDict
 from fitness_solutions_server.core.models import ExperienceLevel, Focus, Sex, Weekday
-from fitness_solutions_server.core.schemas import TimestampMixin
+from fitness_solutions_server.core.schemas import FacetCount, TimestampMixin
 from fitness_solutions_server.equipment.schemas import Equipment
 from fitness_solutions_server.fitness_coaches.schemas import FitnessCoach
 from fitness_solutions_server.muscle_groups.schemas import MuscleGroup
@@ -162,3 +162,11 @@ class FitnessPlanActive(FitnessPlanPublic):
 
     class Config:
         orm_mode = True
+
+
+class FitnessPlanFacets(BaseModel):
+    focus: list[FacetCount]
+    experience_level: list[FacetCount]
+    target_sex: list[FacetCount]
+    muscle_groups: list[FacetCount]
+    equipment: list[FacetCount]
@@ -1,18 +1,37 @@
 from datetime import date, datetime, time
-from typing import cast
+from typing import Sequence, cast
 from uuid import UUID
 
-from sqlalchemy import delete, literal, select, update
+from sqlalchemy import (
+    ColumnElement,
+    SQLColumnExpression,
+    Subquery,
+    delete,
+    func,
+    literal,
+    select,
+    true,
+    union_all,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.interfaces import ORMOption
 
+from fitness_solutions_server.core.embeds import EmbedPlanner
+from fitness_solutions_server.core.schemas import FacetCount
+from fitness_solutions_server.core.utils import count_facet_values
 from fitness_solutions_server.equipment.models import Equipment
 from fitness_solutions_server.equipment.utils import equipment_models_to_schema
+from fitness_solutions_server.exercises.utils import exercises_updated_at
 from fitness_solutions_server.fitness_coaches.mapper import FitnessCoachMapper
+from fitness_solutions_server.fitness_coaches.utils import fitness_coach_updated_at
 from fitness_solutions_server.muscle_groups.schemas import MuscleGroup
 from fitness_solutions_server.muscle_groups.utils import muscle_group_models_to_schema
 from fitness_solutions_server.saved_fitness_plans.models import user_saved_fitness_plans
 from fitness_solutions_server.storage.base import StorageService
 from fitness_solutions_server.user_workouts.models import UserWorkout
+from fitness_solutions_server.user_workouts.utils import subtract_completed_counts
+from fitness_solutions_server.workouts.models import Workout, WorkoutExercise
 
 from . import models, schemas
 
@@ -21,11 +40,12 @@ async def leave_fitness_plan(participation_id: UUID, db: AsyncSession):
     """
     Deletes all future planned workouts
     """
-    await db.execute(
-        delete(UserWorkout)
-        .where(UserWorkout.fitness_plan_participation_id == participation_id)
-        .where(UserWorkout.started_at >= datetime.combine(datetime.utcnow(), time.min))
+    criteria = (
+        UserWorkout.fitness_plan_participation_id == participation_id,
+        UserWorkout.started_at >= datetime.combine(datetime.utcnow(), time.min),
     )
+    await subtract_completed_counts(db, *criteria)
+    await db.execute(delete(UserWorkout).where(*criteria))
     await db.execute(
         update(models.UserFitnessPlanParticipation)
         .where(models.UserFitnessPlanParticipation.id == participation_id)
@@ -33,6 +53,46 @@ async def leave_fitness_plan(participation_id: UUID, db: AsyncSession):
     )
 
 
+async def increment_participants_count(db: AsyncSession, fitness_plan_id: UUID):
+    # Keep updated_at, counters are not part of the resource's content
+    await db.execute(
+        update(models.FitnessPlan)
+        .where(models.FitnessPlan.id == fitness_plan_id)
+        .values(
+            participants_count=models.FitnessPlan.participants_count + 1,
+            updated_at=models.FitnessPlan.updated_at,
+        )
+    )
+
+
+async def subtract_participants_counts(
+    db: AsyncSession, *criteria: ColumnElement[bool]
+):
+    """
+    Decrements `FitnessPlan.participants_count` for the participations matching
+    `criteria`. Must be called in the same transaction, before they are deleted.
+    """
+    participations = (
+        select(
+            models.UserFitnessPlanParticipation.fitness_plan_id,
+            func.count().label("count"),
+        )
+        .where(*criteria)
+        .group_by(models.UserFitnessPlanParticipation.fitness_plan_id)
+        .subquery()
+    )
+    await db.execute(
+        update(models.FitnessPlan)
+        .where(models.FitnessPlan.id == participations.c.fitness_plan_id)
+        .values(
+            participants_count=models.FitnessPlan.participants_count
+            - participations.c.count,
+            updated_at=models.FitnessPlan.updated_at,
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
 def workout_to_week_status(workout: UserWorkout) -> schemas.WeekStatus:
     if workout.completed_at is not None:
         return schemas.WeekStatus.done
@@ -105,7 +165,7 @@ def fitness_plan_model_to_schema(
 
 
 def fitness_plan_models_to_schema(
-    fitness_plans: list[models.FitnessPlan],
+    fitness_plans: Sequence[models.FitnessPlan],
     is_admin: bool,
     auth_fitness_coach_id: UUID | None,
     fitness_coach_mapper: FitnessCoachMapper,
@@ -126,6 +186,78 @@ def fitness_plan_models_to_schema(
     )
 
 
+def plan_fitness_plan_embeds(
+    planner: EmbedPlanner, embeds: set[schemas.FitnessPlanEmbed] | None
+) -> EmbedPlanner:
+    if embeds is None:
+        return planner
+
+    if schemas.FitnessPlanEmbed.fitness_coach in embeds:
+        planner.add(models.FitnessPlan.fitness_coach)
+    if schemas.FitnessPlanEmbed.muscle_groups in embeds:
+        planner.add(models.FitnessPlan.muscle_groups)
+    if schemas.FitnessPlanEmbed.equipment in embeds:
+        planner.add(models.FitnessPlan.equipment)
+
+    return planner
+
+
+def options_for_embeds(
+    embeds: set[schemas.FitnessPlanEmbed] | None,
+) -> list[ORMOption]:
+    return plan_fitness_plan_embeds(EmbedPlanner(), embeds).options()
+
+
+def fitness_plan_updated_at(
+    fitness_plan_id: UUID, embeds: set[schemas.FitnessPlanEmbed] | None
+):
+    """
+    Selects when the fitness plan detail response last changed, including the
+    embedded fitness coach, muscle groups and equipment, without hydrating the
+    plan.
+    """
+    versions: list[SQLColumnExpression[datetime]] = [models.FitnessPlan.updated_at]
+    if embeds is not None and schemas.FitnessPlanEmbed.fitness_coach in embeds:
+        versions.append(fitness_coach_updated_at(models.FitnessPlan.fitness_coach_id))
+    if embeds is not None and (
+        schemas.FitnessPlanEmbed.muscle_groups in embeds
+        or schemas.FitnessPlanEmbed.equipment in embeds
+    ):
+        # Both come from the exercises of the plan's workouts. Week changes
+        # bump the plan and workout exercise changes bump the workout.
+        workout_ids = (
+            select(models.FitnessPlanWeekWorkout.workout_id)
+            .join(models.FitnessPlanWeekWorkout.fitness_plan_week)
+            .where(models.FitnessPlanWeek.fitness_plan_id == models.FitnessPlan.id)
+            # Nested in other subqueries, so it does not correlate on its own
+            .correlate(models.FitnessPlan)
+        )
+        versions.append(
+            select(func.max(Workout.updated_at))
+            .where(Workout.id.in_(workout_ids))
+            .scalar_subquery()
+        )
+        versions.append(
+            exercises_updated_at(
+                select(WorkoutExercise.exercise_id).where(
+                    WorkoutExercise.workout_id.in_(workout_ids)
+                )
+            )
+        )
+
+    return select(func.greatest(*versions)).where(
+        models.FitnessPlan.id == fitness_plan_id
+    )
+
+
+def touch_fitness_plan(fitness_plan: models.FitnessPlan):
+    """
+    Bumps `updated_at` when the weeks change, they are part of the plan's
+    representation but don't change any column of the plan itself.
+    """
+    fitness_plan.updated_at = datetime.now().astimezone()
+
+
 def is_saved_expression(user_id: UUID):
     return (
         select(literal(1, literal_execute=True))
@@ -134,3 +266,69 @@ def is_saved_expression(user_id: UUID):
         .where(user_saved_fitness_plans.c.fitness_plan_id == models.FitnessPlan.id)
         .exists()
     )
+
+
+async def count_fitness_plan_facets(
+    db: AsyncSession, filtered: Subquery
+) -> schemas.FitnessPlanFacets:
+    """
+    Counts the fitness plans in `filtered` per facet value with a single query.
+    `filtered` must select `id` and the facet columns of `fitness_plans`.
+    Muscle groups and equipment come from the workouts in the plan's weeks.
+    """
+    plan_workouts = (
+        select(
+            models.FitnessPlanWeek.fitness_plan_id,
+            Workout.muscle_group_ids,
+            Workout.equipment_ids,
+        )
+        .join(models.FitnessPlanWeek.workout_associations)
+        .join(Workout, Workout.id == models.FitnessPlanWeekWorkout.workout_id)
+        .where(models.FitnessPlanWeek.fitness_plan_id == filtered.c.id)
+        .lateral()
+    )
+    muscle_group_ids = (
+        func.unnest(plan_workouts.c.muscle_group_ids)
+        .table_valued("value")
+        .render_derived()
+        .lateral()
+    )
+    equipment_ids = (
+        func.unnest(plan_workouts.c.equipment_ids)
+        .table_valued("value")
+        .render_derived()
+        .lateral()
+    )
+
+    query = union_all(
+        count_facet_values("focus", filtered.c.focus),
+        count_facet_values("experience_level", filtered.c.experience_level),
+        count_facet_values("target_sex", filtered.c.target_sex),
+        count_facet_values(
+            "muscle_groups", muscle_group_ids.c.value, distinct_on=filtered.c.id
+        )
+        .select_from(filtered)
+        .join(plan_workouts, true())
+        .join(muscle_group_ids, true()),
+        count_facet_values(
+            "equipment", equipment_ids.c.value, distinct_on=filtered.c.id
+        )
+        .select_from(filtered)
+        .join(plan_workouts, true())
+        .join(equipment_ids, true()),
+    )
+
+    counts: dict[str, list[FacetCount]] = {
+        facet: []
+        for facet in (
+            "focus",
+            "experience_level",
+            "target_sex",
+            "muscle_groups",
+            "equipment",
+        )
+    }
+    for facet, value, count in await db.execute(query):
+        counts[facet].append(FacetCount(value=value, count=count))
+
+    return schemas.FitnessPlanFacets(**counts)
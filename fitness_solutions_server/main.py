@@ -1,4 +1,6 @@
+import asyncio
 import logging
+from contextlib import asynccontextmanager
 
 from fastapi import APIRouter, Depends, FastAPI
 from fastapi.exceptions import RequestValidationError
@@ -7,11 +9,26 @@ from fastapi_pagination import add_pagination
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from fitness_solutions_server.core.config import settings
+from fitness_solutions_server.core.database import (
+    async_engine,
+    read_async_engine,
+    warm_up_pool,
+)
 from fitness_solutions_server.core.exceptions import (
     AppException,
     custom_exception_handler,
 )
+from fitness_solutions_server.core.instrumentation import (
+    SQLInstrumentationMiddleware,
+    instrument_engine,
+)
 from fitness_solutions_server.core.localization import accept_language_dependency
+from fitness_solutions_server.core.security import shutdown_password_executor
+from fitness_solutions_server.core.tasks import (
+    delete_expired_authentication_tokens,
+    run_periodically,
+)
+from fitness_solutions_server.storage.base import create_storage_service
 
 from .admins import router as admins_router
 from .collections import router as collections_router
@@ -40,13 +57,36 @@ logging.basicConfig(
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
 )
 
-app = FastAPI(dependencies=[Depends(accept_language_dependency)])
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    app.state.storage_service = create_storage_service()
+    await warm_up_pool(settings.DATABASE_POOL_WARM_UP_CONNECTIONS)
+    token_reaper = asyncio.create_task(
+        run_periodically(
+            settings.AUTH_TOKEN_REAPER_INTERVAL, delete_expired_authentication_tokens
+        )
+    )
+    try:
+        yield
+    finally:
+        token_reaper.cancel()
+        shutdown_password_executor()
+        await app.state.storage_service.close()
+
+
+app = FastAPI(dependencies=[Depends(accept_language_dependency)], lifespan=lifespan)
 add_pagination(app)
 app.add_exception_handler(AppException, custom_exception_handler)
 app.add_exception_handler(RequestValidationError, custom_exception_handler)
 app.add_exception_handler(StarletteHTTPException, custom_exception_handler)
 app.add_exception_handler(Exception, custom_exception_handler)
 
+instrument_engine(async_engine.sync_engine)
+if read_async_engine is not async_engine:
+    instrument_engine(read_async_engine.sync_engine)
+app.add_middleware(SQLInstrumentationMiddleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=[settings.BASE_URL],
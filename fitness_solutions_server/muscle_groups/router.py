@@ -1,6 +1,6 @@
 from uuid import UUID, uuid4
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, status
 from sqlalchemy import select
 
 from fitness_solutions_server.admins.dependencies import (
@@ -10,11 +10,13 @@ from fitness_solutions_server.admins.dependencies import (
 from fitness_solutions_server.core.database import DatabaseDependency
 from fitness_solutions_server.core.schemas import ResponseModel
 from fitness_solutions_server.core.utils import get_or_fail
+from fitness_solutions_server.exercises.utils import exercises_cache
 from fitness_solutions_server.images.models import Image
 from fitness_solutions_server.muscle_groups.utils import (
     make_muscle_group_image_path,
     muscle_group_model_to_schema,
     muscle_group_models_to_schema,
+    muscle_groups_cache,
 )
 from fitness_solutions_server.storage.base import StorageServiceDependency
 
@@ -55,6 +57,8 @@ async def create_muscle_group(
     await db.delete(image)
 
     await db.commit()
+    muscle_groups_cache.clear()
+    exercises_cache.clear()
 
     return ResponseModel(
         data=muscle_group_model_to_schema(
@@ -82,17 +86,21 @@ async def get_muscle_group(
 
 @router.get("", summary="List muscle groups")
 async def list_muscle_groups(
+    request: Request,
     db: DatabaseDependency,
     storage_service: StorageServiceDependency,
     is_admin: IsAdminDependency,
 ) -> ResponseModel[list[schemas.MuscleGroupAdmin] | list[schemas.MuscleGroup]]:
-    muscle_groups_db = (await db.scalars(select(models.MuscleGroup))).all()
-    muscle_groups = muscle_group_models_to_schema(
-        muscle_groups=muscle_groups_db,
-        is_admin=is_admin,
-        storage_service=storage_service,
-    )
-    return ResponseModel(data=muscle_groups)
+    async def build():
+        muscle_groups_db = (await db.scalars(select(models.MuscleGroup))).all()
+        muscle_groups = muscle_group_models_to_schema(
+            muscle_groups=muscle_groups_db,
+            is_admin=is_admin,
+            storage_service=storage_service,
+        )
+        return ResponseModel(data=muscle_groups)
+
+    return await muscle_groups_cache.respond(request, is_admin, build)  # type: ignore
 
 
 @router.delete(
@@ -104,6 +112,8 @@ async def delete_muscle_group(
     muscle_group = await get_or_fail(models.MuscleGroup, muscle_group_id, db)
     muscle_group.delete()
     await db.commit()
+    muscle_groups_cache.clear()
+    exercises_cache.clear()
 
     return ResponseModel(data=None)
 
@@ -136,6 +146,8 @@ async def update_muscle_group(
         await db.delete(image)
 
     await db.commit()
+    muscle_groups_cache.clear()
+    exercises_cache.clear()
 
     return ResponseModel(
         data=muscle_group_model_to_schema(
@@ -1,11 +1,14 @@
 from typing import Sequence
 from uuid import UUID
 
+from fitness_solutions_server.core.http_cache import ResponseCache
 from fitness_solutions_server.images.models import Image
 from fitness_solutions_server.storage.base import StorageService
 
 from . import models, schemas
 
+muscle_groups_cache = ResponseCache()
+
 
 def muscle_group_model_to_schema(
     is_admin: bool, muscle_group: models.MuscleGroup, storage_service: StorageService
@@ -11,6 +11,8 @@ from fitness_solutions_server.admins.dependencies import (
     IsAdminDependency,
     require_admin_authentication_token,
 )
+from fitness_solutions_server.catalog.models import CatalogItemType
+from fitness_solutions_server.catalog.utils import delete_catalog_visibility
 from fitness_solutions_server.core.database import DatabaseDependency
 from fitness_solutions_server.core.schemas import ResponseModel
 from fitness_solutions_server.core.utils import CursorPage, get_or_fail
@@ -82,6 +84,10 @@ async def delete(order_id: UUID, db: DatabaseDependency) -> ResponseModel[None]:
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="You can't delete approved orders.",
         )
+    # Fitness plans are deleted along with their order
+    await delete_catalog_visibility(
+        db, CatalogItemType.fitness_plan, FitnessPlan.order_id == order.id
+    )
     await db.delete(order)
     await db.commit()
     return ResponseModel(data=None)
@@ -130,7 +136,7 @@ async def list(
     """
 
     query = select(models.Order).order_by(
-        models.Order.created_at.desc(), models.Order.id
+        models.Order.created_at.desc(), models.Order.id.desc()
     )
 
     if fitness_coach:
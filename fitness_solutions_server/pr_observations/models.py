@@ -30,4 +30,9 @@ class PRObservation(TimestampMixin, Base):
         back_populates="pr_observations", lazy="noload"
     )
 
-    __table_args__ = (Index(None, user_id, exercise_id),)
+    __table_args__ = (
+        Index(None, user_id, exercise_id),
+        Index(
+            "ix_pr_observations_user_id_created_at_id", "user_id", "created_at", "id"
+        ),
+    )
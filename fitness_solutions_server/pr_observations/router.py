@@ -6,13 +6,15 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi_pagination import pagination_ctx
 from fastapi_pagination.ext.sqlalchemy import paginate
 from sqlalchemy import alias, join, select, true
-from sqlalchemy.orm import aliased, selectinload
+from sqlalchemy.orm import aliased
 
 from fitness_solutions_server.admins.dependencies import IsAdminDependency
 from fitness_solutions_server.core.database import DatabaseDependency
+from fitness_solutions_server.core.embeds import EmbedPlanner
 from fitness_solutions_server.core.schemas import ResponseModel
 from fitness_solutions_server.core.utils import CursorPage, get_or_fail
 from fitness_solutions_server.exercises.models import Exercise
+from fitness_solutions_server.exercises.utils import plan_exercise
 from fitness_solutions_server.pr_observations.utils import (
     pr_observation_models_to_schema,
 )
@@ -88,9 +90,13 @@ async def list_pr_observation(
     query = (
         select(models.PRObservation)
         .where(models.PRObservation.user_id == user.id)
-        .order_by(models.PRObservation.created_at.desc(), models.PRObservation.id)
+        .order_by(
+            models.PRObservation.created_at.desc(), models.PRObservation.id.desc()
+        )
     )
 
+    # Embeds are loaded for whichever entity the final query selects
+    observation = models.PRObservation
     if exercise_id is not None:
         query = query.where(models.PRObservation.exercise_id == exercise_id)
     elif exercise_ids is not None:
@@ -108,17 +114,20 @@ async def list_pr_observation(
         )
         # mypy complains about type, but it works...
         latest_alias = aliased(models.PRObservation, latest_record_select)  # type: ignore
+        observation = latest_alias
 
         query = (
             select(latest_alias)
             .select_from(distinct_select)
             .join(latest_alias, onclause=true())
-            .order_by(latest_alias.created_at.desc(), latest_alias.id)
+            .order_by(latest_alias.created_at.desc(), latest_alias.id.desc())
         )
 
     if embed is not None:
         if schemas.PRObservationEmbed.exercise in embed:
-            query = query.options(selectinload(models.PRObservation.exercise))
+            query = query.options(
+                *plan_exercise(EmbedPlanner(), observation.exercise).options()
+            )
 
     observations = await paginate(
         db,
@@ -1,7 +1,7 @@
 from decimal import Decimal
 from uuid import UUID, uuid4
 
-from sqlalchemy import CHAR, ForeignKey, Numeric
+from sqlalchemy import CHAR, ForeignKey, Index, Numeric
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.mutable import MutableDict
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -13,6 +13,7 @@ from fitness_solutions_server.currencies.models import Currency
 
 class Product(TimestampMixin, Base):
     __tablename__ = "products"
+    __table_args__ = (Index("ix_products_created_at_id", "created_at", "id"),)
 
     id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
     name_translations: Mapped[dict[str, str]] = mapped_column(
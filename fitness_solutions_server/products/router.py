@@ -148,7 +148,7 @@ async def list_products(
     collection_id: Annotated[UUID | None, Query()] = None,
 ) -> ResponseModel[CursorPage[schemas.ProductAdmin] | CursorPage[schemas.Product]]:
     query = select(models.Product).order_by(
-        models.Product.created_at.desc(), models.Product.id
+        models.Product.created_at.desc(), models.Product.id.desc()
     )
 
     if not is_admin and collection_id is None:
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, ForeignKey, Table
+from sqlalchemy import Column, ForeignKey, Index, Table
 
 from fitness_solutions_server.core.models import Base
 
@@ -11,4 +11,10 @@ user_saved_fitness_plans = Table(
         primary_key=True,
     ),
     Column("user_id", ForeignKey("users.id", ondelete="CASCADE"), primary_key=True),
+    # Loads a user's saved fitness plans with an index only scan
+    Index(
+        "ix_user_saved_fitness_plans_user_id_fitness_plan_id",
+        "user_id",
+        "fitness_plan_id",
+    ),
 )
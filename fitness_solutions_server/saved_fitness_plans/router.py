@@ -9,6 +9,9 @@ from fitness_solutions_server.core.schemas import ResponseModel
 from fitness_solutions_server.core.utils import get_or_fail
 from fitness_solutions_server.fitness_plans.models import FitnessPlan
 from fitness_solutions_server.saved_fitness_plans import models
+from fitness_solutions_server.saved_fitness_plans.utils import (
+    invalidate_saved_fitness_plan_ids,
+)
 from fitness_solutions_server.users.dependencies import RequireUserDependency
 
 router = APIRouter(prefix="/saved-fitness-plans")
@@ -26,6 +29,7 @@ async def save_fitness_plan(
     )
     await db.execute(insert_stmt)
     await db.commit()
+    invalidate_saved_fitness_plan_ids(user.id)
     return ResponseModel(data=None)
 
 
@@ -40,4 +44,5 @@ async def delete_saved_fitness_plan(
         .where(models.user_saved_fitness_plans.c.user_id == user.id)
     )
     await db.commit()
+    invalidate_saved_fitness_plan_ids(user.id)
     return ResponseModel(data=None)
@@ -0,0 +1,23 @@
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from fitness_solutions_server.core.saved_items import SavedItemIdsCache
+
+from . import models
+
+# Maps a user ID to the IDs of the fitness plans they saved
+saved_fitness_plan_ids_cache = SavedItemIdsCache(
+    models.user_saved_fitness_plans.c.user_id,
+    models.user_saved_fitness_plans.c.fitness_plan_id,
+)
+
+
+async def get_saved_fitness_plan_ids(
+    db: AsyncSession, user_id: UUID
+) -> frozenset[UUID]:
+    return await saved_fitness_plan_ids_cache.get(db, user_id)
+
+
+def invalidate_saved_fitness_plan_ids(user_id: UUID):
+    saved_fitness_plan_ids_cache.invalidate(user_id)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, ForeignKey, Table
+from sqlalchemy import Column, ForeignKey, Index, Table
 
 from fitness_solutions_server.core.models import Base
 
@@ -9,4 +9,6 @@ user_saved_workouts = Table(
         "workout_id", ForeignKey("workouts.id", ondelete="CASCADE"), primary_key=True
     ),
     Column("user_id", ForeignKey("users.id", ondelete="CASCADE"), primary_key=True),
+    # Loads a user's saved workouts with an index only scan
+    Index("ix_user_saved_workouts_user_id_workout_id", "user_id", "workout_id"),
 )
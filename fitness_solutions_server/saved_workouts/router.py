@@ -8,6 +8,7 @@ from fitness_solutions_server.core.database import DatabaseDependency
 from fitness_solutions_server.core.schemas import ResponseModel
 from fitness_solutions_server.core.utils import get_or_fail
 from fitness_solutions_server.saved_workouts import models
+from fitness_solutions_server.saved_workouts.utils import invalidate_saved_workout_ids
 from fitness_solutions_server.users.dependencies import RequireUserDependency
 from fitness_solutions_server.workouts.models import Workout
 
@@ -26,6 +27,7 @@ async def save_workout(
     )
     await db.execute(insert_stmt)
     await db.commit()
+    invalidate_saved_workout_ids(user.id)
     return ResponseModel(data=None)
 
 
@@ -40,4 +42,5 @@ async def delete_saved_workout(
         .where(models.user_saved_workouts.c.user_id == user.id)
     )
     await db.commit()
+    invalidate_saved_workout_ids(user.id)
     return ResponseModel(data=None)
@@ -0,0 +1,20 @@
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from fitness_solutions_server.core.saved_items import SavedItemIdsCache
+
+from . import models
+
+# Maps a user ID to the IDs of the workouts they saved
+saved_workout_ids_cache = SavedItemIdsCache(
+    models.user_saved_workouts.c.user_id, models.user_saved_workouts.c.workout_id
+)
+
+
+async def get_saved_workout_ids(db: AsyncSession, user_id: UUID) -> frozenset[UUID]:
+    return await saved_workout_ids_cache.get(db, user_id)
+
+
+def invalidate_saved_workout_ids(user_id: UUID):
+    saved_workout_ids_cache.invalidate(user_id)
@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import Annotated
 
-from fastapi import Depends
+from fastapi import Depends, Request
 
 from fitness_solutions_server.core.config import settings
 
@@ -19,15 +19,24 @@ class StorageService(ABC):
     async def move(self, from_path: str, to_path: str):
         pass
 
+    async def close(self):
+        pass
+
 
-def get_storage_service() -> StorageService:
+def create_storage_service() -> StorageService:
     from fitness_solutions_server.storage.gcp import GoogleCloudStorageService
 
     return GoogleCloudStorageService(
         project_id=settings.GOOGLE_CLOUD_PROJECT,
         bucket_name=settings.GOOGLE_CLOUD_STORAGE_BUCKET,
+        max_workers=settings.STORAGE_MAX_WORKERS,
+        http_pool_size=settings.STORAGE_HTTP_POOL_SIZE,
     )
     # return LocalStorageService("/tmp/fitness-solutions-server/images")
 
 
+def get_storage_service(request: Request) -> StorageService:
+    return request.app.state.storage_service
+
+
 StorageServiceDependency = Annotated[StorageService, Depends(get_storage_service)]
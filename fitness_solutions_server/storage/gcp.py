@@ -1,23 +1,62 @@
-from fastapi.concurrency import run_in_threadpool
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable
+
+import google.auth
+from google.auth.transport.requests import AuthorizedSession
 from google.cloud import storage
+from requests.adapters import HTTPAdapter
 
 from fitness_solutions_server.storage.base import StorageService
 
 
 class GoogleCloudStorageService(StorageService):
-    def __init__(self, project_id: str, bucket_name: str):
-        self.client = storage.Client(project=project_id)
+    def __init__(
+        self,
+        project_id: str,
+        bucket_name: str,
+        max_workers: int = 8,
+        http_pool_size: int = 16,
+    ):
+        credentials, _ = google.auth.default(
+            scopes=storage.Client.SCOPE,
+        )
+        self.session = AuthorizedSession(credentials)
+        adapter = HTTPAdapter(
+            pool_connections=http_pool_size, pool_maxsize=http_pool_size
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self.client = storage.Client(
+            project=project_id, credentials=credentials, _http=self.session
+        )
         self.bucket = self.client.bucket(bucket_name)
+        # Blocking GCS calls get their own bounded pool so slow uploads
+        # cannot starve Starlette's shared threadpool.
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="gcs"
+        )
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(func, *args))
 
     async def upload(self, bytes: bytes, path: str):
         blob = self.bucket.blob(path)
-        await run_in_threadpool(blob.upload_from_string, bytes)
-        await run_in_threadpool(blob.make_public)
+        await self._run(blob.upload_from_string, bytes)
+        await self._run(blob.make_public)
 
     def link(self, path: str) -> str:
         return self.bucket.blob(path).public_url
 
     async def move(self, from_path: str, to_path: str):
         old_blob = self.bucket.blob(from_path)
-        new_blob = await run_in_threadpool(self.bucket.rename_blob, old_blob, to_path)
-        await run_in_threadpool(new_blob.make_public)
+        new_blob = await self._run(self.bucket.rename_blob, old_blob, to_path)
+        await self._run(new_blob.make_public)
+
+    async def close(self):
+        # Waits for running uploads without blocking the event loop
+        await asyncio.to_thread(self.executor.shutdown, True)
+        self.session.close()
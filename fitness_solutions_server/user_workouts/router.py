@@ -26,18 +26,21 @@ async def complete_workout(
         body.workout_id
     )
     if completed_workout is not None:
+        if completed_workout.completed_at is None:
+            await utils.increment_completed_count(db, completed_workout.workout_id)
         completed_workout.completed_at = datetime.utcnow()
 
         user.tracked_workouts.append(completed_workout)
         await db.commit()
         return ResponseModel(data=schemas.UserWorkout.from_orm(completed_workout))
     else:
-        workouts = await get_or_fail(Workout, body.workout_id, db)
+        workout = await get_or_fail(Workout, body.workout_id, db)
         user_workout = models.UserWorkout(
-            workout_id=workouts.workout_id,
+            workout_id=workout.id,
             started_at=datetime.utcnow(),
             completed_at=datetime.utcnow(),
         )
         user.tracked_workouts.append(user_workout)
+        await utils.increment_completed_count(db, workout.id)
         await db.commit()
         return ResponseModel(data=schemas.UserWorkout.from_orm(user_workout))
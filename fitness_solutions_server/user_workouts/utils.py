@@ -4,7 +4,7 @@ from typing import Annotated
 from uuid import UUID
 
 from fastapi import Depends
-from sqlalchemy import select
+from sqlalchemy import ColumnElement, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from fitness_solutions_server.core.config import settings
@@ -15,6 +15,7 @@ from . import models
 from fitness_solutions_server.storage.base import (
     StorageService,
 )
+from fitness_solutions_server.workouts.models import Workout
 
 
 class UserWorkoutService:
@@ -31,6 +32,39 @@ class UserWorkoutService:
         )
 
 
+async def increment_completed_count(db: AsyncSession, workout_id: UUID):
+    # Keep updated_at, counters are not part of the resource's content
+    await db.execute(
+        update(Workout)
+        .where(Workout.id == workout_id)
+        .values(
+            completed_count=Workout.completed_count + 1, updated_at=Workout.updated_at
+        )
+    )
+
+
+async def subtract_completed_counts(db: AsyncSession, *criteria: ColumnElement[bool]):
+    """
+    Decrements `Workout.completed_count` for the completed user workouts matching
+    `criteria`. Must be called in the same transaction, before they are deleted.
+    """
+    completed = (
+        select(models.UserWorkout.workout_id, func.count().label("count"))
+        .where(models.UserWorkout.completed_at.is_not(None), *criteria)
+        .group_by(models.UserWorkout.workout_id)
+        .subquery()
+    )
+    await db.execute(
+        update(Workout)
+        .where(Workout.id == completed.c.workout_id)
+        .values(
+            completed_count=Workout.completed_count - completed.c.count,
+            updated_at=Workout.updated_at,
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
 def get_user_service(db: DatabaseDependency) -> UserWorkoutService:
     return UserWorkoutService(db=db)
 
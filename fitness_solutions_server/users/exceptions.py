@@ -28,3 +28,12 @@ class UserUnauthorizedException(AppException):
             detail="Unauthorized",
             code="user_unauthorized",
         )
+
+
+class UserInvalidVerificationCodeException(AppException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid verification code",
+            code="user_invalid_verification_code",
+        )
@@ -2,9 +2,9 @@ from datetime import date, datetime
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
-from sqlalchemy import CheckConstraint, ForeignKey, select
+from sqlalchemy import CheckConstraint, ForeignKey
 from sqlalchemy.dialects.postgresql import CITEXT
-from sqlalchemy.orm import Mapped, column_property, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from fitness_solutions_server.core.models import Base, Focus, Sex, TimestampMixin
 from fitness_solutions_server.countries.models import Country
@@ -27,14 +27,8 @@ class User(TimestampMixin, Base):
     full_name: Mapped[str]
     sex: Mapped[Sex | None]
     height: Mapped[float | None]
-    weight: Mapped[float | None] = column_property(
-        select(WeightLog.weight)
-        .where(WeightLog.user_id == id)
-        .order_by(WeightLog.created_at.desc())
-        .limit(1)
-        .correlate_except(WeightLog)
-        .scalar_subquery()
-    )
+    # Latest weight log, maintained by `weight_logs.utils.refresh_current_weight`
+    weight: Mapped[float | None] = mapped_column("current_weight")
     birthdate: Mapped[date | None]
     focus: Mapped[Focus | None]
     verification_code: Mapped[str | None] = mapped_column(unique=True)
@@ -80,6 +74,6 @@ class UserAuthenticationToken(TimestampMixin, Base):
     user_id: Mapped[UUID] = mapped_column(
         ForeignKey("users.id", ondelete="CASCADE"), index=True
     )
-    expires_at: Mapped[datetime]
+    expires_at: Mapped[datetime] = mapped_column(index=True)
 
     user: Mapped[User] = relationship(back_populates="authentication_tokens")
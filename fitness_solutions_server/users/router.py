@@ -1,21 +1,27 @@
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Request, Response, status
 from pydantic import EmailStr
 
 from fitness_solutions_server.admins.dependencies import IsAdminDependency
 from fitness_solutions_server.core.config import settings
 from fitness_solutions_server.core.database import DatabaseDependency
+from fitness_solutions_server.core.dependencies import (
+    RequestPrincipalDependency,
+    invalidate_principal_tokens,
+)
 from fitness_solutions_server.core.email import (
     send_reset_password_email,
     send_user_verification_email,
 )
+from fitness_solutions_server.core.http_cache import check_not_modified, weak_etag
+from fitness_solutions_server.core.localization import get_locale
 from fitness_solutions_server.core.schemas import ResponseModel
 from fitness_solutions_server.core.security import (
     create_security_token,
-    hash_password,
+    hash_password_async,
     security_token_to_code,
-    verify_password,
+    verify_password_async,
 )
 from fitness_solutions_server.core.utils import get_or_fail
 from fitness_solutions_server.countries import models as country_models
@@ -26,7 +32,13 @@ from fitness_solutions_server.users.dependencies import (
 from fitness_solutions_server.users.exceptions import (
     UserEmailAlreadyTakenException,
     UserInvalidCredentialsException,
+    UserInvalidVerificationCodeException,
+    UserUnauthorizedException,
 )
+from fitness_solutions_server.fitness_plans.models import UserFitnessPlanParticipation
+from fitness_solutions_server.fitness_plans.utils import subtract_participants_counts
+from fitness_solutions_server.user_workouts.models import UserWorkout
+from fitness_solutions_server.user_workouts.utils import subtract_completed_counts
 from fitness_solutions_server.weight_logs.models import WeightLog
 from fitness_solutions_server.images.models import Image
 
@@ -57,7 +69,7 @@ async def register(
         image = await get_or_fail(Image, user_registration.profile_image_id, db)
 
     # Hash password
-    hashed_password = hash_password(user_registration.password)
+    hashed_password = await hash_password_async(user_registration.password)
 
     # Create user
     del user_registration.password
@@ -112,8 +124,15 @@ async def login(
 ) -> ResponseModel[schemas.UserLoginResponse]:
     # Check credentials are correct
     user = await users.get_by_email(login_request.email)
-    if user is None or not verify_password(login_request.password, user.password_hash):
+    if user is None:
         raise UserInvalidCredentialsException()
+    (is_valid, new_password_hash) = await verify_password_async(
+        login_request.password, user.password_hash
+    )
+    if not is_valid:
+        raise UserInvalidCredentialsException()
+    if new_password_hash is not None:
+        user.password_hash = new_password_hash
 
     # Create authentication token
     unhashed_token = await users.create_auth_token(user=user)
@@ -126,10 +145,32 @@ async def login(
     )
 
 
+@router.post("/auth/logout")
+async def logout(
+    principal: RequestPrincipalDependency,
+    users: UserServiceDependency,
+) -> ResponseModel[None]:
+    if principal is None or principal.user is None:
+        raise UserUnauthorizedException()
+
+    await users.delete_auth_token(principal.hashed_token)
+
+    return ResponseModel(data=None)
+
+
 @router.get("/me")
 async def get_current_user(
-    current_user: RequireUserDependency, mapper: mapper.UserMapperependency
+    request: Request,
+    response: Response,
+    current_user: RequireUserDependency,
+    mapper: mapper.UserMapperependency,
 ) -> ResponseModel[schemas.User]:
+    # The user is already loaded for authentication, so no probe is needed
+    etag = weak_etag(current_user.id, current_user.updated_at, get_locale())
+    not_modified = check_not_modified(request, response, etag, current_user.updated_at)
+    if not_modified is not None:
+        return not_modified  # type: ignore
+
     return ResponseModel(data=mapper.user_to_schema(current_user))
 
 
@@ -196,13 +237,18 @@ async def reset_password(
     token: str,
     new_password: str,
     users: UserServiceDependency,
-    db: DatabaseDependency,
 ) -> ResponseModel[None]:
-    verification_code = security_token_to_code(token)
+    try:
+        verification_code = security_token_to_code(token)
+    except ValueError:
+        raise UserInvalidVerificationCodeException()
     user = await users.get_by_verification_code(verification_code)
-    hashed_password = hash_password(new_password)
+    if user is None:
+        raise UserInvalidVerificationCodeException()
+    hashed_password = await hash_password_async(new_password)
     user.password_hash = hashed_password
-    await db.commit()
+    # Commits the new password together with the deleted tokens
+    await users.delete_auth_tokens(user)
     return ResponseModel(data=None)
 
 
@@ -219,7 +265,13 @@ async def delete(
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
 
     user = await get_or_fail(models.User, user_id, db)
+    # Their user workouts and participations are removed by cascade
+    await subtract_completed_counts(db, UserWorkout.user_id == user.id)
+    await subtract_participants_counts(
+        db, UserFitnessPlanParticipation.user_id == user.id
+    )
     await db.delete(user)
     await db.commit()
+    invalidate_principal_tokens(user.id)
 
     return ResponseModel(data=None)
@@ -4,11 +4,15 @@ from typing import Annotated
 from uuid import UUID
 
 from fastapi import Depends
-from sqlalchemy import select
+from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from fitness_solutions_server.core.config import settings
 from fitness_solutions_server.core.database import DatabaseDependency
+from fitness_solutions_server.core.dependencies import (
+    invalidate_principal_tokens,
+    invalidate_token,
+)
 from fitness_solutions_server.core.security import generate_authentication_token
 
 from . import models
@@ -85,6 +89,26 @@ class UserService:
         await self.db.commit()
         return unhashed_token
 
+    async def delete_auth_token(self, hashed_token: str):
+        await self.db.execute(
+            delete(models.UserAuthenticationToken).where(
+                models.UserAuthenticationToken.token == hashed_token
+            )
+        )
+        await self.db.commit()
+        # Only after committing, so a concurrent request can't read the token
+        # again. Lookups that read it before are not stored either.
+        invalidate_token(hashed_token)
+
+    async def delete_auth_tokens(self, user: models.User):
+        await self.db.execute(
+            delete(models.UserAuthenticationToken).where(
+                models.UserAuthenticationToken.user_id == user.id
+            )
+        )
+        await self.db.commit()
+        invalidate_principal_tokens(user.id)
+
 
 def get_user_service(
     db: DatabaseDependency, storage_service: StorageServiceDependency
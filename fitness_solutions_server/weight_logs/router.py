@@ -14,6 +14,7 @@ from fitness_solutions_server.core.utils import CursorPage, get_or_fail
 from fitness_solutions_server.users.dependencies import RequireUserDependency
 from fitness_solutions_server.weight_logs import models, schemas
 from fitness_solutions_server.weight_logs.models import WeightLog
+from fitness_solutions_server.weight_logs.utils import refresh_current_weight
 
 router = APIRouter(prefix="/weight-logs")
 
@@ -24,6 +25,8 @@ async def create(
 ) -> ResponseModel[schemas.WeightLog]:
     weight_log = WeightLog(weight=body.weight, user_id=user.id)
     db.add(weight_log)
+    # The new log is always the latest one
+    user.weight = body.weight
     await db.commit()
     return ResponseModel(data=schemas.WeightLog.from_orm(weight_log))
 
@@ -36,6 +39,8 @@ async def delete(
     if weight_log.user_id != user.id:
         raise HTTPException(status.HTTP_403_FORBIDDEN)
     await db.delete(weight_log)
+    await db.flush()
+    await refresh_current_weight(db, user)
     await db.commit()
     return ResponseModel()
 
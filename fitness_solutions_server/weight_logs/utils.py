@@ -0,0 +1,18 @@
+from typing import TYPE_CHECKING
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from . import models
+
+if TYPE_CHECKING:
+    from fitness_solutions_server.users.models import User
+
+
+async def refresh_current_weight(db: AsyncSession, user: "User"):
+    user.weight = await db.scalar(
+        select(models.WeightLog.weight)
+        .where(models.WeightLog.user_id == user.id)
+        .order_by(models.WeightLog.created_at.desc())
+        .limit(1)
+    )
@@ -0,0 +1,265 @@
+from typing import Annotated, Hashable
+from uuid import UUID
+
+from fastapi import Depends, Query
+from sqlalchemy import Integer, Select, and_, cast, or_, select, true
+from sqlalchemy.dialects.postgresql import Range
+
+from fitness_solutions_server.admins.dependencies import IsAdminDependency
+from fitness_solutions_server.catalog.models import CatalogItemType
+from fitness_solutions_server.catalog.utils import visible_catalog_items
+from fitness_solutions_server.collections.models import CollectionItemWorkout
+from fitness_solutions_server.core.exceptions import InvalidAgeRangeException
+from fitness_solutions_server.core.models import ExperienceLevel, Focus, Sex
+from fitness_solutions_server.core.page_cache import filters_cache_key
+from fitness_solutions_server.core.utils import search_by_similarity
+from fitness_solutions_server.fitness_coaches.dependencies import (
+    GetFitnessCoachDependency,
+)
+from fitness_solutions_server.saved_workouts.models import user_saved_workouts
+from fitness_solutions_server.users.dependencies import GetUserDependency
+
+from . import models
+from .utils import is_saved_expression
+
+
+class WorkoutListFilters:
+    """
+    The filters shared by the workout list and facet endpoints, including which
+    workouts the caller is allowed to see.
+    """
+
+    def __init__(
+        self,
+        is_admin: IsAdminDependency,
+        user: GetUserDependency,
+        fitness_coach: GetFitnessCoachDependency,
+        order_id: Annotated[
+            UUID | None, Query(description="Filter by order ID")
+        ] = None,
+        focus: Annotated[
+            set[Focus] | None, Query(description="Filter for specific focuses")
+        ] = None,
+        target_sex: Annotated[
+            Sex | None, Query(description="Filter for specific target sex")
+        ] = None,
+        min_age: Annotated[
+            int | None, Query(description="Lower bound (inclusive) for age", ge=0)
+        ] = None,
+        max_age: Annotated[
+            int | None, Query(description="Upper bound (inclusive) for age", ge=0)
+        ] = None,
+        muscle_groups_one_of: Annotated[
+            set[UUID] | None,
+            Query(
+                description="Filter for workouts that contain one of the muscle groups"
+            ),
+        ] = None,
+        min_duration: Annotated[
+            int | None,
+            Query(
+                description="Lower bound (inclusive) for estimated duration in seconds"
+            ),
+        ] = None,
+        max_duration: Annotated[
+            int | None,
+            Query(
+                description="Upper bound (inclusive) for estimated duration in seconds"
+            ),
+        ] = None,
+        equipment_one_of: Annotated[
+            set[UUID] | None,
+            Query(description="Filter for workouts that contain one of the equipment"),
+        ] = None,
+        equipment_subset_of: Annotated[
+            set[UUID] | None,
+            Query(
+                description="Filter for workouts that only need equipment from the list"
+            ),
+        ] = None,
+        fitness_coach_id: Annotated[
+            UUID | None, Query(description="Query for workouts by a fitness coach")
+        ] = None,
+        is_saved: Annotated[
+            bool | None,
+            Query(description="Filter for saved workouts (only for users)"),
+        ] = None,
+        name: Annotated[
+            str | None,
+            Query(description="Filter for names that contain the supplied value"),
+        ] = None,
+        age: Annotated[
+            int | None,
+            Query(description="Can be used to filter for workouts for a specific age."),
+        ] = None,
+        user_id: Annotated[
+            UUID | None,
+            Query(
+                description=(
+                    "Query for user ID (only available for current user and admins)"
+                )
+            ),
+        ] = None,
+        fitness_plan_id: Annotated[
+            UUID | None,
+            Query(description="Filter for workouts included in a fitness plan"),
+        ] = None,
+        collection_id: Annotated[UUID | None, Query()] = None,
+        experience_levels: Annotated[set[ExperienceLevel] | None, Query()] = None,
+    ):
+        # Postgres rejects ranges whose lower bound is above the upper bound
+        if min_age is not None and max_age is not None and min_age > max_age:
+            raise InvalidAgeRangeException()
+
+        self.is_admin = is_admin
+        self.user = user
+        self.fitness_coach = fitness_coach
+        self.order_id = order_id
+        self.focus = focus
+        self.target_sex = target_sex
+        self.min_age = min_age
+        self.max_age = max_age
+        self.muscle_groups_one_of = muscle_groups_one_of
+        self.min_duration = min_duration
+        self.max_duration = max_duration
+        self.equipment_one_of = equipment_one_of
+        self.equipment_subset_of = equipment_subset_of
+        self.fitness_coach_id = fitness_coach_id
+        self.is_saved = is_saved
+        self.name = name
+        self.age = age
+        self.user_id = user_id
+        self.fitness_plan_id = fitness_plan_id
+        self.collection_id = collection_id
+        self.experience_levels = experience_levels
+
+    def shared_cache_key(self) -> Hashable | None:
+        """
+        Key for the results if every caller passing the same filters from the
+        same country gets them, None when they depend on who is asking.
+        Users who own workouts also see those, callers must check for that.
+        """
+        if (
+            self.is_admin
+            or self.fitness_coach is not None
+            or self.is_saved is not None
+            or self.user_id is not None
+        ):
+            return None
+
+        return (
+            self.user is not None,
+            self.user.country_id if self.user is not None else None,
+            filters_cache_key(
+                {
+                    name: value
+                    for name, value in vars(self).items()
+                    if name not in ("is_admin", "user", "fitness_coach")
+                }
+            ),
+        )
+
+    def apply(self, query: Select) -> Select:
+        """
+        Adds the filters to a query selecting from `workouts`. When searching by
+        name, matches are ordered by similarity before any later ordering.
+        """
+        user = self.user
+        fitness_coach = self.fitness_coach
+
+        query = query.where(models.Workout.deleted_at.is_(None))
+        if self.name is not None:
+            query = search_by_similarity(query, models.Workout.search_text, self.name)
+
+        if user is not None:
+            if self.is_saved:
+                # Starts from the user's saved rows instead of probing each workout
+                query = query.join(
+                    user_saved_workouts,
+                    and_(
+                        user_saved_workouts.c.workout_id == models.Workout.id,
+                        user_saved_workouts.c.user_id == user.id,
+                    ),
+                )
+            elif self.is_saved is not None:
+                query = query.where(~is_saved_expression(user_id=user.id))
+            # Outside of collections users see the released workouts offered in
+            # their country and their own
+            visible = visible_catalog_items(
+                CatalogItemType.workout,
+                user.country_id,
+                is_released=True if self.collection_id is None else None,
+            )
+            query = query.where(
+                or_(models.Workout.id.in_(visible), models.Workout.user_id == user.id)
+            )
+
+        if self.user_id is not None and (
+            self.is_admin or (user is not None and user.id == self.user_id)
+        ):
+            query = query.where(models.Workout.user_id == self.user_id)
+        if self.order_id is not None and (self.is_admin or fitness_coach is not None):
+            query = query.where(models.Workout.order_id == self.order_id)
+        if self.focus is not None:
+            query = query.where(models.Workout.focus.in_(self.focus))
+        if self.target_sex is not None:
+            query = query.where(models.Workout.target_sex == self.target_sex)
+        if self.min_age is not None or self.max_age is not None:
+            query = query.where(
+                models.Workout.age_range.contained_by(
+                    Range(self.min_age, self.max_age, bounds="[]")
+                )
+            )
+        if self.muscle_groups_one_of is not None:
+            query = query.where(
+                models.Workout.muscle_group_ids.overlap([*self.muscle_groups_one_of])
+            )
+        if self.min_duration is not None:
+            query = query.where(models.Workout.duration_seconds >= self.min_duration)
+        if self.max_duration is not None:
+            query = query.where(models.Workout.duration_seconds <= self.max_duration)
+        if self.equipment_one_of is not None:
+            query = query.where(
+                models.Workout.equipment_ids.overlap([*self.equipment_one_of])
+            )
+        if self.equipment_subset_of is not None:
+            query = query.where(
+                models.Workout.equipment_ids.contained_by([*self.equipment_subset_of])
+            )
+        if self.fitness_coach_id is not None:
+            query = query.where(
+                models.Workout.fitness_coach_id == self.fitness_coach_id
+            )
+        if self.age is not None:
+            query = query.where(
+                models.Workout.age_range.contains(cast(self.age, Integer))
+            )
+        if self.fitness_plan_id is not None:
+            query = query.where(
+                models.Workout.fitness_plans.any(id=self.fitness_plan_id)
+            )
+        if self.experience_levels is not None:
+            query = query.where(
+                models.Workout.experience_level.in_(self.experience_levels)
+            )
+
+        # Only allow users to see workouts that are not in collection
+        if self.collection_id is not None:
+            query = query.where(
+                select(CollectionItemWorkout.id)
+                .where(CollectionItemWorkout.workout_id == models.Workout.id)
+                .where(CollectionItemWorkout.collection_id == self.collection_id)
+                .exists()
+            )
+        else:
+            if fitness_coach is not None:
+                # Fitness coaches can only see their own workouts
+                query = query.where(models.Workout.fitness_coach_id == fitness_coach.id)
+            elif user is None and not self.is_admin:
+                # Unauthenticated can only see released workouts
+                query = query.where(models.Workout.is_released == true())
+
+        return query
+
+
+WorkoutListFiltersDependency = Annotated[WorkoutListFilters, Depends()]
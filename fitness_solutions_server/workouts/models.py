@@ -4,22 +4,16 @@ from enum import Enum
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
-from sqlalchemy import (
-    CheckConstraint,
-    ForeignKey,
-    Integer,
-    UniqueConstraint,
-    func,
-    select,
-    type_coerce,
-)
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import CheckConstraint, ForeignKey, Index, UniqueConstraint, Uuid, text
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, Range
 from sqlalchemy.ext.associationproxy import AssociationProxy, association_proxy
-from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.ext.mutable import MutableDict
 from sqlalchemy.orm import Mapped, mapped_column, query_expression, relationship
 
-from fitness_solutions_server.core.localization import translation_hybrid
+from fitness_solutions_server.core.localization import (
+    translation_hybrid,
+    translations_search_text,
+)
 from fitness_solutions_server.core.models import (
     Base,
     ExperienceLevel,
@@ -27,6 +21,7 @@ from fitness_solutions_server.core.models import (
     Sex,
     SoftDeleteMixin,
     TimestampMixin,
+    target_age_range,
 )
 from fitness_solutions_server.exercises.models import Exercise
 from fitness_solutions_server.fitness_plans.models import FitnessPlan
@@ -115,6 +110,31 @@ class Workout(Base, TimestampMixin, SoftDeleteMixin):
         CheckConstraint(
             "min_age >= 0 AND min_age <= max_age", name="workout_age_constraints"
         ),
+        Index("ix_workouts_completed_count_id", "completed_count", "id"),
+        Index(
+            "ix_workouts_created_at_id",
+            "created_at",
+            "id",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "ix_workouts_is_released_duration_seconds",
+            "is_released",
+            "duration_seconds",
+        ),
+        Index(
+            "ix_workouts_search_text_trgm",
+            "search_text",
+            postgresql_using="gin",
+            postgresql_ops={"search_text": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_workouts_muscle_group_ids",
+            "muscle_group_ids",
+            postgresql_using="gin",
+        ),
+        Index("ix_workouts_equipment_ids", "equipment_ids", postgresql_using="gin"),
+        Index("ix_workouts_age_range", "age_range", postgresql_using="gist"),
     )
 
     id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
@@ -122,6 +142,7 @@ class Workout(Base, TimestampMixin, SoftDeleteMixin):
         MutableDict.as_mutable(JSONB())
     )
     name: Mapped[str] = translation_hybrid(name_translations)
+    search_text: Mapped[str] = translations_search_text("name_translations")
     description_translations: Mapped[dict[str, str]] = mapped_column(
         MutableDict.as_mutable(JSONB())
     )
@@ -142,6 +163,18 @@ class Workout(Base, TimestampMixin, SoftDeleteMixin):
     is_saved: Mapped[bool | None] = query_expression()
     min_age: Mapped[int | None]
     max_age: Mapped[int | None]
+    age_range: Mapped[Range[int]] = target_age_range()
+    # Maintained by the user workout handlers, see `user_workouts.utils`
+    completed_count: Mapped[int] = mapped_column(default=0, server_default="0")
+    # Estimated from the sets whenever the exercises change, see `workouts.utils`
+    duration_seconds: Mapped[int] = mapped_column(default=0, server_default="0")
+    # Distinct IDs across all exercises, see `workouts.utils.refresh_workout_facets`
+    muscle_group_ids: Mapped[list[UUID]] = mapped_column(
+        ARRAY(Uuid()), default=list, server_default="{}"
+    )
+    equipment_ids: Mapped[list[UUID]] = mapped_column(
+        ARRAY(Uuid()), default=list, server_default="{}"
+    )
 
     fitness_coach: Mapped[FitnessCoach | None] = relationship(
         back_populates="workouts", lazy="noload"
@@ -166,48 +199,9 @@ class Workout(Base, TimestampMixin, SoftDeleteMixin):
         passive_deletes=True,
         cascade="all, delete",
     )
-    # duration: Mapped[int] = column_property(
-    #     select(func.coalesce(func.sum(WorkoutExerciseSet.duration), 0))
-    #     .join(WorkoutExercise)
-    #     .where(WorkoutExercise.workout_id == id)
-    #     .correlate_except(WorkoutExerciseSet)
-    #     .scalar_subquery()
-    # )
     fitness_plans: Mapped[list[FitnessPlan] | None] = relationship(
         primaryjoin="FitnessPlanWeekWorkout.workout_id == Workout.id",
         secondary="join(FitnessPlanWeek, FitnessPlanWeekWorkout, FitnessPlanWeekWorkout.fitness_plan_week_id == FitnessPlanWeek.id)",
         viewonly=True,
         lazy="noload",
     )
-
-    @hybrid_property
-    def duration(self) -> int:
-        return sum([s.duration or 0 for ex in self.workout_exercises for s in ex.sets])
-
-    @duration.inplace.expression
-    @classmethod
-    def _duration_expression(cls):
-        return type_coerce(
-            select(func.sum(WorkoutExerciseSet.duration))
-            .join(WorkoutExercise)
-            .where(WorkoutExercise.workout_id == cls.id),
-            Integer,
-        )
-
-    @hybrid_property
-    def completed_count(self) -> int:
-        return len(
-            list(filter(lambda el: (el.completed_at is not None), self.user_workouts))
-        )
-
-    @completed_count.inplace.expression
-    @classmethod
-    def _completed_count_expression(cls):
-        return type_coerce(
-            select(func.count())
-            .select_from(UserWorkout)
-            .where(UserWorkout.workout_id == cls.id)
-            .where(UserWorkout.completed_at.is_not(None))
-            .scalar_subquery(),
-            Integer,
-        )
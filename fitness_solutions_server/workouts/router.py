@@ -1,43 +1,53 @@
-import functools
-from typing import Annotated
+from datetime import datetime
+from typing import Annotated, Sequence
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from fastapi_pagination import pagination_ctx
 from fastapi_pagination.ext.sqlalchemy import paginate
-from sqlalchemy import delete, or_, select, true
-from sqlalchemy.orm import with_expression
+from sqlalchemy import delete, select
 
 from fitness_solutions_server.admins.dependencies import IsAdminDependency
-from fitness_solutions_server.collections.models import CollectionItemWorkout
+from fitness_solutions_server.catalog.models import CatalogItemType
+from fitness_solutions_server.catalog.utils import (
+    catalog_pages,
+    refresh_catalog_visibility,
+)
 from fitness_solutions_server.core.database import DatabaseDependency
-from fitness_solutions_server.core.models import ExperienceLevel, Focus, Sex
+from fitness_solutions_server.core.dependencies import ReadDatabaseDependency
+from fitness_solutions_server.core.http_cache import check_not_modified, weak_etag
+from fitness_solutions_server.core.localization import get_locale
 from fitness_solutions_server.core.schemas import ResponseModel, SortOrder
 from fitness_solutions_server.core.utils import (
     CursorPage,
     get_or_fail,
     get_or_fail_many,
+    not_found,
+    set_is_saved,
 )
-from fitness_solutions_server.countries.models import Country
-from fitness_solutions_server.equipment.models import Equipment
-from fitness_solutions_server.exercises.models import Exercise
 from fitness_solutions_server.fitness_coaches.dependencies import (
     GetFitnessCoachDependency,
     IsFitnessCoachDependency,
 )
 from fitness_solutions_server.fitness_coaches.mapper import FitnessCoachMapperDependency
 from fitness_solutions_server.fitness_coaches.models import FitnessCoach
-from fitness_solutions_server.muscle_groups.models import MuscleGroup
+from fitness_solutions_server.fitness_coaches.utils import load_fitness_coach_counts
 from fitness_solutions_server.orders.models import Order, OrderType
+from fitness_solutions_server.saved_workouts.utils import get_saved_workout_ids
 from fitness_solutions_server.storage.base import StorageServiceDependency
 from fitness_solutions_server.users.dependencies import GetUserDependency
 from fitness_solutions_server.workouts import models, schemas
+from fitness_solutions_server.workouts.dependencies import WorkoutListFiltersDependency
 from fitness_solutions_server.workouts.exceptions import OrderNotForYou
 from fitness_solutions_server.workouts.utils import (
-    is_saved_expression,
+    count_workout_facets,
+    estimate_workout_duration,
+    has_own_workouts,
     options_for_embeds,
+    refresh_workout_facets,
     workout_model_to_schema,
     workout_models_to_schema,
+    workout_version_query,
 )
 
 router = APIRouter(prefix="/workouts")
@@ -61,9 +71,6 @@ async def create(
         name_translations=create_request.name_translations,
         description_translations=create_request.description_translations,
         experience_level=create_request.experience_level,
-        # duration=sum(
-        #     [s.duration or 0 for ex in create_request.exercises for s in ex.sets]
-        # ),
     )
 
     if fitness_coach is not None:
@@ -110,6 +117,13 @@ async def create(
                 ],
             )
         )
+    workout.duration_seconds = estimate_workout_duration(workout.workout_exercises)
+    await db.flush()
+    await refresh_workout_facets(db, models.Workout.id == workout.id)
+    if workout.fitness_coach_id is not None:
+        await refresh_catalog_visibility(
+            db, CatalogItemType.workout, models.Workout.id == workout.id
+        )
 
     await db.commit()
 
@@ -124,10 +138,34 @@ async def create(
     )
 
 
+@router.get("/facets", summary="Count workouts per filter value")
+async def facets(
+    db: ReadDatabaseDependency, filters: WorkoutListFiltersDependency
+) -> ResponseModel[schemas.WorkoutFacets]:
+    filtered = (
+        filters.apply(
+            select(
+                models.Workout.focus,
+                models.Workout.experience_level,
+                models.Workout.target_sex,
+                models.Workout.muscle_group_ids,
+                models.Workout.equipment_ids,
+                models.Workout.duration_seconds,
+            )
+        )
+        .order_by(None)
+        .subquery()
+    )
+    return ResponseModel(data=await count_workout_facets(db, filtered))
+
+
 @router.get("/{workout_id}", summary="Get workout by ID")
 async def get_by_id(
     workout_id: UUID,
-    db: DatabaseDependency,
+    request: Request,
+    response: Response,
+    db: ReadDatabaseDependency,
+    primary_db: DatabaseDependency,
     is_admin: IsAdminDependency,
     storage_service: StorageServiceDependency,
     fitness_coach: GetFitnessCoachDependency,
@@ -136,24 +174,41 @@ async def get_by_id(
     is_fitness_coach: IsFitnessCoachDependency,
     embed: WorkoutEmbedQuery = None,
 ) -> ResponseModel[schemas.WorkoutPrivate | schemas.Workout]:
-    options = options_for_embeds(embed)
-
-    if user is not None:
-        options.append(
-            with_expression(
-                models.Workout.is_saved, is_saved_expression(user_id=user.id)
-            )
-        )
-
-    workout = await get_or_fail(models.Workout, workout_id, db, options=options)
+    # Probe the version first, so revalidations never hydrate the workout
+    version = (await db.execute(workout_version_query(workout_id, embed))).first()
+    if version is None:
+        raise not_found(models.Workout)
 
     # TODO: Check it is released for users
     # Check authentication
-    if fitness_coach is not None and workout.fitness_coach_id != fitness_coach.id:
+    if fitness_coach is not None and version.fitness_coach_id != fitness_coach.id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
     elif not is_admin and user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
 
+    saved_ids = (
+        await get_saved_workout_ids(primary_db, user.id) if user is not None else None
+    )
+
+    etag = weak_etag(
+        version.updated_at,
+        sorted(embed or []),
+        get_locale(),
+        is_admin,
+        is_fitness_coach,
+        workout_id in saved_ids if saved_ids is not None else None,
+    )
+    not_modified = check_not_modified(request, response, etag, version.updated_at)
+    if not_modified is not None:
+        return not_modified  # type: ignore
+
+    workout = await get_or_fail(
+        models.Workout, workout_id, db, options=options_for_embeds(embed)
+    )
+    if saved_ids is not None:
+        set_is_saved([workout], saved_ids)
+    await load_fitness_coach_counts(db, [workout.fitness_coach])
+
     return ResponseModel(
         data=workout_model_to_schema(
             is_admin=is_admin,
@@ -169,190 +224,78 @@ async def get_by_id(
     "", summary="List workouts", dependencies=[Depends(pagination_ctx(CursorPage))]
 )
 async def list(
-    db: DatabaseDependency,
+    db: ReadDatabaseDependency,
+    primary_db: DatabaseDependency,
     is_admin: IsAdminDependency,
     user: GetUserDependency,
-    fitness_coach: GetFitnessCoachDependency,
     storage_service: StorageServiceDependency,
     fitness_coach_mapper: FitnessCoachMapperDependency,
     is_fitness_coach: IsFitnessCoachDependency,
+    filters: WorkoutListFiltersDependency,
     embed: WorkoutEmbedQuery = None,
-    order_id: Annotated[UUID | None, Query(description="Filter by order ID")] = None,
     sort_by: Annotated[
         schemas.WorkoutSortBy, Query(description="Order results")
     ] = schemas.WorkoutSortBy.created_at,
     sort_order: SortOrder = SortOrder.desc,
-    focus: Annotated[
-        set[Focus] | None, Query(description="Filter for specific focuses")
-    ] = None,
-    target_sex: Annotated[
-        Sex | None, Query(description="Filter for specific target sex")
-    ] = None,
-    min_age: Annotated[
-        int | None, Query(description="Lower bound (inclusive) for age")
-    ] = None,
-    max_age: Annotated[
-        int | None, Query(description="Upper bound (inclusive) for age")
-    ] = None,
-    muscle_groups_one_of: Annotated[
-        set[UUID] | None,
-        Query(description="Filter for workouts that contain one of the muscle groups"),
-    ] = None,
-    min_duration: Annotated[
-        int | None, Query(description="Lower bound (inclusive) for duration")
-    ] = None,
-    max_duration: Annotated[
-        int | None, Query(description="Upper bound (inclusive) for duration")
-    ] = None,
-    equipment_one_of: Annotated[
-        set[UUID] | None,
-        Query(description="Filter for workouts that contain one of the equipment"),
-    ] = None,
-    fitness_coach_id: Annotated[
-        UUID | None, Query(description="Query for workouts by a fitness coach")
-    ] = None,
-    is_saved: Annotated[
-        bool | None, Query(description="Filter for saved workouts (only for users)")
-    ] = None,
-    name: Annotated[
-        str | None,
-        Query(description="Filter for names that contain the supplied value"),
-    ] = None,
-    age: Annotated[
-        int | None,
-        Query(description="Can be used to filter for workouts for a specific age."),
-    ] = None,
-    user_id: Annotated[
-        UUID | None,
-        Query(
-            description="Query for user ID (only available for current user and admins)"
-        ),
-    ] = None,
-    fitness_plan_id: Annotated[
-        UUID | None, Query(description="Filter for workouts included in a fitness plan")
-    ] = None,
-    collection_id: Annotated[UUID | None, Query()] = None,
-    experience_levels: Annotated[set[ExperienceLevel] | None, Query()] = None,
 ) -> ResponseModel[CursorPage[schemas.WorkoutPrivate] | CursorPage[schemas.Workout]]:
-    query = select(models.Workout).options(*options_for_embeds(embed))
+    query = filters.apply(select(models.Workout))
 
     match sort_by:
         case schemas.WorkoutSortBy.created_at:
             query = query.order_by(
-                (
-                    models.Workout.created_at.desc()
+                # Both keys follow the sort order so the (created_at, id) index
+                # can serve the keyset pagination
+                *(
+                    (models.Workout.created_at.desc(), models.Workout.id.desc())
                     if sort_order == SortOrder.desc
-                    else models.Workout.created_at.asc()
+                    else (models.Workout.created_at.asc(), models.Workout.id.asc())
                 ),
-                models.Workout.id,
             )
         case schemas.WorkoutSortBy.completed_count:
             query = query.order_by(
-                (
-                    models.Workout.completed_count.desc()
+                # Both keys follow the sort order so the (completed_count, id) index
+                # can serve the keyset pagination
+                *(
+                    (models.Workout.completed_count.desc(), models.Workout.id.desc())
                     if sort_order == SortOrder.desc
-                    else models.Workout.completed_count.asc()
+                    else (models.Workout.completed_count.asc(), models.Workout.id.asc())
                 ),
-                models.Workout.id,
             )
 
-    if user is not None:
-        is_saved_exp = is_saved_expression(user_id=user.id).label("is_saved")
-        query = query.options(with_expression(models.Workout.is_saved, is_saved_exp))
-        if is_saved is not None:
-            query = query.where(is_saved_exp == is_saved)
-        query = query.where(
-            or_(
-                models.Workout.fitness_coach.has(
-                    FitnessCoach.countries.any(Country.id == user.country_id)
-                ),
-                models.Workout.user_id == user.id,
-            )
-        )
-
-    if user_id is not None and (is_admin or (user is not None and user.id == user_id)):
-        query = query.where(models.Workout.user_id == user_id)
-    if order_id is not None and (is_admin or is_fitness_coach):
-        query = query.where(models.Workout.order_id == order_id)
-    if focus is not None:
-        query = query.where(models.Workout.focus.in_(focus))
-    if target_sex is not None:
-        query = query.where(models.Workout.target_sex == target_sex)
-    if min_age is not None:
-        query = query.where(models.Workout.min_age >= min_age)
-    if max_age is not None:
-        query = query.where(models.Workout.max_age <= max_age)
-    if muscle_groups_one_of is not None:
-        # Can perhaps be optimized, we don't need the muscle group and exercise tables
-        # only the association tables.
-        query = query.where(
-            models.Workout.exercises.any(
-                Exercise.muscle_groups.any(MuscleGroup.id.in_(muscle_groups_one_of))
-            )
-        )
-    if min_duration is not None:
-        query = query.filter(models.Workout.duration >= min_duration)
-    if max_duration is not None:
-        query = query.filter(models.Workout.duration <= max_duration)
-    if equipment_one_of is not None:
-        # Can perhaps be optimized, we don't need the muscle group and exercise tables
-        # only the association tables.
-        query = query.where(
-            models.Workout.exercises.any(
-                Exercise.equipment.any(Equipment.id.in_(equipment_one_of))
-            )
-        )
-    if fitness_coach_id is not None:
-        query = query.filter(models.Workout.fitness_coach_id == fitness_coach_id)
-    if name is not None:
-        # Not performant, we should add indexes but hard due to localization.
-        query = query.where(models.Workout.name.ilike(f"%{name}%"))
-    if age is not None:
-        query = query.where(
-            or_(models.Workout.min_age.is_(None), models.Workout.min_age <= age)
-        ).where(or_(models.Workout.max_age.is_(None), models.Workout.max_age >= age))
-    if fitness_plan_id is not None:
-        query = query.where(models.Workout.fitness_plans.any(id=fitness_plan_id))
-    if experience_levels is not None:
-        query = query.where(models.Workout.experience_level.in_(experience_levels))
-
-    # Only allow users to see workouts that are not in collection
-    exists_stmt = (
-        select(CollectionItemWorkout.id)
-        .where(CollectionItemWorkout.workout_id == models.Workout.id)
-        .exists()
+    options = options_for_embeds(embed)
+    saved_ids = (
+        await get_saved_workout_ids(primary_db, user.id) if user is not None else None
     )
-    if collection_id is not None:
-        query = query.where(
-            exists_stmt.where(CollectionItemWorkout.collection_id == collection_id)
-        )
-    else:
-        if fitness_coach is not None:
-            # Fitness coaches can only see their own workouts
-            query = query.where(models.Workout.fitness_coach_id == fitness_coach.id)
-        elif user is not None:
-            # Users can see public workouts and their own
-            query = query.where(
-                or_(
-                    models.Workout.user_id == user.id,
-                    models.Workout.is_released == true(),
-                )
-            )
-        elif not is_admin:
-            # Unauthenticated can only see released workouts
-            query = query.where(models.Workout.is_released == true())
-
-    workouts = await paginate(
-        db,
-        query,
-        transformer=functools.partial(
-            workout_models_to_schema,
+
+    async def transformer(items: Sequence[models.Workout]):
+        if saved_ids is not None:
+            set_is_saved(items, saved_ids)
+        await load_fitness_coach_counts(db, [w.fitness_coach for w in items])
+        return workout_models_to_schema(
+            items,
             is_admin=is_admin,
             is_fitness_coach=is_fitness_coach,
             storage_service=storage_service,
             fitness_coach_mapper=fitness_coach_mapper,
-        ),
-    )
+        )
+
+    shared_key = filters.shared_cache_key()
+    # Users also see the workouts they made themselves
+    if shared_key is not None and user is not None:
+        if await has_own_workouts(db, user.id):
+            shared_key = None
+
+    if shared_key is None:
+        workouts = await paginate(db, query.options(*options), transformer=transformer)
+    else:
+        workouts = await catalog_pages[CatalogItemType.workout].paginate(
+            db,
+            (shared_key, sort_by, sort_order),
+            query,
+            models.Workout,
+            options,
+            transformer,
+        )
 
     return ResponseModel(data=workouts)
 
@@ -421,6 +364,17 @@ async def update(
             )
         )
         workout.workout_exercises = workout_exercises
+        workout.duration_seconds = estimate_workout_duration(workout_exercises)
+        # The exercises are part of the workout's representation, bump it even
+        # if no column of the workout itself changed
+        workout.updated_at = datetime.now().astimezone()
+        await db.flush()
+        await refresh_workout_facets(db, models.Workout.id == workout.id)
+    if workout_update.is_released is not None and is_admin:
+        await db.flush()
+        await refresh_catalog_visibility(
+            db, CatalogItemType.workout, models.Workout.id == workout.id
+        )
 
     await db.commit()
 
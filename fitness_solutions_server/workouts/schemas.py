@@ -5,7 +5,7 @@ from pydantic import BaseModel, Field, validator
 
 from fitness_solutions_server.core.localization import TranslationDict
 from fitness_solutions_server.core.models import ExperienceLevel, Focus, Sex
-from fitness_solutions_server.core.schemas import TimestampMixin
+from fitness_solutions_server.core.schemas import FacetCount, TimestampMixin
 from fitness_solutions_server.exercises.schemas import Exercise
 from fitness_solutions_server.fitness_coaches.schemas import FitnessCoach
 from fitness_solutions_server.workouts.models import SetWeightType
@@ -123,3 +123,18 @@ class WorkoutPrivate(Workout):
     is_released: bool
     name_translations: TranslationDict
     description_translations: TranslationDict
+
+
+class WorkoutDurationFacetCount(BaseModel):
+    min_duration: int = Field(description="Lower bound (inclusive) in seconds")
+    max_duration: int | None = Field(description="Upper bound (inclusive) in seconds")
+    count: int
+
+
+class WorkoutFacets(BaseModel):
+    focus: list[FacetCount]
+    experience_level: list[FacetCount]
+    target_sex: list[FacetCount]
+    muscle_groups: list[FacetCount]
+    equipment: list[FacetCount]
+    duration: list[WorkoutDurationFacetCount]
@@ -1,12 +1,42 @@
+from datetime import datetime
+from typing import Any, Iterable, Sequence
 from uuid import UUID
 
-from sqlalchemy import literal, select
+from sqlalchemy import (
+    ColumnElement,
+    SQLColumnExpression,
+    Subquery,
+    Table,
+    Uuid,
+    case,
+    exists,
+    func,
+    literal,
+    select,
+    true,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.exc import InvalidRequestError
-from sqlalchemy.orm import selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import QueryableAttribute
 from sqlalchemy.orm.interfaces import ORMOption
 
-from fitness_solutions_server.exercises.utils import exercise_model_to_schema
+from fitness_solutions_server.core.embeds import EmbedPlanner
+from fitness_solutions_server.core.schemas import FacetCount
+from fitness_solutions_server.core.utils import count_facet_values
+from fitness_solutions_server.exercises.models import (
+    exercise_equipment,
+    exercise_muscle_groups,
+)
+from fitness_solutions_server.exercises.utils import (
+    exercise_model_to_schema,
+    exercises_updated_at,
+    plan_exercise,
+)
 from fitness_solutions_server.fitness_coaches.mapper import FitnessCoachMapper
+from fitness_solutions_server.fitness_coaches.utils import fitness_coach_updated_at
 from fitness_solutions_server.saved_workouts.models import user_saved_workouts
 from fitness_solutions_server.storage.base import StorageService
 
@@ -42,7 +72,7 @@ def workout_model_to_schema(
             order_id=workout.order_id,
             is_released=workout.is_released,
             name_translations=workout.name_translations,
-            description_translations=workout.description_translations
+            description_translations=workout.description_translations,
         )
 
     try:
@@ -71,7 +101,7 @@ def workout_model_to_schema(
 
 
 def workout_models_to_schema(
-    workouts: list[models.Workout],
+    workouts: Sequence[models.Workout],
     is_admin: bool,
     is_fitness_coach: bool,
     storage_service: StorageService,
@@ -89,27 +119,32 @@ def workout_models_to_schema(
     ]
 
 
-def options_for_embeds(
+def plan_workout_embeds(
+    planner: EmbedPlanner,
     embeds: set[schemas.WorkoutEmbedOption] | None,
-) -> list[ORMOption]:
-    options: list[ORMOption] = []
+    *path: QueryableAttribute[Any],
+) -> EmbedPlanner:
+    """
+    Adds the relationships needed for `embeds` of the workout at the end of
+    `path` to `planner`.
+    """
+    if embeds is None:
+        return planner
 
-    if embeds is not None:
-        if schemas.WorkoutEmbedOption.exercises in embeds:
-            options.append(
-                selectinload(models.Workout.workout_exercises).selectinload(
-                    models.WorkoutExercise.exercise
-                )
-            )
-            options.append(
-                selectinload(models.Workout.workout_exercises).selectinload(
-                    models.WorkoutExercise.sets
-                )
-            )
-        if schemas.WorkoutEmbedOption.fitness_coach in embeds:
-            options.append(selectinload(models.Workout.fitness_coach))
+    if schemas.WorkoutEmbedOption.exercises in embeds:
+        workout_exercises = (*path, models.Workout.workout_exercises)
+        plan_exercise(planner, *workout_exercises, models.WorkoutExercise.exercise)
+        planner.add(*workout_exercises, models.WorkoutExercise.sets)
+    if schemas.WorkoutEmbedOption.fitness_coach in embeds:
+        planner.add(*path, models.Workout.fitness_coach)
 
-    return options
+    return planner
+
+
+def options_for_embeds(
+    embeds: set[schemas.WorkoutEmbedOption] | None,
+) -> list[ORMOption]:
+    return plan_workout_embeds(EmbedPlanner(), embeds).options()
 
 
 def is_saved_expression(user_id: UUID):
@@ -120,3 +155,179 @@ def is_saved_expression(user_id: UUID):
         .where(user_saved_workouts.c.workout_id == models.Workout.id)
         .exists()
     )
+
+
+async def has_own_workouts(db: AsyncSession, user_id: UUID) -> bool:
+    return bool(
+        await db.scalar(
+            select(
+                exists()
+                .where(models.Workout.user_id == user_id)
+                .where(models.Workout.deleted_at.is_(None))
+            )
+        )
+    )
+
+
+def workout_version_query(
+    workout_id: UUID, embeds: set[schemas.WorkoutEmbedOption] | None
+):
+    """
+    Selects what the workout detail response depends on without hydrating
+    it: when it last changed (including the embedded fitness coach and
+    exercises) and the owner for access checks.
+    """
+    versions: list[SQLColumnExpression[datetime]] = [models.Workout.updated_at]
+    if embeds is not None and schemas.WorkoutEmbedOption.fitness_coach in embeds:
+        versions.append(fitness_coach_updated_at(models.Workout.fitness_coach_id))
+    if embeds is not None and schemas.WorkoutEmbedOption.exercises in embeds:
+        # Adding or removing workout exercises bumps the workout itself
+        versions.append(
+            exercises_updated_at(
+                select(models.WorkoutExercise.exercise_id).where(
+                    models.WorkoutExercise.workout_id == models.Workout.id
+                )
+                # Nested twice, so it does not correlate on its own
+                .correlate(models.Workout)
+            )
+        )
+
+    return select(
+        func.greatest(*versions).label("updated_at"),
+        models.Workout.fitness_coach_id,
+    ).where(models.Workout.id == workout_id)
+
+
+# Assumed time per repetition for sets without an explicit duration
+SECONDS_PER_REP = 3
+
+
+def estimate_workout_duration(
+    workout_exercises: Iterable[models.WorkoutExercise],
+) -> int:
+    """
+    Estimates how long a workout takes in seconds.
+
+    Timed sets count their duration, rep based sets `SECONDS_PER_REP` per rep,
+    and every set adds its break.
+    """
+    duration = 0
+    for workout_exercise in workout_exercises:
+        for s in workout_exercise.sets:
+            if s.duration is not None:
+                duration += s.duration
+            elif s.reps is not None:
+                duration += s.reps * SECONDS_PER_REP
+            duration += s.break_ or 0
+    return duration
+
+
+def _workout_facet_ids(association: Table, column: str):
+    return func.array(
+        select(association.c[column])
+        .distinct()
+        .join(
+            models.WorkoutExercise,
+            models.WorkoutExercise.exercise_id == association.c.exercise_id,
+        )
+        .where(models.WorkoutExercise.workout_id == models.Workout.id)
+        .scalar_subquery(),
+        type_=ARRAY(Uuid()),
+    )
+
+
+async def refresh_workout_facets(db: AsyncSession, *criteria: ColumnElement[bool]):
+    """
+    Recomputes `muscle_group_ids` and `equipment_ids` from the exercises of the
+    workouts matching `criteria`. Pending exercise changes must be flushed first.
+    """
+    await db.execute(
+        update(models.Workout)
+        .where(*criteria)
+        .values(
+            muscle_group_ids=_workout_facet_ids(
+                exercise_muscle_groups, "muscle_group_id"
+            ),
+            equipment_ids=_workout_facet_ids(exercise_equipment, "equipment_id"),
+            updated_at=models.Workout.updated_at,
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+# Inclusive (min_duration, max_duration) bounds in seconds
+DURATION_FACET_BUCKETS: list[tuple[int, int | None]] = [
+    (0, 15 * 60 - 1),
+    (15 * 60, 30 * 60 - 1),
+    (30 * 60, 45 * 60 - 1),
+    (45 * 60, None),
+]
+
+
+async def count_workout_facets(
+    db: AsyncSession, filtered: Subquery
+) -> schemas.WorkoutFacets:
+    """
+    Counts the workouts in `filtered` per facet value with a single query.
+    `filtered` must select the facet columns of `workouts`.
+    """
+    muscle_group_ids = (
+        func.unnest(filtered.c.muscle_group_ids)
+        .table_valued("value")
+        .render_derived()
+        .lateral()
+    )
+    equipment_ids = (
+        func.unnest(filtered.c.equipment_ids)
+        .table_valued("value")
+        .render_derived()
+        .lateral()
+    )
+    duration_bucket = case(
+        *[
+            (filtered.c.duration_seconds <= max_duration, idx)
+            for idx, (_, max_duration) in enumerate(DURATION_FACET_BUCKETS)
+            if max_duration is not None
+        ],
+        else_=len(DURATION_FACET_BUCKETS) - 1,
+    )
+
+    query = union_all(
+        count_facet_values("focus", filtered.c.focus),
+        count_facet_values("experience_level", filtered.c.experience_level),
+        count_facet_values("target_sex", filtered.c.target_sex),
+        count_facet_values("muscle_groups", muscle_group_ids.c.value)
+        .select_from(filtered)
+        .join(muscle_group_ids, true()),
+        count_facet_values("equipment", equipment_ids.c.value)
+        .select_from(filtered)
+        .join(equipment_ids, true()),
+        count_facet_values("duration", duration_bucket),
+    )
+
+    counts: dict[str, list[FacetCount]] = {
+        facet: []
+        for facet in (
+            "focus",
+            "experience_level",
+            "target_sex",
+            "muscle_groups",
+            "equipment",
+            "duration",
+        )
+    }
+    for facet, value, count in await db.execute(query):
+        counts[facet].append(FacetCount(value=value, count=count))
+
+    duration = {int(c.value): c.count for c in counts.pop("duration")}
+    return schemas.WorkoutFacets(
+        **counts,
+        duration=[
+            schemas.WorkoutDurationFacetCount(
+                min_duration=min_duration,
+                max_duration=max_duration,
+                count=duration.get(idx, 0),
+            )
+            for idx, (min_duration, max_duration) in enumerate(DURATION_FACET_BUCKETS)
+        ],
+    )
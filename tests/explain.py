@@ -0,0 +1,29 @@
+import re
+from typing import Any, Iterator
+
+from sqlalchemy import Engine
+
+
+def page_statement(statements: list[tuple[str, Any]], table: str) -> tuple[str, Any]:
+    """The page query of a list endpoint, as opposed to the token and embed lookups."""
+    pattern = re.compile(rf"^SELECT .*\bFROM {table}\b.*ORDER BY .*LIMIT", re.DOTALL)
+    return next((s, p) for s, p in statements if pattern.search(s))
+
+
+def explain(
+    database: Engine, statement: str, parameters: Any, *settings: str
+) -> list[dict[str, Any]]:
+    """Plans `statement` with the `SET LOCAL` `settings` and returns its nodes."""
+    with database.begin() as connection:
+        for setting in settings:
+            connection.exec_driver_sql(f"SET LOCAL {setting}")
+        plan = connection.exec_driver_sql(
+            f"EXPLAIN (FORMAT JSON) {statement}", parameters
+        ).scalar_one()
+    return [*plan_nodes(plan[0]["Plan"])]
+
+
+def plan_nodes(plan: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from plan_nodes(child)
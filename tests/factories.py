@@ -0,0 +1,213 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from fitness_solutions_server.admins.models import Admin, AdminAuthenticationToken
+from fitness_solutions_server.catalog.models import CatalogItemType
+from fitness_solutions_server.catalog.utils import refresh_catalog_visibility
+from fitness_solutions_server.core.models import ExperienceLevel, Sex
+from fitness_solutions_server.core.security import generate_authentication_token
+from fitness_solutions_server.countries.models import Country
+from fitness_solutions_server.equipment.models import Equipment
+from fitness_solutions_server.exercises.models import Exercise
+from fitness_solutions_server.fitness_coaches.models import (
+    FitnessCoach,
+    FitnessCoachAuthenticationToken,
+)
+from fitness_solutions_server.fitness_plans.models import (
+    FitnessPlan,
+    FitnessPlanWeek,
+    FitnessPlanWeekWorkout,
+)
+from fitness_solutions_server.muscle_groups.models import BodyPart, MuscleGroup
+from fitness_solutions_server.orders.models import Order, OrderType
+from fitness_solutions_server.users.models import User, UserAuthenticationToken
+from fitness_solutions_server.workouts.models import (
+    Workout,
+    WorkoutExercise,
+    WorkoutExerciseSet,
+)
+from fitness_solutions_server.workouts.utils import refresh_workout_facets
+
+
+def authorization(token: str) -> dict[str, str]:
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _expires_at() -> datetime:
+    return datetime.now().astimezone() + timedelta(days=1)
+
+
+async def create_country(db: AsyncSession) -> Country:
+    country = Country(name="Denmark", iso="DK")
+    db.add(country)
+    await db.commit()
+    return country
+
+
+async def create_user(db: AsyncSession, country: Country) -> tuple[User, str]:
+    """Creates a user and returns them together with a bearer token."""
+    user = User(
+        email=f"{datetime.now().timestamp()}@example.com",
+        password_hash="",
+        full_name="Test User",
+        country_id=country.id,
+        profile_image_path="",
+    )
+    token, hashed_token = generate_authentication_token()
+    db.add(user)
+    await db.flush()
+    db.add(
+        UserAuthenticationToken(
+            token=hashed_token, user_id=user.id, expires_at=_expires_at()
+        )
+    )
+    await db.commit()
+    return user, token
+
+
+async def create_admin(db: AsyncSession) -> tuple[Admin, str]:
+    admin = Admin(
+        full_name="Test Admin",
+        email=f"{datetime.now().timestamp()}@example.com",
+        password_hash="",
+    )
+    token, hashed_token = generate_authentication_token()
+    db.add(admin)
+    await db.flush()
+    db.add(
+        AdminAuthenticationToken(
+            token=hashed_token, admin_id=admin.id, expires_at=_expires_at()
+        )
+    )
+    await db.commit()
+    return admin, token
+
+
+async def create_fitness_coach(
+    db: AsyncSession, country: Country, is_released: bool = True
+) -> tuple[FitnessCoach, str]:
+    fitness_coach = FitnessCoach(
+        full_name="Test Coach",
+        email=f"{datetime.now().timestamp()}@example.com",
+        password_hash="",
+        title="Coach",
+        description="",
+        sex=Sex.female,
+        profile_image_path="",
+        is_released=is_released,
+        countries=[country],
+    )
+    token, hashed_token = generate_authentication_token()
+    db.add(fitness_coach)
+    await db.flush()
+    db.add(
+        FitnessCoachAuthenticationToken(
+            token=hashed_token,
+            fitness_coach_id=fitness_coach.id,
+            expires_at=_expires_at(),
+        )
+    )
+    await db.commit()
+    return fitness_coach, token
+
+
+async def create_exercise(db: AsyncSession) -> Exercise:
+    """Creates an exercise with two muscle groups and two pieces of equipment."""
+    exercise = Exercise(
+        name_translations={"en": "Squat"},
+        en_name="Squat",
+        is_bodyweight=False,
+        relative_bodyweight_intensity=0,
+        image_path="",
+        model_3d_path="",
+        muscle_groups=[
+            MuscleGroup(
+                name_translations={"en": name},
+                image_path="",
+                body_part=BodyPart.lower_body,
+            )
+            for name in ("Quads", "Glutes")
+        ],
+        equipment=[
+            Equipment(
+                name_translations={"en": name}, consecutive_terms=0, image_path=""
+            )
+            for name in ("Barbell", "Rack")
+        ],
+    )
+    db.add(exercise)
+    await db.commit()
+    return exercise
+
+
+async def create_workout(
+    db: AsyncSession, fitness_coach: FitnessCoach, exercises: list[Exercise]
+) -> Workout:
+    """Creates a released workout doing each exercise for two sets."""
+    workout = Workout(
+        name_translations={"en": "Legs"},
+        description_translations={"en": "Legs"},
+        experience_level=ExperienceLevel.beginner,
+        fitness_coach_id=fitness_coach.id,
+        is_released=True,
+        workout_exercises=[
+            WorkoutExercise(
+                exercise_id=exercise.id,
+                order=order,
+                sets=[
+                    WorkoutExerciseSet(reps=10, order=1),
+                    WorkoutExerciseSet(order=2),
+                ],
+            )
+            for order, exercise in enumerate(exercises, start=1)
+        ],
+    )
+    db.add(workout)
+    await db.flush()
+    await refresh_workout_facets(db, Workout.id == workout.id)
+    await refresh_catalog_visibility(
+        db, CatalogItemType.workout, Workout.id == workout.id
+    )
+    await db.commit()
+    return workout
+
+
+async def create_fitness_plan(
+    db: AsyncSession,
+    fitness_coach: FitnessCoach,
+    workouts: list[Workout],
+    is_released: bool = True,
+) -> FitnessPlan:
+    """Creates a fitness plan doing the workouts in its only week."""
+    order = Order(
+        type=OrderType.fitness_plan,
+        description="",
+        fitness_coach_id=fitness_coach.id,
+        amount=1,
+    )
+    fitness_plan = FitnessPlan(
+        name_translations={"en": "Legs"},
+        description_translations={"en": "Legs"},
+        experience_level=ExperienceLevel.beginner,
+        fitness_coach_id=fitness_coach.id,
+        order=order,
+        is_released=is_released,
+        number_of_workouts_per_week=len(workouts),
+        weeks=[
+            FitnessPlanWeek(
+                order=1,
+                workout_associations=[
+                    FitnessPlanWeekWorkout(workout_id=workout.id, order=order)
+                    for order, workout in enumerate(workouts, start=1)
+                ],
+            )
+        ],
+    )
+    db.add(fitness_plan)
+    await db.flush()
+    await refresh_catalog_visibility(
+        db, CatalogItemType.fitness_plan, FitnessPlan.id == fitness_plan.id
+    )
+    await db.commit()
+    return fitness_plan
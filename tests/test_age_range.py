@@ -0,0 +1,78 @@
+from typing import Any
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import Engine, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .explain import explain, page_statement
+from .factories import (
+    authorization,
+    create_admin,
+    create_country,
+    create_fitness_coach,
+    create_fitness_plan,
+)
+
+SEED_ROWS = 20_000
+
+
+async def seed(db: AsyncSession, table: str):
+    """
+    Inserts `SEED_ROWS` released items of one coach. Most target young
+    children, only a few fit the filters below.
+    """
+    fitness_coach, _ = await create_fitness_coach(db, await create_country(db))
+    columns = {
+        "id": "gen_random_uuid()",
+        "name_translations": '\'{"en": "Seed"}\'::jsonb',
+        "description_translations": '\'{"en": "Seed"}\'::jsonb',
+        "experience_level": "'beginner'::experiencelevel",
+        "is_released": "true",
+        "fitness_coach_id": f"'{fitness_coach.id}'::uuid",
+        "min_age": "CASE WHEN i % 1000 = 0 THEN 60 ELSE 1 END",
+        "max_age": "CASE WHEN i % 1000 = 0 THEN 70 ELSE 5 END",
+    }
+    if table == "fitness_plans":
+        order_id = (await create_fitness_plan(db, fitness_coach, [])).order_id
+        columns["order_id"] = f"'{order_id}'::uuid"
+        columns["number_of_workouts_per_week"] = "3"
+
+    await db.execute(
+        text(
+            f"INSERT INTO {table} ({', '.join(columns)})"
+            f" SELECT {', '.join(columns.values())}"
+            f" FROM generate_series(1, {SEED_ROWS}) AS i"
+        )
+    )
+    await db.commit()
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "path,table",
+    [("/v1/workouts", "workouts"), ("/v1/fitness-plans", "fitness_plans")],
+)
+@pytest.mark.parametrize("params", [{"age": 65}, {"min_age": 55, "max_age": 75}])
+async def test_age_filters_use_the_range_index(
+    client: AsyncClient,
+    db: AsyncSession,
+    database: Engine,
+    statements: list[tuple[str, Any]],
+    path: str,
+    table: str,
+    params: dict[str, int],
+):
+    await seed(db, table)
+    with database.connect() as connection:
+        connection.exec_driver_sql(f"ANALYZE {table}")
+    _, token = await create_admin(db)
+
+    response = await client.get(path, params=params, headers=authorization(token))
+    assert response.status_code == 200, response.text
+    assert len(response.json()["data"]["items"]) == 10
+
+    nodes = explain(database, *page_statement(statements, table))
+    assert any(
+        node.get("Index Name") == f"ix_{table}_age_range" for node in nodes
+    ), nodes
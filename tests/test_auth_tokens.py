@@ -0,0 +1,97 @@
+import asyncio
+import secrets
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import Any, cast
+from uuid import uuid4
+
+import pytest
+from fastapi.security import HTTPAuthorizationCredentials
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette_context import request_cycle_context
+
+from fitness_solutions_server.core.dependencies import (
+    PrincipalRole,
+    get_request_principal,
+    invalidate_token,
+    token_cache,
+)
+from fitness_solutions_server.core.security import (
+    generate_authentication_token,
+    security_token_to_code,
+)
+
+from .factories import authorization, create_country, create_user
+
+
+class BlockingSession:
+    """Answers the token lookup with `row` once `release` is set."""
+
+    def __init__(self, row: Any):
+        self.row = row
+        self.release = asyncio.Event()
+
+    async def execute(self, statement: Any) -> Any:
+        await self.release.wait()
+        return SimpleNamespace(first=lambda: self.row)
+
+    async def get(self, model: Any, id: Any) -> Any:
+        return SimpleNamespace(id=id)
+
+
+@pytest.mark.anyio
+async def test_lookups_started_before_a_revocation_are_not_cached():
+    token, hashed_token = generate_authentication_token()
+    session = BlockingSession(
+        SimpleNamespace(
+            role=PrincipalRole.user.value,
+            owner_id=uuid4(),
+            expires_at=datetime.now().astimezone() + timedelta(days=1),
+        )
+    )
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+    with request_cycle_context({}):
+        lookup = asyncio.create_task(
+            get_request_principal(credentials, None, None, cast(AsyncSession, session))
+        )
+        await asyncio.sleep(0)
+        invalidate_token(hashed_token)
+        session.release.set()
+        assert await lookup is not None
+
+    assert token_cache.get(hashed_token) is None
+
+
+@pytest.mark.anyio
+async def test_reset_password_revokes_tokens(client: AsyncClient, db: AsyncSession):
+    user, token = await create_user(db, await create_country(db))
+    verification_token = secrets.token_hex(32)
+    user.verification_code = security_token_to_code(verification_token)
+    await db.commit()
+
+    response = await client.get("/v1/users/me", headers=authorization(token))
+    assert response.status_code == 200, response.text
+
+    response = await client.post(
+        f"/v1/users/reset_password/{verification_token}",
+        params={"new_password": "password"},
+    )
+    assert response.status_code == 200, response.text
+
+    response = await client.get("/v1/users/me", headers=authorization(token))
+    assert response.status_code == 401, response.text
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("verification_token", [secrets.token_hex(32), "invalid"])
+async def test_reset_password_rejects_unknown_codes(
+    client: AsyncClient, db: AsyncSession, verification_token: str
+):
+    response = await client.post(
+        f"/v1/users/reset_password/{verification_token}",
+        params={"new_password": "password"},
+    )
+    assert response.status_code == 400, response.text
+    assert response.json()["error"]["code"] == "user_invalid_verification_code"
@@ -0,0 +1,283 @@
+from decimal import Decimal
+from itertools import combinations
+from typing import Any, Iterable
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette_context import request_cycle_context
+
+from fitness_solutions_server.collections.models import (
+    Collection,
+    CollectionItemFitnessCoach,
+    CollectionItemFitnessPlan,
+    CollectionItemProduct,
+    CollectionItemWorkout,
+)
+from fitness_solutions_server.core.embeds import EmbedPlanner
+from fitness_solutions_server.currencies.models import Currency
+from fitness_solutions_server.exercises.models import Exercise
+from fitness_solutions_server.fitness_coaches.models import FitnessCoach
+from fitness_solutions_server.fitness_plans import schemas as fitness_plan_schemas
+from fitness_solutions_server.fitness_plans.models import FitnessPlan
+from fitness_solutions_server.fitness_plans.utils import (
+    options_for_embeds as fitness_plan_options,
+)
+from fitness_solutions_server.pr_observations.models import PRObservation
+from fitness_solutions_server.products.models import Product
+from fitness_solutions_server.workouts import schemas as workout_schemas
+from fitness_solutions_server.workouts.models import Workout, WorkoutExercise
+from fitness_solutions_server.workouts.utils import (
+    options_for_embeds as workout_options,
+)
+
+from .factories import (
+    authorization,
+    create_country,
+    create_exercise,
+    create_fitness_coach,
+    create_fitness_plan,
+    create_user,
+    create_workout,
+)
+
+
+def loader_paths(options: Iterable[Any]) -> list[tuple[str, ...]]:
+    """The relationship path and strategy of every loader in `options`."""
+    paths = []
+    for option in options:
+        for element in option.context:
+            assert element.strategy == (("lazy", "selectin"),)
+            paths.append(tuple(str(r) for r in element.path.natural_path[1::2]))
+    return paths
+
+
+def subsets(values: Iterable[Any]) -> list[set[Any]]:
+    values = [*values]
+    return [
+        {*subset}
+        for size in range(len(values) + 1)
+        for subset in combinations(values, size)
+    ]
+
+
+def embeds_id(embeds: set[Any]) -> str:
+    return "+".join(sorted(e.value for e in embeds)) or "none"
+
+
+def test_paths_sharing_a_prefix_are_merged():
+    planner = EmbedPlanner()
+    planner.add(Workout.workout_exercises, WorkoutExercise.exercise)
+    planner.add(Workout.workout_exercises, WorkoutExercise.sets)
+    planner.add(Workout.workout_exercises, WorkoutExercise.exercise)
+
+    options = planner.options()
+
+    assert len(options) == 1
+    assert loader_paths(options) == [
+        ("Workout.workout_exercises",),
+        ("Workout.workout_exercises", "WorkoutExercise.exercise"),
+        ("Workout.workout_exercises", "WorkoutExercise.sets"),
+    ]
+
+
+def test_workout_embeds_load_every_relationship_once():
+    paths = loader_paths(workout_options({*workout_schemas.WorkoutEmbedOption}))
+
+    assert sorted(paths) == sorted(
+        [
+            ("Workout.workout_exercises",),
+            ("Workout.workout_exercises", "WorkoutExercise.exercise"),
+            (
+                "Workout.workout_exercises",
+                "WorkoutExercise.exercise",
+                "Exercise.muscle_groups",
+            ),
+            (
+                "Workout.workout_exercises",
+                "WorkoutExercise.exercise",
+                "Exercise.equipment",
+            ),
+            ("Workout.workout_exercises", "WorkoutExercise.sets"),
+            ("Workout.fitness_coach",),
+        ]
+    )
+
+
+def test_no_embeds_load_nothing():
+    assert workout_options(None) == []
+    assert fitness_plan_options(None) == []
+
+
+# Statements per embed, independent of how many rows are on the page
+WORKOUT_EMBED_STATEMENTS = {
+    # workout_exercises, exercise, muscle_groups, equipment and sets
+    workout_schemas.WorkoutEmbedOption.exercises: 5,
+    workout_schemas.WorkoutEmbedOption.fitness_coach: 1,
+}
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "embeds", subsets(workout_schemas.WorkoutEmbedOption), ids=embeds_id
+)
+async def test_workout_embeds_statement_count(
+    db: AsyncSession,
+    statements: list[tuple[str, Any]],
+    embeds: set[workout_schemas.WorkoutEmbedOption],
+):
+    country = await create_country(db)
+    fitness_coach, _ = await create_fitness_coach(db, country)
+    exercises = [await create_exercise(db), await create_exercise(db)]
+    for _ in range(3):
+        await create_workout(db, fitness_coach, exercises)
+    db.expunge_all()
+    statements.clear()
+
+    # Muscle groups are ordered by their name in the request's language
+    with request_cycle_context({}):
+        workouts = (
+            await db.scalars(select(Workout).options(*workout_options(embeds)))
+        ).all()
+
+    assert len(workouts) == 3
+    assert len(statements) == 1 + sum(WORKOUT_EMBED_STATEMENTS[e] for e in embeds)
+    if workout_schemas.WorkoutEmbedOption.exercises in embeds:
+        exercise: Exercise = workouts[0].workout_exercises[0].exercise
+        assert len(exercise.muscle_groups) == 2
+        assert len(exercise.equipment) == 2
+        assert len(workouts[0].workout_exercises[0].sets) == 2
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "embeds", subsets(fitness_plan_schemas.FitnessPlanEmbed), ids=embeds_id
+)
+async def test_fitness_plan_embeds_statement_count(
+    db: AsyncSession,
+    statements: list[tuple[str, Any]],
+    embeds: set[fitness_plan_schemas.FitnessPlanEmbed],
+):
+    country = await create_country(db)
+    fitness_coach, _ = await create_fitness_coach(db, country)
+    workout = await create_workout(db, fitness_coach, [await create_exercise(db)])
+    for _ in range(3):
+        await create_fitness_plan(db, fitness_coach, [workout])
+    db.expunge_all()
+    statements.clear()
+
+    with request_cycle_context({}):
+        fitness_plans = (
+            await db.scalars(select(FitnessPlan).options(*fitness_plan_options(embeds)))
+        ).all()
+
+    assert len(fitness_plans) == 3
+    # Every embed is a single relationship
+    assert len(statements) == 1 + len(embeds)
+
+
+async def add_collection_items(
+    db: AsyncSession, collection: Collection, fitness_coach: FitnessCoach
+):
+    """Adds one item of every type to `collection`."""
+    workout = await create_workout(db, fitness_coach, [await create_exercise(db)])
+    fitness_plan = await create_fitness_plan(db, fitness_coach, [workout])
+    product = Product(
+        name_translations={"en": "Band"},
+        description_translations={"en": "Band"},
+        brand_translations={"en": "Brand"},
+        image_path="",
+        price=Decimal("10"),
+        url="https://example.com",
+        currency_code="DKK",
+    )
+    db.add(product)
+    await db.flush()
+    db.add_all(
+        [
+            CollectionItemWorkout(collection_id=collection.id, workout_id=workout.id),
+            CollectionItemFitnessPlan(
+                collection_id=collection.id, fitness_plan_id=fitness_plan.id
+            ),
+            CollectionItemFitnessCoach(
+                collection_id=collection.id, fitness_coach_id=fitness_coach.id
+            ),
+            CollectionItemProduct(collection_id=collection.id, product_id=product.id),
+        ]
+    )
+    await db.commit()
+
+
+@pytest.mark.anyio
+async def test_collection_item_embeds_statement_count(
+    client: AsyncClient, db: AsyncSession, statements: list[tuple[str, Any]]
+):
+    country = await create_country(db)
+    db.add(Currency(code="DKK", name="Danish krone"))
+    collection = Collection(
+        title_translations={"en": "Start"},
+        subtitle_translations={"en": "Start"},
+        cover_image_path="",
+        is_released=True,
+    )
+    db.add(collection)
+    await db.commit()
+
+    async def list_items() -> int:
+        statements.clear()
+        response = await client.get(
+            f"/v1/collections/{collection.id}/items", params={"embed": "item"}
+        )
+        assert response.status_code == 200, response.text
+        for item in response.json()["data"]["items"]:
+            # Embedded under the name of the item's type
+            assert item[item["type"]] is not None
+        return len(statements)
+
+    fitness_coach, _ = await create_fitness_coach(db, country)
+    await add_collection_items(db, collection, fitness_coach)
+    one_of_each = await list_items()
+
+    for _ in range(2):
+        fitness_coach, _ = await create_fitness_coach(db, country)
+        await add_collection_items(db, collection, fitness_coach)
+    assert await list_items() == one_of_each
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("latest_per_exercise", [False, True])
+async def test_pr_observation_embeds_statement_count(
+    client: AsyncClient,
+    db: AsyncSession,
+    statements: list[tuple[str, Any]],
+    latest_per_exercise: bool,
+):
+    user, token = await create_user(db, await create_country(db))
+    exercises = [await create_exercise(db) for _ in range(3)]
+
+    async def list_observations() -> int:
+        params: dict[str, Any] = {"embed": "exercise"}
+        if latest_per_exercise:
+            params["exercise_ids"] = [str(e.id) for e in exercises]
+        statements.clear()
+        response = await client.get(
+            "/v1/pr-observations", params=params, headers=authorization(token)
+        )
+        assert response.status_code == 200, response.text
+        for observation in response.json()["data"]["items"]:
+            assert observation["exercise"] is not None
+        return len(statements)
+
+    db.add(PRObservation(exercise_id=exercises[0].id, user_id=user.id, weight=100))
+    await db.commit()
+    # Caches the token, so both counts skip its lookup
+    await list_observations()
+    one = await list_observations()
+
+    db.add_all(
+        PRObservation(exercise_id=exercise.id, user_id=user.id, weight=100)
+        for exercise in exercises[1:]
+    )
+    await db.commit()
+    assert await list_observations() == one
@@ -0,0 +1,47 @@
+from typing import Iterator
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from fitness_solutions_server.exercises.utils import exercises_cache
+
+from .factories import create_exercise
+
+
+@pytest.fixture(autouse=True)
+def clear_exercises_cache() -> Iterator[None]:
+    # The cache outlives the truncated tables
+    exercises_cache.clear()
+    yield
+    exercises_cache.clear()
+
+
+@pytest.mark.anyio
+async def test_list_is_cached(client: AsyncClient, db: AsyncSession):
+    exercise = await create_exercise(db)
+
+    response = await client.get("/v1/exercises")
+    assert response.status_code == 200, response.text
+    [item] = response.json()["data"]["items"]
+    assert item["id"] == str(exercise.id)
+    assert len(item["muscle_groups"]) == 2
+
+    cached = await client.get(
+        "/v1/exercises", headers={"If-None-Match": response.headers["ETag"]}
+    )
+    assert cached.status_code == 304
+
+
+@pytest.mark.anyio
+async def test_filtered_list_is_not_cached(client: AsyncClient, db: AsyncSession):
+    exercise = await create_exercise(db)
+
+    response = await client.get(
+        "/v1/exercises",
+        params={"muscle_groups_one_of": str(exercise.muscle_groups[0].id)},
+    )
+    assert response.status_code == 200, response.text
+    [item] = response.json()["data"]["items"]
+    assert item["id"] == str(exercise.id)
+    assert "ETag" not in response.headers
@@ -0,0 +1,46 @@
+from typing import Any
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .factories import (
+    authorization,
+    create_country,
+    create_exercise,
+    create_fitness_coach,
+    create_fitness_plan,
+    create_user,
+    create_workout,
+)
+
+
+def counts(facet: list[dict[str, Any]]) -> dict[str, int]:
+    return {count["value"]: count["count"] for count in facet}
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("path", ["/v1/workouts/facets", "/v1/fitness-plans/facets"])
+@pytest.mark.parametrize("with_user", [False, True])
+async def test_facets(
+    client: AsyncClient, db: AsyncSession, path: str, with_user: bool
+):
+    country = await create_country(db)
+    fitness_coach, _ = await create_fitness_coach(db, country)
+    exercise = await create_exercise(db)
+    workouts = [await create_workout(db, fitness_coach, [exercise]) for _ in range(2)]
+    for workout in workouts:
+        await create_fitness_plan(db, fitness_coach, [workout])
+    _, token = await create_user(db, country)
+
+    response = await client.get(path, headers=authorization(token) if with_user else {})
+    assert response.status_code == 200, response.text
+
+    facets = response.json()["data"]
+    assert counts(facets["experience_level"]) == {"beginner": 2}
+    assert counts(facets["muscle_groups"]) == {
+        str(muscle_group.id): 2 for muscle_group in exercise.muscle_groups
+    }
+    assert counts(facets["equipment"]) == {
+        str(equipment.id): 2 for equipment in exercise.equipment
+    }
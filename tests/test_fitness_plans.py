@@ -0,0 +1,64 @@
+from uuid import uuid4
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .factories import (
+    authorization,
+    create_country,
+    create_exercise,
+    create_fitness_coach,
+    create_fitness_plan,
+    create_workout,
+)
+
+
+@pytest.mark.anyio
+async def test_week_changes_change_the_etag(client: AsyncClient, db: AsyncSession):
+    fitness_coach, token = await create_fitness_coach(db, await create_country(db))
+    workout = await create_workout(db, fitness_coach, [await create_exercise(db)])
+    fitness_plan = await create_fitness_plan(
+        db, fitness_coach, [workout], is_released=False
+    )
+    headers = authorization(token)
+    path = f"/v1/fitness-plans/{fitness_plan.id}"
+
+    async def etag() -> str:
+        response = await client.get(path, headers=headers)
+        assert response.status_code == 200, response.text
+        return response.headers["ETag"]
+
+    etags = [await etag()]
+
+    response = await client.post(f"{path}/weeks", headers=headers)
+    assert response.status_code == 200, response.text
+    week_id = response.json()["data"]["id"]
+    etags.append(await etag())
+
+    response = await client.post(
+        f"{path}/weeks/{week_id}/workouts",
+        json={"workout_id": str(workout.id)},
+        headers=headers,
+    )
+    assert response.status_code == 200, response.text
+    week_workout_id = response.json()["data"]["id"]
+    etags.append(await etag())
+
+    response = await client.delete(
+        f"{path}/weeks/{week_id}/workouts/{week_workout_id}", headers=headers
+    )
+    assert response.status_code == 200, response.text
+    etags.append(await etag())
+
+    response = await client.delete(f"{path}/weeks/{week_id}", headers=headers)
+    assert response.status_code == 200, response.text
+    etags.append(await etag())
+
+    assert len(set(etags)) == len(etags)
+
+
+@pytest.mark.anyio
+async def test_get_unknown_fitness_plan(client: AsyncClient, db: AsyncSession):
+    response = await client.get(f"/v1/fitness-plans/{uuid4()}")
+    assert response.status_code == 404
@@ -0,0 +1,37 @@
+from typing import Iterator
+
+import pytest
+from sqlalchemy import Engine, create_engine, text
+from sqlalchemy.exc import DataError
+
+from fitness_solutions_server.core.instrumentation import (
+    RequestQueryStats,
+    _request_query_stats,
+    instrument_engine,
+)
+
+
+@pytest.fixture
+def engine(database: Engine) -> Iterator[Engine]:
+    engine = create_engine(database.url)
+    instrument_engine(engine)
+    yield engine
+    engine.dispose()
+
+
+def test_failed_statements_are_counted_and_leave_no_start_time(engine: Engine):
+    stats = RequestQueryStats(track_statements=True)
+    token = _request_query_stats.set(stats)
+    try:
+        with engine.connect() as connection:
+            with pytest.raises(DataError):
+                connection.execute(text("SELECT 1 / 0"))
+            connection.rollback()
+            connection.execute(text("SELECT 1"))
+
+            assert connection.info["query_start_time"] == {}
+    finally:
+        _request_query_stats.reset(token)
+
+    assert stats.count == 2
+    assert stats.statements == {"SELECT 1 / 0": 1, "SELECT 1": 1}
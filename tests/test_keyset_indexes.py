@@ -0,0 +1,163 @@
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import Engine, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from fitness_solutions_server.collections.models import Collection
+from fitness_solutions_server.fitness_plans.dependencies import FitnessPlanListFilters
+from fitness_solutions_server.fitness_plans.models import FitnessPlan
+from fitness_solutions_server.users.models import User
+from fitness_solutions_server.workouts.dependencies import WorkoutListFilters
+from fitness_solutions_server.workouts.models import Workout
+
+from .explain import explain, page_statement
+from .factories import (
+    authorization,
+    create_admin,
+    create_country,
+    create_fitness_coach,
+    create_user,
+)
+
+
+def compile(query) -> str:
+    return str(query.compile(dialect=postgresql.dialect()))
+
+
+def index_predicate(model, name: str) -> str:
+    index = next(i for i in model.__table__.indexes if i.name == name)
+    return str(index.dialect_options["postgresql"]["where"])
+
+
+@pytest.mark.parametrize("with_user", [False, True])
+def test_workout_filters_imply_keyset_index_predicate(with_user: bool):
+    user = User(id=uuid4(), country_id=uuid4()) if with_user else None
+    filters = WorkoutListFilters(is_admin=False, user=user, fitness_coach=None)
+
+    assert index_predicate(Workout, "ix_workouts_created_at_id") == (
+        "deleted_at IS NULL"
+    )
+    assert "workouts.deleted_at IS NULL" in compile(filters.apply(select(Workout)))
+
+
+@pytest.mark.parametrize("with_user", [False, True])
+def test_fitness_plan_filters_imply_keyset_index_predicate(with_user: bool):
+    user = User(id=uuid4(), country_id=uuid4()) if with_user else None
+    filters = FitnessPlanListFilters(is_admin=False, user=user, fitness_coach=None)
+
+    assert index_predicate(FitnessPlan, "ix_fitness_plans_created_at_id") == (
+        "is_released"
+    )
+    assert "fitness_plans.is_released = true" in compile(
+        filters.apply(select(FitnessPlan))
+    )
+
+
+LIST_QUERIES = [
+    ("/v1/workouts", {}, None, "workouts", "ix_workouts_created_at_id"),
+    ("/v1/workouts", {}, "user", "workouts", "ix_workouts_created_at_id"),
+    (
+        "/v1/workouts",
+        {"sort_by": "completed_count"},
+        "user",
+        "workouts",
+        "ix_workouts_completed_count_id",
+    ),
+    ("/v1/fitness-plans", {}, None, "fitness_plans", "ix_fitness_plans_created_at_id"),
+    (
+        "/v1/fitness-plans",
+        {},
+        "user",
+        "fitness_plans",
+        "ix_fitness_plans_created_at_id",
+    ),
+    (
+        "/v1/fitness-coaches",
+        {},
+        None,
+        "fitness_coaches",
+        "ix_fitness_coaches_full_name_id",
+    ),
+    ("/v1/collections", {}, None, "collections", "ix_collections_created_at_id"),
+    (
+        "/v1/collections/{collection_id}/items",
+        {},
+        None,
+        "collection_items",
+        "ix_collection_items_collection_id_created_at_id",
+    ),
+    ("/v1/orders", {}, "admin", "orders", "ix_orders_created_at_id"),
+    (
+        "/v1/orders",
+        {},
+        "fitness_coach",
+        "orders",
+        "ix_orders_fitness_coach_id_created_at_id",
+    ),
+    (
+        "/v1/pr-observations",
+        {},
+        "user",
+        "pr_observations",
+        "ix_pr_observations_user_id_created_at_id",
+    ),
+    ("/v1/products", {}, "admin", "products", "ix_products_created_at_id"),
+]
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("path,params,principal,table,index", LIST_QUERIES)
+async def test_list_query_walks_keyset_index(
+    client: AsyncClient,
+    db: AsyncSession,
+    database: Engine,
+    statements: list[tuple[str, Any]],
+    path: str,
+    params: dict[str, str],
+    principal: str | None,
+    table: str,
+    index: str,
+):
+    country = await create_country(db)
+    collection = Collection(
+        title_translations={"en": "Test"},
+        subtitle_translations={"en": "Test"},
+        cover_image_path="",
+        is_released=True,
+    )
+    db.add(collection)
+    await db.commit()
+    tokens = {
+        "user": (await create_user(db, country))[1],
+        "admin": (await create_admin(db))[1],
+        "fitness_coach": (await create_fitness_coach(db, country))[1],
+    }
+
+    response = await client.get(
+        path.format(collection_id=collection.id),
+        params=params,
+        headers=authorization(tokens[principal]) if principal is not None else {},
+    )
+    assert response.status_code == 200, response.text
+
+    statement, parameters = page_statement(statements, table)
+    # The tables are empty, so make the planner show what it would do with real
+    # data instead of scanning and sorting everything
+    nodes = explain(
+        database,
+        statement,
+        parameters,
+        "enable_seqscan = off",
+        "enable_sort = off",
+    )
+
+    assert any(
+        node.get("Index Name") == index
+        and node["Node Type"] in ("Index Scan", "Index Only Scan")
+        for node in nodes
+    ), nodes
+    assert not any("Sort" in node["Node Type"] for node in nodes), nodes
@@ -0,0 +1,35 @@
+from typing import Any, Sequence
+from uuid import UUID
+
+import pytest
+from fastapi_pagination.api import set_page, set_params
+from fastapi_pagination.cursor import CursorParams
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from fitness_solutions_server.core.page_cache import PageCache
+from fitness_solutions_server.core.utils import CursorPage
+from fitness_solutions_server.countries.models import Country
+
+from .factories import create_country
+
+
+async def names(countries: Sequence[Any]) -> list[str]:
+    return [country.name for country in countries]
+
+
+@pytest.mark.anyio
+async def test_pages_hold_ids(db: AsyncSession):
+    country = await create_country(db)
+    cache = PageCache()
+    query = select(Country).order_by(Country.id)
+
+    with set_page(CursorPage), set_params(CursorParams(size=10)):
+        page = await cache.paginate(db, "countries", query, Country, [], names)
+        cached = await cache.get_or_load(
+            ("countries", None, 10), lambda: pytest.fail("page was not cached")
+        )
+
+    assert page.items == [country.name]
+    assert cached.items == [country.id]
+    assert all(type(id) is UUID for id in cached.items)
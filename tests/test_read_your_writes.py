@@ -0,0 +1,51 @@
+import time
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from fitness_solutions_server.core import database
+
+from .factories import (
+    authorization,
+    create_country,
+    create_exercise,
+    create_fitness_coach,
+    create_user,
+    create_workout,
+)
+
+
+@pytest.mark.anyio
+async def test_writes_pin_reads_on_other_workers(
+    client: AsyncClient, db: AsyncSession, monkeypatch: pytest.MonkeyPatch
+):
+    country = await create_country(db)
+    fitness_coach, _ = await create_fitness_coach(db, country)
+    workout = await create_workout(db, fitness_coach, [await create_exercise(db)])
+    user, token = await create_user(db, country)
+
+    response = await client.put(
+        f"/v1/saved-workouts/{workout.id}", headers=authorization(token)
+    )
+    assert response.status_code == 200, response.text
+    last_write_at = response.cookies[database.LAST_WRITE_COOKIE]
+
+    # Another worker has not seen the write
+    database.recent_writers.clear()
+    replica = object()
+    monkeypatch.setattr(database, "read_session_maker", replica)
+    assert database.get_read_session_maker(user.id) is replica
+    assert (
+        database.get_read_session_maker(user.id, last_write_at)
+        is database.session_maker
+    )
+
+
+@pytest.mark.parametrize("age,pinned", [(0, True), (60, False), (-60, False)])
+def test_only_recent_write_times_pin_reads(age: float, pinned: bool):
+    assert database.wrote_recently(str(time.time() - age)) is pinned
+
+
+def test_invalid_write_times_do_not_pin_reads():
+    assert not database.wrote_recently("invalid")
@@ -0,0 +1,79 @@
+import asyncio
+from typing import Any, cast
+from uuid import uuid4
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from fitness_solutions_server.core.saved_items import SavedItemIdsCache
+from fitness_solutions_server.saved_workouts.models import user_saved_workouts
+
+from .factories import (
+    authorization,
+    create_country,
+    create_exercise,
+    create_fitness_coach,
+    create_user,
+    create_workout,
+)
+
+
+class BlockingSession:
+    """Answers `scalars` with `ids` once `release` is set."""
+
+    def __init__(self, ids: list[Any]):
+        self.ids = ids
+        self.release = asyncio.Event()
+
+    async def scalars(self, statement: Any) -> list[Any]:
+        await self.release.wait()
+        return self.ids
+
+
+@pytest.mark.anyio
+async def test_loads_started_before_an_invalidation_are_not_stored():
+    cache = SavedItemIdsCache(
+        user_saved_workouts.c.user_id, user_saved_workouts.c.workout_id
+    )
+    user_id, stale_id, fresh_id = uuid4(), uuid4(), uuid4()
+
+    stale = BlockingSession([stale_id])
+    loading = asyncio.create_task(cache.get(cast(AsyncSession, stale), user_id))
+    await asyncio.sleep(0)
+    cache.invalidate(user_id)
+    stale.release.set()
+    assert await loading == {stale_id}
+
+    fresh = BlockingSession([fresh_id])
+    fresh.release.set()
+    assert await cache.get(cast(AsyncSession, fresh), user_id) == {fresh_id}
+    # Stored this time
+    assert await cache.get(cast(AsyncSession, stale), user_id) == {fresh_id}
+
+
+@pytest.mark.anyio
+async def test_saving_a_workout_shows_in_the_list(
+    client: AsyncClient, db: AsyncSession
+):
+    country = await create_country(db)
+    fitness_coach, _ = await create_fitness_coach(db, country)
+    workout = await create_workout(db, fitness_coach, [await create_exercise(db)])
+    _, token = await create_user(db, country)
+    headers = authorization(token)
+
+    async def is_saved() -> bool:
+        response = await client.get("/v1/workouts", headers=headers)
+        assert response.status_code == 200, response.text
+        [item] = response.json()["data"]["items"]
+        return item["is_saved"]
+
+    assert not await is_saved()
+
+    response = await client.put(f"/v1/saved-workouts/{workout.id}", headers=headers)
+    assert response.status_code == 200, response.text
+    assert await is_saved()
+
+    response = await client.delete(f"/v1/saved-workouts/{workout.id}", headers=headers)
+    assert response.status_code == 200, response.text
+    assert not await is_saved()
@@ -0,0 +1,60 @@
+import asyncio
+import time
+from typing import Iterator
+
+import pytest
+
+from fitness_solutions_server.core import security
+from fitness_solutions_server.core.config import settings
+from fitness_solutions_server.core.exceptions import PasswordHasherBusyException
+
+from .timing import max_event_loop_lag
+
+CONCURRENT_LOGINS = 16
+MAX_EVENT_LOOP_LAG = 0.1
+
+
+@pytest.fixture(autouse=True)
+def password_executor() -> Iterator[None]:
+    yield
+    security.shutdown_password_executor()
+
+
+@pytest.mark.anyio
+async def test_concurrent_logins_keep_the_event_loop_responsive():
+    hashed_password = security.hash_password("password")
+    # Start the workers, so their startup is not measured
+    await security.verify_password_async("password", hashed_password)
+
+    done = asyncio.Event()
+    lag = asyncio.create_task(max_event_loop_lag(done))
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *(
+            security.verify_password_async("password", hashed_password)
+            for _ in range(CONCURRENT_LOGINS)
+        )
+    )
+    elapsed = time.perf_counter() - start
+    done.set()
+
+    assert all(verified for verified, _ in results)
+    print(
+        f"{CONCURRENT_LOGINS} logins with {settings.PASSWORD_HASH_WORKERS} workers"
+        f" in {elapsed:.2f}s, max event loop lag {await lag * 1000:.1f}ms"
+    )
+    assert await lag < MAX_EVENT_LOOP_LAG
+
+
+@pytest.mark.anyio
+async def test_rejects_jobs_past_the_pending_limit(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, "PASSWORD_HASH_MAX_PENDING", 1)
+
+    results = await asyncio.gather(
+        security.hash_password_async("password"),
+        security.hash_password_async("password"),
+        return_exceptions=True,
+    )
+
+    assert isinstance(results[0], str)
+    assert isinstance(results[1], PasswordHasherBusyException)
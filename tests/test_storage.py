@@ -0,0 +1,64 @@
+import asyncio
+import time
+from typing import Callable
+
+import google.auth
+import pytest
+from google.auth.credentials import AnonymousCredentials
+
+from fitness_solutions_server.storage.gcp import GoogleCloudStorageService
+
+from .timing import max_event_loop_lag
+
+REQUESTS = 200
+
+
+@pytest.fixture(autouse=True)
+def anonymous_credentials(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(
+        google.auth, "default", lambda scopes: (AnonymousCredentials(), "test")
+    )
+
+
+def create_service() -> GoogleCloudStorageService:
+    return GoogleCloudStorageService(project_id="test", bucket_name="test")
+
+
+def per_request(link: Callable[[], str]) -> float:
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        link()
+    return (time.perf_counter() - start) / REQUESTS
+
+
+@pytest.mark.anyio
+async def test_a_shared_service_cuts_the_per_request_overhead():
+    shared = create_service()
+    try:
+        # What every request that links an image used to pay for
+        per_request_service = per_request(lambda: create_service().link("image"))
+        shared_service = per_request(lambda: shared.link("image"))
+    finally:
+        await shared.close()
+
+    print(
+        f"per request service {per_request_service * 1e6:.0f}us,"
+        f" shared service {shared_service * 1e6:.0f}us"
+    )
+    assert shared_service * 10 < per_request_service
+
+
+@pytest.mark.anyio
+async def test_close_waits_for_uploads_without_blocking_the_event_loop():
+    service = create_service()
+    upload = service.executor.submit(time.sleep, 0.5)
+
+    done = asyncio.Event()
+    lag = asyncio.create_task(max_event_loop_lag(done))
+    # Let the timer start before closing
+    await asyncio.sleep(0)
+    await service.close()
+    done.set()
+
+    assert upload.done()
+    assert await lag < 0.1
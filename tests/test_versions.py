@@ -0,0 +1,49 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .factories import (
+    authorization,
+    create_admin,
+    create_country,
+    create_exercise,
+    create_fitness_coach,
+    create_fitness_plan,
+    create_workout,
+)
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "item,embed", [("workout", "exercises"), ("fitness_plan", "equipment")]
+)
+async def test_exercise_changes_change_the_etag(
+    client: AsyncClient, db: AsyncSession, item: str, embed: str
+):
+    fitness_coach, _ = await create_fitness_coach(db, await create_country(db))
+    exercise = await create_exercise(db)
+    workout = await create_workout(db, fitness_coach, [exercise])
+    fitness_plan = await create_fitness_plan(db, fitness_coach, [workout])
+    _, token = await create_admin(db)
+    headers = authorization(token)
+    path = {
+        "workout": f"/v1/workouts/{workout.id}",
+        "fitness_plan": f"/v1/fitness-plans/{fitness_plan.id}",
+    }[item]
+
+    response = await client.get(path, params={"embed": embed}, headers=headers)
+    assert response.status_code == 200, response.text
+    etag = response.headers["ETag"]
+
+    response = await client.patch(
+        f"/v1/exercises/{exercise.id}",
+        json={"equipment_ids": [str(exercise.equipment[0].id)]},
+        headers=headers,
+    )
+    assert response.status_code == 200, response.text
+
+    response = await client.get(
+        path, params={"embed": embed}, headers={**headers, "If-None-Match": etag}
+    )
+    assert response.status_code == 200, response.text
+    assert response.headers["ETag"] != etag
@@ -0,0 +1,12 @@
+import asyncio
+import time
+
+
+async def max_event_loop_lag(done: asyncio.Event, interval: float = 0.01) -> float:
+    """How late a timer that fires every `interval` ran at most until `done`."""
+    lag = 0.0
+    while not done.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lag = max(lag, time.perf_counter() - start - interval)
+    return lag